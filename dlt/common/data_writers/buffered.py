@@ -63,6 +63,8 @@ class BufferedDataWriter(Generic[TWriter]):
         )
 
         self._current_columns: TTableSchemaColumns = None
+        # columns instance passed on last write, used to skip copying the same columns
+        self._last_columns: TTableSchemaColumns = None
         self._file_name: str = None
         self._buffered_items: List[TDataItem] = []
         self._buffered_items_count: int = 0
@@ -91,8 +93,12 @@ class BufferedDataWriter(Generic[TWriter]):
             assert len(columns) > len(self._current_columns)
             self._rotate_file()
         # until the first chunk is written we can change the columns schema freely
-        if columns is not None:
+        # columns are only added so a copy is needed when other instance is passed or it grew
+        if columns is not None and (
+            columns is not self._last_columns or len(columns) != len(self._current_columns)
+        ):
             self._current_columns = dict(columns)
+            self._last_columns = columns
 
         new_rows_count: int
         if isinstance(item, List):
@@ -132,6 +138,7 @@ class BufferedDataWriter(Generic[TWriter]):
         self._rotate_file()
         if columns is not None:
             self._current_columns = dict(columns)
+            self._last_columns = columns
         self._last_modified = time.time()
         return self._rotate_file(allow_empty_file=True)
 
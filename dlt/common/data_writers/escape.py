@@ -1,6 +1,6 @@
 import re
 import base64
-from typing import Any, Dict
+from typing import Any, Callable, Dict
 from datetime import date, datetime, time  # noqa: I251
 
 from dlt.common.json import json
@@ -29,50 +29,78 @@ def _escape_extended(
     return "{}{}{}".format(prefix, escape_re.sub(lambda x: escape_dict[x.group(0)], v), "'")
 
 
+def _escape_redshift_text(v: str) -> str:
+    # https://www.postgresql.org/docs/9.3/sql-syntax-lexical.html
+    # looks like this is the only thing we need to escape for Postgres > 9.1
+    # redshift keeps \ as escape character which is pre 9 behavior
+    return _escape_extended(v, prefix="'")
+
+
+def _escape_redshift_json(v: Any) -> str:
+    return "json_parse(%s)" % _escape_extended(json.dumps(v), prefix="'")
+
+
+def _escape_redshift_binary(v: bytes) -> str:
+    return f"from_hex('{v.hex()}')"
+
+
 def escape_redshift_literal(v: Any) -> Any:
     if isinstance(v, str):
-        # https://www.postgresql.org/docs/9.3/sql-syntax-lexical.html
-        # looks like this is the only thing we need to escape for Postgres > 9.1
-        # redshift keeps \ as escape character which is pre 9 behavior
-        return _escape_extended(v, prefix="'")
+        return _escape_redshift_text(v)
     if isinstance(v, bytes):
-        return f"from_hex('{v.hex()}')"
+        return _escape_redshift_binary(v)
     if isinstance(v, (datetime, date, time)):
         return f"'{v.isoformat()}'"
     if isinstance(v, (list, dict)):
-        return "json_parse(%s)" % _escape_extended(json.dumps(v), prefix="'")
+        return _escape_redshift_json(v)
     if v is None:
         return "NULL"
 
     return str(v)
 
 
+def _escape_postgres_text(v: str) -> str:
+    # we escape extended string which behave like the redshift string
+    return _escape_extended(v)
+
+
+def _escape_postgres_json(v: Any) -> str:
+    return _escape_extended(json.dumps(v))
+
+
+def _escape_postgres_binary(v: bytes) -> str:
+    return f"'\\x{v.hex()}'"
+
+
 def escape_postgres_literal(v: Any) -> Any:
     if isinstance(v, str):
-        # we escape extended string which behave like the redshift string
-        return _escape_extended(v)
+        return _escape_postgres_text(v)
     if isinstance(v, (datetime, date, time)):
         return f"'{v.isoformat()}'"
     if isinstance(v, (list, dict)):
-        return _escape_extended(json.dumps(v))
+        return _escape_postgres_json(v)
     if isinstance(v, bytes):
-        return f"'\\x{v.hex()}'"
+        return _escape_postgres_binary(v)
     if v is None:
         return "NULL"
 
     return str(v)
 
 
+def _escape_duckdb_binary(v: bytes) -> str:
+    return f"from_base64('{base64.b64encode(v).decode('ascii')}')"
+
+
 def escape_duckdb_literal(v: Any) -> Any:
     if isinstance(v, str):
         # we escape extended string which behave like the redshift string
-        return _escape_extended(v)
+        return _escape_postgres_text(v)
     if isinstance(v, (datetime, date, time)):
         return f"'{v.isoformat()}'"
     if isinstance(v, (list, dict)):
-        return _escape_extended(json.dumps(v))
+        return _escape_postgres_json(v)
     if isinstance(v, bytes):
-        return f"from_base64('{base64.b64encode(v).decode('ascii')}')"
+        return _escape_duckdb_binary(v)
     if v is None:
         return "NULL"
 
@@ -88,25 +116,35 @@ MS_SQL_ESCAPE_DICT = {
 MS_SQL_ESCAPE_RE = _make_sql_escape_re(MS_SQL_ESCAPE_DICT)
 
 
+def _escape_mssql_text(v: str) -> str:
+    return _escape_extended(
+        v, prefix="N'", escape_dict=MS_SQL_ESCAPE_DICT, escape_re=MS_SQL_ESCAPE_RE
+    )
+
+
+def _escape_mssql_json(v: Any) -> str:
+    return _escape_mssql_text(json.dumps(v))
+
+
+def _escape_mssql_binary(v: bytes) -> str:
+    from dlt.destinations.impl.mssql.mssql import VARBINARY_MAX_N
+
+    if len(v) <= VARBINARY_MAX_N:
+        n = str(len(v))
+    else:
+        n = "MAX"
+    return f"CONVERT(VARBINARY({n}), '{v.hex()}', 2)"
+
+
 def escape_mssql_literal(v: Any) -> Any:
     if isinstance(v, str):
-        return _escape_extended(
-            v, prefix="N'", escape_dict=MS_SQL_ESCAPE_DICT, escape_re=MS_SQL_ESCAPE_RE
-        )
+        return _escape_mssql_text(v)
     if isinstance(v, (datetime, date, time)):
         return f"'{v.isoformat()}'"
     if isinstance(v, (list, dict)):
-        return _escape_extended(
-            json.dumps(v), prefix="N'", escape_dict=MS_SQL_ESCAPE_DICT, escape_re=MS_SQL_ESCAPE_RE
-        )
+        return _escape_mssql_json(v)
     if isinstance(v, bytes):
-        from dlt.destinations.impl.mssql.mssql import VARBINARY_MAX_N
-
-        if len(v) <= VARBINARY_MAX_N:
-            n = str(len(v))
-        else:
-            n = "MAX"
-        return f"CONVERT(VARBINARY({n}), '{v.hex()}', 2)"
+        return _escape_mssql_binary(v)
 
     if isinstance(v, bool):
         return str(int(v))
@@ -141,21 +179,65 @@ escape_databricks_identifier = escape_bigquery_identifier
 DATABRICKS_ESCAPE_DICT = {"'": "\\'", "\\": "\\\\", "\n": "\\n", "\r": "\\r"}
 
 
+def _escape_databricks_text(v: str) -> str:
+    return _escape_extended(v, prefix="'", escape_dict=DATABRICKS_ESCAPE_DICT)
+
+
+def _escape_databricks_json(v: Any) -> str:
+    return _escape_databricks_text(json.dumps(v))
+
+
+def _escape_databricks_binary(v: bytes) -> str:
+    return f"X'{v.hex()}'"
+
+
 def escape_databricks_literal(v: Any) -> Any:
     if isinstance(v, str):
-        return _escape_extended(v, prefix="'", escape_dict=DATABRICKS_ESCAPE_DICT)
+        return _escape_databricks_text(v)
     if isinstance(v, (datetime, date, time)):
         return f"'{v.isoformat()}'"
     if isinstance(v, (list, dict)):
-        return _escape_extended(json.dumps(v), prefix="'", escape_dict=DATABRICKS_ESCAPE_DICT)
+        return _escape_databricks_json(v)
     if isinstance(v, bytes):
-        return f"X'{v.hex()}'"
+        return _escape_databricks_binary(v)
     if v is None:
         return "NULL"
 
     return str(v)
 
 
+TYPED_LITERAL_ESCAPERS: Dict[Callable[[Any], Any], Dict[str, Callable[[Any], str]]] = {
+    escape_redshift_literal: {
+        "text": _escape_redshift_text,
+        "complex": _escape_redshift_json,
+        "binary": _escape_redshift_binary,
+    },
+    escape_postgres_literal: {
+        "text": _escape_postgres_text,
+        "complex": _escape_postgres_json,
+        "binary": _escape_postgres_binary,
+    },
+    escape_duckdb_literal: {
+        "text": _escape_postgres_text,
+        "complex": _escape_postgres_json,
+        "binary": _escape_duckdb_binary,
+    },
+    escape_mssql_literal: {
+        "text": _escape_mssql_text,
+        "complex": _escape_mssql_json,
+        "binary": _escape_mssql_binary,
+    },
+    escape_databricks_literal: {
+        "text": _escape_databricks_text,
+        "complex": _escape_databricks_json,
+        "binary": _escape_databricks_binary,
+    },
+}
+"""Escapers of text, json and binary values by literal escaper of a destination. All of the
+literal escapers here render ints and floats with `str` and date/time types as quoted isoformat
+"""
+
+
 def format_datetime_literal(v: pendulum.DateTime, precision: int = 6, no_tz: bool = False) -> str:
     """Converts `v` to ISO string, optionally without timezone spec (in UTC) and with given `precision`"""
     if no_tz:
@@ -1,9 +1,11 @@
 import abc
 import csv
+from datetime import date, datetime, time  # noqa: I251
 from typing import (
     IO,
     TYPE_CHECKING,
     Any,
+    Callable,
     ClassVar,
     Dict,
     List,
@@ -14,6 +16,7 @@ from typing import (
     Type,
     NamedTuple,
     TypeVar,
+    Union,
 )
 
 from dlt.common.json import json
@@ -27,7 +30,8 @@ from dlt.common.data_writers.exceptions import (
     InvalidDataItem,
 )
 from dlt.common.destination import DestinationCapabilitiesContext, TLoaderFileFormat
-from dlt.common.schema.typing import TTableSchemaColumns
+from dlt.common.data_writers.escape import TYPED_LITERAL_ESCAPERS
+from dlt.common.schema.typing import TColumnSchema, TTableSchemaColumns
 from dlt.common.typing import StrAny
 
 if TYPE_CHECKING:
@@ -195,6 +199,7 @@ class InsertValuesWriter(DataWriter):
         super().__init__(f, caps)
         self._chunks_written = 0
         self._headers_lookup: Dict[str, int] = None
+        self._escapers: List[Callable[[Any], str]] = None
         self.writer_type = caps.insert_values_writer_type
         if self.writer_type == "default":
             self.pre, self.post, self.sep = ("(", ")", ",\n")
@@ -207,6 +212,8 @@ class InsertValuesWriter(DataWriter):
         headers = columns_schema.keys()
         # dict lookup is always faster
         self._headers_lookup = {v: i for i, v in enumerate(headers)}
+        # escape values according to column data type
+        self._escapers = [self._get_column_escaper(c) for c in columns_schema.values()]
         # do not write INSERT INTO command, this must be added together with table name by the loader
         self._f.write("INSERT INTO {}(")
         self._f.write(",".join(map(self._caps.escape_identifier, headers)))
@@ -221,28 +228,70 @@ class InsertValuesWriter(DataWriter):
         if len(rows) == 0:
             return
 
-        def write_row(row: StrAny, last_row: bool = False) -> None:
-            output = ["NULL"] * len(self._headers_lookup)
+        headers_lookup = self._headers_lookup
+        escapers = self._escapers
+        null_row = ["NULL"] * len(headers_lookup)
+        output_rows: List[List[str]] = []
+        for row in rows:
+            output = null_row.copy()
             for n, v in row.items():
-                output[self._headers_lookup[n]] = self._caps.escape_literal(v)
-            self._f.write(self.pre)
-            self._f.write(",".join(output))
-            self._f.write(self.post)
-            if not last_row:
-                self._f.write(self.sep)
+                idx = headers_lookup[n]
+                output[idx] = escapers[idx](v)
+            output_rows.append(output)
+        self._write_rows(output_rows)
 
+    def _write_rows(self, output_rows: Sequence[Sequence[str]]) -> None:
+        """Writes rows of escaped values as a single chunk"""
         # if next chunk add separator
         if self._chunks_written > 0:
             self._f.write(self.sep)
-
-        # write rows
-        for row in rows[:-1]:
-            write_row(row)
-
+        pre, post = self.pre, self.post
         # write last row without separator so we can write footer eventually
-        write_row(rows[-1], last_row=True)
+        self._f.write(self.sep.join([pre + ",".join(output) + post for output in output_rows]))
         self._chunks_written += 1
 
+    def _get_column_escaper(self, column: TColumnSchema) -> Callable[[Any], str]:
+        """Returns literal escaper for values of `column`. For well known escapers and data types
+        values of expected python type are escaped directly, all other values are passed to
+        the destination escaper
+        """
+        escape_literal: Callable[[Any], str] = self._caps.escape_literal
+        typed_escapers = TYPED_LITERAL_ESCAPERS.get(escape_literal)
+        if typed_escapers is None:
+            return escape_literal
+        data_type = column.get("data_type")
+        if data_type in ("bigint", "double"):
+            number_type = int if data_type == "bigint" else float
+
+            def _escape_number(v: Any) -> str:
+                return str(v) if type(v) is number_type else escape_literal(v)
+
+            return _escape_number
+        if data_type in ("timestamp", "date", "time"):
+            temporal_type: Type[Union[datetime, date, time]] = {
+                "timestamp": datetime,
+                "date": date,
+                "time": time,
+            }[data_type]
+
+            def _escape_temporal(v: Any) -> str:
+                return f"'{v.isoformat()}'" if isinstance(v, temporal_type) else escape_literal(v)
+
+            return _escape_temporal
+        if data_type in typed_escapers:
+            escape_typed = typed_escapers[data_type]
+            value_types: Tuple[Type[Any], ...] = {
+                "text": (str,),
+                "complex": (dict, list),
+                "binary": (bytes,),
+            }[data_type]
+
+            def _escape_typed(v: Any) -> str:
+                return escape_typed(v) if type(v) in value_types else escape_literal(v)
+
+            return _escape_typed
+        return escape_literal
+
     def write_footer(self) -> None:
         if self._chunks_written > 0:
             self._f.write(";")
@@ -618,6 +667,28 @@ class ArrowToObjectAdapter:
 
 
 class ArrowToInsertValuesWriter(ArrowToObjectAdapter, InsertValuesWriter):
+    def write_data(self, rows: Sequence[Any]) -> None:
+        headers_lookup = self._headers_lookup
+        null_row = ["NULL"] * len(headers_lookup)
+        for batch in rows:
+            self.items_count += batch.num_rows
+            if batch.num_rows == 0:
+                continue
+            # escape whole columns at once
+            indices: List[int] = []
+            escaped_columns: List[List[str]] = []
+            for name, column in zip(batch.schema.names, batch.columns):
+                idx = headers_lookup[name]
+                indices.append(idx)
+                escaped_columns.append(list(map(self._escapers[idx], column.to_pylist())))
+            output_rows: List[List[str]] = []
+            for values in zip(*escaped_columns):
+                output = null_row.copy()
+                for idx, value in zip(indices, values):
+                    output[idx] = value
+                output_rows.append(output)
+            self._write_rows(output_rows)
+
     @classmethod
     def writer_spec(cls) -> FileWriterSpec:
         return cls.convert_spec(InsertValuesWriter)
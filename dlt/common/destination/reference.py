@@ -38,7 +38,7 @@ from dlt.common.schema.utils import (
 from dlt.common.configuration import configspec, resolve_configuration, known_sections
 from dlt.common.configuration.specs import BaseConfiguration, CredentialsConfiguration
 from dlt.common.configuration.accessors import config
-from dlt.common.destination.capabilities import DestinationCapabilitiesContext
+from dlt.common.destination.capabilities import DestinationCapabilitiesContext, TLoaderFileFormat
 from dlt.common.destination.exceptions import (
     IdentifierTooLongException,
     InvalidDestinationReference,
@@ -468,6 +468,22 @@ class SupportsStagingDestination:
         return True
 
 
+class SupportsMultiFileLoad(ABC):
+    """Adds capability to load many files of the same table and format in a single job"""
+
+    multi_file_load_formats: ClassVar[Sequence[TLoaderFileFormat]] = ()
+    """File formats that may be loaded together"""
+
+    @abstractmethod
+    def start_file_loads(
+        self, table: TTableSchema, file_paths: Sequence[str], load_id: str
+    ) -> List[LoadJob]:
+        """Creates and starts a load job for each of `file_paths` with a single load of all the files.
+        All files belong to `table` and have the same format.
+        """
+        pass
+
+
 TDestinationReferenceArg = Union[str, "Destination", Callable[..., "Destination"], None]
 
 
@@ -322,7 +322,7 @@ class DataItemNormalizer(DataItemNormalizerBase[RelationalNormalizerConfig]):
         row["_dlt_load_id"] = load_id
         # determine if row hash should be used as dlt id
         row_hash = False
-        if self._is_scd2_table(self.schema, table_name):
+        if self.is_scd2_table(self.schema, table_name):
             row_hash = self._dlt_id_is_row_hash(self.schema, table_name)
             self._validate_validity_column_names(
                 self._get_validity_column_names(self.schema, table_name), item
@@ -368,7 +368,8 @@ class DataItemNormalizer(DataItemNormalizerBase[RelationalNormalizerConfig]):
 
     @staticmethod
     @lru_cache(maxsize=None)
-    def _is_scd2_table(schema: Schema, table_name: str) -> bool:
+    def is_scd2_table(schema: Schema, table_name: str) -> bool:
+        """Tells if `table_name` uses scd2 merge strategy so its rows are hashed and validated"""
         if table_name in schema.data_table_names():
             if schema.get_table(table_name).get("x-merge-strategy") == "scd2":
                 return True
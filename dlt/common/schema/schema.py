@@ -1,5 +1,20 @@
 from copy import copy, deepcopy
-from typing import ClassVar, Dict, List, Mapping, Optional, Sequence, Tuple, Any, cast, Literal
+from enum import Enum
+from functools import partial
+from typing import (
+    Callable,
+    ClassVar,
+    Dict,
+    List,
+    Mapping,
+    Optional,
+    Sequence,
+    Tuple,
+    Type,
+    Any,
+    cast,
+    Literal,
+)
 from dlt.common.schema.migrations import migrate_schema
 
 from dlt.common.utils import extend_list_deduplicated
@@ -94,6 +109,8 @@ class Schema:
     _compiled_includes: Dict[str, Sequence[REPattern]]
     # type detections
     _type_detections: Sequence[TTypeDetections]
+    # coercers by column data type and python type, None if value is stored without changes
+    _value_coercers: Dict[Tuple[TDataType, Type[Any]], Optional[Callable[[Any], Any]]]
 
     # normalizers config
     _normalizers_config: TNormalizersConfig
@@ -234,6 +251,7 @@ class Schema:
         if not table:
             table = utils.new_table(table_name, parent_table)
         table_columns = table["columns"]
+        value_coercers = self._value_coercers
 
         new_row: DictStrAny = {}
         for col_name, v in row.items():
@@ -241,17 +259,36 @@ class Schema:
             if v is None:
                 # just check if column is nullable if it exists
                 self._coerce_null_value(table_columns, table_name, col_name)
-            else:
-                new_col_name, new_col_def, new_v = self._coerce_non_null_value(
-                    table_columns, table_name, col_name, v
-                )
-                new_row[new_col_name] = new_v
-                if new_col_def:
-                    if not updated_table_partial:
-                        # create partial table with only the new columns
-                        updated_table_partial = copy(table)
-                        updated_table_partial["columns"] = {}
-                    updated_table_partial["columns"][new_col_name] = new_col_def
+                continue
+            # coerce directly into existing complete column
+            existing_column = table_columns.get(col_name)
+            if existing_column is not None and utils.is_complete_column(existing_column):
+                coercer_key = (existing_column["data_type"], type(v))
+                try:
+                    coercer = value_coercers[coercer_key]
+                except KeyError:
+                    coercer = value_coercers[coercer_key] = self._get_value_coercer(*coercer_key)
+                if coercer is None:
+                    new_row[col_name] = v
+                    continue
+                try:
+                    new_v = coercer(v)
+                    # variants and values that do not coerce are handled below
+                    if not callable(new_v):
+                        new_row[col_name] = new_v
+                        continue
+                except (ValueError, SyntaxError):
+                    pass
+            new_col_name, new_col_def, new_v = self._coerce_non_null_value(
+                table_columns, table_name, col_name, v
+            )
+            new_row[new_col_name] = new_v
+            if new_col_def:
+                if not updated_table_partial:
+                    # create partial table with only the new columns
+                    updated_table_partial = copy(table)
+                    updated_table_partial["columns"] = {}
+                updated_table_partial["columns"][new_col_name] = new_col_def
 
         return new_row, updated_table_partial
 
@@ -588,7 +625,7 @@ class Schema:
         Returns:
             int: Current schema version
         """
-        return utils.bump_version_if_modified(self.to_dict())[0]
+        return self.to_dict()["version"]
 
     @property
     def stored_version(self) -> int:
@@ -602,12 +639,12 @@ class Schema:
     @property
     def version_hash(self) -> str:
         """Current version hash of the schema, recomputed from the actual content"""
-        return utils.bump_version_if_modified(self.to_dict())[1]
+        return self.to_dict()["version_hash"]
 
     @property
     def previous_hashes(self) -> Sequence[str]:
         """Current version hash of the schema, recomputed from the actual content"""
-        return utils.bump_version_if_modified(self.to_dict())[3]
+        return self.to_dict()["previous_hashes"]
 
     @property
     def stored_version_hash(self) -> str:
@@ -620,6 +657,9 @@ class Schema:
 
         A current version hash is computed and compared with stored version hash
         """
+        if self._stored_version_hash is None:
+            # new schema, no need to compute the hash
+            return True
         return self.version_hash != self._stored_version_hash
 
     @property
@@ -640,6 +680,11 @@ class Schema:
     def settings(self) -> TSchemaSettings:
         return self._settings
 
+    @property
+    def has_row_filters(self) -> bool:
+        """Tells if any table has exclude filters so `filter_row` may modify rows"""
+        return bool(self._compiled_excludes)
+
     def to_pretty_json(self, remove_defaults: bool = True) -> str:
         d = self.to_dict(remove_defaults=remove_defaults)
         return utils.to_pretty_json(d)
@@ -709,6 +754,21 @@ class Schema:
             column_schema["variant"] = is_variant
         return column_schema
 
+    @staticmethod
+    def _get_value_coercer(
+        col_type: TDataType, value_type: Type[Any]
+    ) -> Optional[Callable[[Any], Any]]:
+        """Returns None if values of `value_type` are stored in column of `col_type` without
+        changes, otherwise a coercer that takes a value and may raise or return a variant"""
+        py_type = py_type_to_sc_type(value_type)
+        if (
+            col_type == py_type
+            and py_type != "complex"
+            and not issubclass(value_type, (Enum, SupportsVariant))
+        ):
+            return None
+        return partial(coerce_value, col_type, py_type)
+
     def _coerce_null_value(
         self, table_columns: TTableSchemaColumns, table_name: str, col_name: str
     ) -> None:
@@ -881,6 +941,7 @@ class Schema:
         self._compiled_excludes: Dict[str, Sequence[REPattern]] = {}
         self._compiled_includes: Dict[str, Sequence[REPattern]] = {}
         self._type_detections: Sequence[TTypeDetections] = None
+        self._value_coercers = {}
 
         self._normalizers_config = None
         self.naming = None
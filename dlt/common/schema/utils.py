@@ -199,14 +199,15 @@ def generate_version_hash(stored_schema: TStoredSchema) -> str:
     content = json.dumpb(schema_copy, sort_keys=True)
     h = hashlib.sha3_256(content)
     # additionally check column order
-    table_names = sorted((schema_copy.get("tables") or {}).keys())
-    if table_names:
-        for tn in table_names:
-            t = schema_copy["tables"][tn]
-            h.update(tn.encode("utf-8"))
-            # add column names to hash in order
-            for cn in (t.get("columns") or {}).keys():
-                h.update(cn.encode("utf-8"))
+    tables = schema_copy.get("tables") or {}
+    if tables:
+        # table and column names are hashed in a single update, the digest is the same as if each
+        # name was added separately
+        h.update(
+            "".join(
+                tn + "".join((tables[tn].get("columns") or {}).keys()) for tn in sorted(tables)
+            ).encode("utf-8")
+        )
     return base64.b64encode(h.digest()).decode("ascii")
 
 
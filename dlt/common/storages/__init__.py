@@ -20,7 +20,7 @@ from .configuration import (
     TSchemaFileFormat,
     FilesystemConfiguration,
 )
-from .fsspec_filesystem import fsspec_from_config, fsspec_filesystem
+from .fsspec_filesystem import fsspec_from_config, fsspec_from_config_pooled, fsspec_filesystem
 
 
 __all__ = [
@@ -43,5 +43,6 @@ __all__ = [
     "TJobState",
     "create_load_id",
     "fsspec_from_config",
+    "fsspec_from_config_pooled",
     "fsspec_filesystem",
 ]
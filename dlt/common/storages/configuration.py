@@ -45,6 +45,8 @@ class LoadStorageConfiguration(BaseConfiguration):
     delete_completed_jobs: bool = (
         False  # if set to true the folder with completed jobs will be deleted
     )
+    use_jobs_journal: bool = False
+    """Records started and completed jobs in a journal instead of moving job files during loading"""
 
 
 FileSystemCredentials = Union[
@@ -1,8 +1,11 @@
 import io
+import os
 import gzip
 import mimetypes
 import pathlib
 import posixpath
+import threading
+from collections import OrderedDict
 from io import BytesIO
 from typing import (
     Literal,
@@ -34,6 +37,7 @@ from dlt.common.exceptions import MissingDependencyException
 from dlt.common.storages.configuration import FileSystemCredentials, FilesystemConfiguration
 from dlt.common.time import ensure_pendulum_datetime
 from dlt.common.typing import DictStrAny
+from dlt.common.utils import digest128
 
 
 class FileItem(TypedDict, total=False):
@@ -141,8 +145,57 @@ def fsspec_from_config(config: FilesystemConfiguration) -> Tuple[AbstractFileSys
 
     Returns: (fsspec filesystem, normalized url)
     """
+    return _fsspec_from_args(config, prepare_fsspec_args(config))
+
+
+def fsspec_from_config_pooled(config: FilesystemConfiguration) -> Tuple[AbstractFileSystem, str]:
+    """Same as `fsspec_from_config` but returns a filesystem instance shared within the process.
+
+    Instances are kept in a process-wide pool keyed by bucket url and fsspec arguments (including
+    credentials) so clients and load jobs using the same configuration do not re-create and
+    re-authenticate sessions. The pool keeps at most `FSSPEC_POOL_MAX_SIZE` least recently used
+    instances so instances with rotated credentials are dropped. Use `evict_fsspec_from_pool` to
+    drop an instance whose credentials were rejected. The pool is discarded in forked processes.
+    """
+    global _POOL_PID
+
     fs_kwargs = prepare_fsspec_args(config)
+    key = _fsspec_pool_key(config, fs_kwargs)
+    with _POOL_LOCK:
+        if _POOL_PID != os.getpid():
+            _FSSPEC_POOL.clear()
+            _POOL_PID = os.getpid()
+        if key in _FSSPEC_POOL:
+            _FSSPEC_POOL.move_to_end(key)
+        else:
+            _FSSPEC_POOL[key] = _fsspec_from_args(config, fs_kwargs)
+            while len(_FSSPEC_POOL) > FSSPEC_POOL_MAX_SIZE:
+                _FSSPEC_POOL.popitem(last=False)
+        return _FSSPEC_POOL[key]
+
+
+def evict_fsspec_from_pool(config: FilesystemConfiguration) -> None:
+    """Removes filesystem instance created for `config` from the process-wide pool ie. when its
+    credentials expired
+    """
+    key = _fsspec_pool_key(config, prepare_fsspec_args(config))
+    with _POOL_LOCK:
+        _FSSPEC_POOL.pop(key, None)
 
+
+def clear_fsspec_pool() -> None:
+    """Removes all filesystem instances from the process-wide pool"""
+    with _POOL_LOCK:
+        _FSSPEC_POOL.clear()
+
+
+def _fsspec_pool_key(config: FilesystemConfiguration, fs_kwargs: DictStrAny) -> str:
+    return digest128(f"{config.bucket_url}|{fs_kwargs!r}")
+
+
+def _fsspec_from_args(
+    config: FilesystemConfiguration, fs_kwargs: DictStrAny
+) -> Tuple[AbstractFileSystem, str]:
     try:
         return url_to_fs(config.bucket_url, **fs_kwargs)  # type: ignore
     except ModuleNotFoundError as e:
@@ -151,6 +204,13 @@ def fsspec_from_config(config: FilesystemConfiguration) -> Tuple[AbstractFileSys
         ) from e
 
 
+FSSPEC_POOL_MAX_SIZE = 16
+"""Max number of filesystem instances kept in the process-wide pool"""
+_FSSPEC_POOL: "OrderedDict[str, Tuple[AbstractFileSystem, str]]" = OrderedDict()
+_POOL_LOCK = threading.Lock()
+_POOL_PID: int = None
+
+
 class FileItemDict(DictStrAny):
     """A FileItem dictionary with additional methods to get fsspec filesystem, open and read files."""
 
@@ -10,6 +10,7 @@ from pendulum.datetime import DateTime
 from typing import (
     ClassVar,
     Dict,
+    IO,
     Iterable,
     List,
     NamedTuple,
@@ -289,11 +290,37 @@ class PackageStorage:
     LOAD_PACKAGE_STATE_FILE_NAME = (  # internal state of the load package, will not be synced to the destination
         "load_package_state.json"
     )
+    JOBS_JOURNAL_FILE_NAME: ClassVar[str] = (  # job state changes not yet reflected in job folders
+        "jobs_journal.jsonl"
+    )
+    JOBS_JOURNAL_FSYNC_INTERVAL: ClassVar[int] = 100
+    """Number of journal entries after which the journal is synced to disk"""
+
+    def __init__(
+        self,
+        storage: FileStorage,
+        initial_state: TLoadPackageStatus,
+        use_jobs_journal: bool = False,
+    ) -> None:
+        """Creates storage that manages load packages with root at `storage` and initial package state `initial_state`
 
-    def __init__(self, storage: FileStorage, initial_state: TLoadPackageStatus) -> None:
-        """Creates storage that manages load packages with root at `storage` and initial package state `initial_state`"""
+        With `use_jobs_journal`, jobs that are started and completed are not moved between job folders
+        but their states are appended to the jobs journal of the package. Job files are moved to their
+        folders when package loading completes or with `materialize_jobs_journal`.
+        """
         self.storage = storage
         self.initial_state = initial_state
+        self.use_jobs_journal = use_jobs_journal
+        # open journal files and number of entries written since last sync
+        self._jobs_journals: Dict[str, Tuple[IO[Any], int]] = {}
+        # in-memory index of package jobs built from disk on first use and maintained by job moves
+        # load_id -> table name -> job file name -> job info
+        self._jobs_index: Dict[str, Dict[str, Dict[str, LoadJobInfo]]] = {}
+        # reentrant so job files are moved and indexed under a single lock
+        self._jobs_index_lock = threading.RLock()
+        # package infos cached with package version, version is bumped by changes made by this storage
+        self._package_info_cache: Dict[str, Tuple[Tuple[Any, ...], LoadPackageInfo]] = {}
+        self._package_versions: Dict[str, int] = {}
 
     #
     # List jobs
@@ -318,27 +345,31 @@ class PackageStorage:
         return sorted(loads)
 
     def list_new_jobs(self, load_id: str) -> Sequence[str]:
-        new_jobs = self.storage.list_folder_files(
-            self.get_job_folder_path(load_id, PackageStorage.NEW_JOBS_FOLDER)
-        )
-        return new_jobs
+        return self._list_jobs_in_state(load_id, PackageStorage.NEW_JOBS_FOLDER)
 
     def list_started_jobs(self, load_id: str) -> Sequence[str]:
-        return self.storage.list_folder_files(
-            self.get_job_folder_path(load_id, PackageStorage.STARTED_JOBS_FOLDER)
-        )
+        return self._list_jobs_in_state(load_id, PackageStorage.STARTED_JOBS_FOLDER)
 
     def list_failed_jobs(self, load_id: str) -> Sequence[str]:
+        # failed jobs are always moved to their folder, also when jobs journal is used
         return self.storage.list_folder_files(
             self.get_job_folder_path(load_id, PackageStorage.FAILED_JOBS_FOLDER)
         )
 
     def list_jobs_for_table(self, load_id: str, table_name: str) -> Sequence[LoadJobInfo]:
-        return self.filter_jobs_for_table(self.list_all_jobs(load_id), table_name)
+        with self._jobs_index_lock:
+            return list(self._get_jobs_index(load_id).get(table_name, {}).values())
 
     def list_all_jobs(self, load_id: str) -> Sequence[LoadJobInfo]:
-        info = self.get_load_package_info(load_id)
-        return [job for job in flatten_list_or_items(iter(info.jobs.values()))]  # type: ignore
+        """Lists jobs in all states using in-memory index of the package jobs, which is read from disk
+        only once and then updated by job moves done with this storage.
+        """
+        with self._jobs_index_lock:
+            return [
+                job
+                for table_jobs in self._get_jobs_index(load_id).values()
+                for job in table_jobs.values()
+            ]
 
     def list_failed_jobs_infos(self, load_id: str) -> Sequence[LoadJobInfo]:
         """List all failed jobs and associated error messages for a load package with `load_id`"""
@@ -358,6 +389,37 @@ class PackageStorage:
                 )
         return failed_jobs
 
+    def _list_jobs_in_state(self, load_id: str, state: TJobState) -> Sequence[str]:
+        if self.use_jobs_journal:
+            with self._jobs_index_lock:
+                return [
+                    self.storage.to_relative_path(job.file_path)
+                    for table_jobs in self._get_jobs_index(load_id).values()
+                    for job in table_jobs.values()
+                    if job.state == state
+                ]
+        if self.storage.has_file(self._get_jobs_journal_path(load_id)):
+            return self._list_jobs_by_state(load_id)[state]
+        return self.storage.list_folder_files(self.get_job_folder_path(load_id, state))
+
+    def _list_jobs_by_state(self, load_id: str) -> Dict[TJobState, List[str]]:
+        """Lists job files in the package by job state, job states in the jobs journal take precedence
+        over the job folders. Does not list exception files.
+        """
+        package_path = self.get_package_path(load_id)
+        if not self.storage.has_folder(package_path):
+            raise LoadPackageNotFound(load_id)
+        journal = self._read_jobs_journal(load_id)
+        jobs: Dict[TJobState, List[str]] = {state: [] for state in WORKING_FOLDERS}
+        for folder in WORKING_FOLDERS:
+            with contextlib.suppress(FileNotFoundError):
+                # we ignore if load package lacks one of working folders. completed_jobs may be deleted on archiving
+                for file in self.storage.list_folder_files(os.path.join(package_path, folder)):
+                    if not file.endswith(".exception"):
+                        state = journal.get(FileStorage.get_file_name_from_file_path(file), folder)
+                        jobs[state].append(file)
+        return jobs
+
     #
     # Move jobs
     #
@@ -367,6 +429,9 @@ class PackageStorage:
     ) -> None:
         """Adds new job by moving the `job_file_path` into `new_jobs` of package `load_id`"""
         self.storage.atomic_import(job_file_path, self.get_job_folder_path(load_id, job_state))
+        self._update_jobs_index(
+            load_id, FileStorage.get_file_name_from_file_path(job_file_path), job_state
+        )
 
     def start_job(self, load_id: str, file_name: str) -> str:
         return self._move_job(
@@ -388,6 +453,8 @@ class PackageStorage:
             PackageStorage.STARTED_JOBS_FOLDER,
             PackageStorage.FAILED_JOBS_FOLDER,
             file_name,
+            failed_message=failed_message,
+            journal=False,
         )
 
     def retry_job(self, load_id: str, file_name: str) -> str:
@@ -401,6 +468,7 @@ class PackageStorage:
             PackageStorage.NEW_JOBS_FOLDER,
             file_name,
             dest_fn.file_name(),
+            journal=False,
         )
 
     def complete_job(self, load_id: str, file_name: str) -> str:
@@ -436,11 +504,14 @@ class PackageStorage:
     def complete_loading_package(self, load_id: str, load_state: TLoadPackageStatus) -> str:
         """Completes loading the package by writing marker file with`package_state. Returns path to the completed package"""
         load_path = self.get_package_path(load_id)
+        # completed packages keep jobs in job folders
+        self.materialize_jobs_journal(load_id)
         # save marker file
         self.storage.save(
             os.path.join(load_path, PackageStorage.PACKAGE_COMPLETED_FILE_NAME), load_state
         )
         # TODO: also modify state
+        self._drop_jobs_index(load_id)
         return load_path
 
     def remove_completed_jobs(self, load_id: str) -> None:
@@ -452,6 +523,7 @@ class PackageStorage:
                 self.get_job_folder_path(load_id, PackageStorage.COMPLETED_JOBS_FOLDER),
                 recursively=True,
             )
+            self._drop_jobs_index(load_id)
 
     def delete_package(self, load_id: str, not_exists_ok: bool = False) -> None:
         package_path = self.get_package_path(load_id)
@@ -459,7 +531,28 @@ class PackageStorage:
             if not_exists_ok:
                 return
             raise LoadPackageNotFound(load_id)
+        self._close_jobs_journal(load_id)
         self.storage.delete_folder(package_path, recursively=True)
+        self._drop_jobs_index(load_id)
+        self._package_versions.pop(load_id, None)
+
+    def materialize_jobs_journal(self, load_id: str) -> None:
+        """Moves job files into folders of job states recorded in the jobs journal and deletes the
+        journal. Also recovers package layout after loading with jobs journal was interrupted.
+        """
+        self._close_jobs_journal(load_id)
+        journal_path = self._get_jobs_journal_path(load_id)
+        if not self.storage.has_file(journal_path):
+            return
+        package_path = self.get_package_path(load_id)
+        for state, files in self._list_jobs_by_state(load_id).items():
+            for file in files:
+                file_name = FileStorage.get_file_name_from_file_path(file)
+                dest_path = os.path.join(package_path, state, file_name)
+                if file != dest_path:
+                    self.storage.atomic_rename(file, dest_path)
+        self.storage.delete(journal_path)
+        self._drop_jobs_index(load_id)
 
     def load_schema(self, load_id: str) -> Schema:
         return Schema.from_dict(self._load_schema(load_id))
@@ -472,6 +565,7 @@ class PackageStorage:
     def save_schema(self, load_id: str, schema: Schema) -> str:
         # save a schema to a temporary load package
         dump = json.dumps(schema.to_dict())
+        self._bump_package_version(load_id)
         return self.storage.save(os.path.join(load_id, PackageStorage.SCHEMA_FILE_NAME), dump)
 
     def save_schema_updates(self, load_id: str, schema_update: TSchemaTables) -> None:
@@ -515,7 +609,47 @@ class PackageStorage:
     #
 
     def get_load_package_info(self, load_id: str) -> LoadPackageInfo:
-        """Gets information on normalized/completed package with given load_id, all jobs and their statuses."""
+        """Gets information on normalized/completed package with given load_id, all jobs and their statuses.
+
+        Package info is cached and read again only when package changes. Each call gets its own
+        copy of the package schema.
+        """
+        version = self._get_package_version(load_id)
+        cached = self._package_info_cache.get(load_id)
+        if cached and cached[0] == version:
+            info = cached[1]._replace(schema=cached[1].schema.clone())
+            if info.completed_at is None:
+                # elapsed time of jobs in not completed packages is counted until now
+                now_ts = pendulum.now().timestamp()
+                info = info._replace(
+                    jobs={
+                        state: [
+                            job._replace(elapsed=now_ts - job.created_at.timestamp())
+                            for job in jobs
+                        ]
+                        for state, jobs in info.jobs.items()
+                    }
+                )
+            return info
+        info = self._read_load_package_info(load_id)
+        self._package_info_cache[load_id] = (version, info._replace(schema=info.schema.clone()))
+        return info
+
+    def get_load_package_jobs_counts(self, load_id: str) -> Dict[TJobState, int]:
+        """Gets number of jobs in each state in package with given load_id without reading job files"""
+        counts: Dict[TJobState, int] = {state: 0 for state in WORKING_FOLDERS}
+        with self._jobs_index_lock:
+            index = self._jobs_index.get(load_id)
+            if index is not None:
+                for table_jobs in index.values():
+                    for job in table_jobs.values():
+                        counts[job.state] += 1
+                return counts
+        for state, files in self._list_jobs_by_state(load_id).items():
+            counts[state] = len(files)
+        return counts
+
+    def _read_load_package_info(self, load_id: str) -> LoadPackageInfo:
         package_path = self.get_package_path(load_id)
         if not self.storage.has_folder(package_path):
             raise LoadPackageNotFound(load_id)
@@ -540,16 +674,12 @@ class PackageStorage:
             applied_update = json.loads(self.storage.load(applied_schema_update_file))
         schema = Schema.from_dict(self._load_schema(load_id))
 
-        # read jobs with all statuses
-        all_jobs: Dict[TJobState, List[LoadJobInfo]] = {}
-        for state in WORKING_FOLDERS:
-            jobs: List[LoadJobInfo] = []
-            with contextlib.suppress(FileNotFoundError):
-                # we ignore if load package lacks one of working folders. completed_jobs may be deleted on archiving
-                for file in self.storage.list_folder_files(os.path.join(package_path, state)):
-                    if not file.endswith(".exception"):
-                        jobs.append(self._read_job_file_info(state, file, package_created_at))
-            all_jobs[state] = jobs
+        # read jobs with all statuses, job files are not moved by this storage in the meantime
+        with self._jobs_index_lock:
+            all_jobs: Dict[TJobState, List[LoadJobInfo]] = {
+                state: [self._read_job_file_info(state, file, package_created_at) for file in files]
+                for state, files in self._list_jobs_by_state(load_id).items()
+            }
 
         return LoadPackageInfo(
             load_id,
@@ -589,15 +719,158 @@ class PackageStorage:
         dest_folder: TJobState,
         file_name: str,
         new_file_name: str = None,
+        failed_message: str = None,
+        journal: bool = True,
     ) -> str:
         # ensure we move file names, not paths
         assert file_name == FileStorage.get_file_name_from_file_path(file_name)
         load_path = self.get_package_path(load_id)
-        dest_path = os.path.join(load_path, dest_folder, new_file_name or file_name)
-        self.storage.atomic_rename(os.path.join(load_path, source_folder, file_name), dest_path)
-        # print(f"{join(load_path, source_folder, file_name)} -> {dest_path}")
+        source_path = os.path.join(load_path, source_folder, file_name)
+        # jobs index must not be built from disk while job file is moved
+        with self._jobs_index_lock:
+            if self.use_jobs_journal:
+                # job file may be still in another folder
+                job = self._find_indexed_job(load_id, file_name)
+                if job is not None:
+                    source_path = self.storage.to_relative_path(job.file_path)
+                if journal:
+                    self._write_jobs_journal(load_id, file_name, dest_folder)
+                    self._update_jobs_index(load_id, file_name, dest_folder, moved=False)
+                    return self.storage.make_full_path(source_path)
+            dest_path = os.path.join(load_path, dest_folder, new_file_name or file_name)
+            self.storage.atomic_rename(source_path, dest_path)
+            # print(f"{join(load_path, source_folder, file_name)} -> {dest_path}")
+            if self.use_jobs_journal:
+                # job moved to its folder, journal entry overrides previous states of the job
+                self._write_jobs_journal(load_id, new_file_name or file_name, dest_folder)
+            self._update_jobs_index(load_id, file_name, dest_folder, new_file_name, failed_message)
         return self.storage.make_full_path(dest_path)
 
+    def _get_jobs_journal_path(self, load_id: str) -> str:
+        return os.path.join(self.get_package_path(load_id), PackageStorage.JOBS_JOURNAL_FILE_NAME)
+
+    def _read_jobs_journal(self, load_id: str) -> Dict[str, TJobState]:
+        """Reads job states from the jobs journal, later entries take precedence"""
+        journal: Dict[str, TJobState] = {}
+        try:
+            journal_dump = self.storage.load(self._get_jobs_journal_path(load_id))
+        except FileNotFoundError:
+            return journal
+        for line in journal_dump.splitlines():
+            try:
+                entry = json.loads(line)
+            except ValueError:
+                # last entry may be partially written if process was killed
+                break
+            journal[entry["job"]] = entry["state"]
+        return journal
+
+    def _write_jobs_journal(self, load_id: str, file_name: str, state: TJobState) -> None:
+        with self._jobs_index_lock:
+            f, entries_count = self._jobs_journals.get(load_id, (None, 0))
+            if f is None:
+                f = self.storage.open_file(self._get_jobs_journal_path(load_id), mode="a")
+            f.write(json.dumps({"job": file_name, "state": state}) + "\n")
+            # survive process crash
+            f.flush()
+            entries_count += 1
+            if entries_count >= PackageStorage.JOBS_JOURNAL_FSYNC_INTERVAL:
+                os.fsync(f.fileno())
+                entries_count = 0
+            self._jobs_journals[load_id] = (f, entries_count)
+
+    def _close_jobs_journal(self, load_id: str) -> None:
+        with self._jobs_index_lock:
+            f, _ = self._jobs_journals.pop(load_id, (None, 0))
+            if f is not None:
+                os.fsync(f.fileno())
+                f.close()
+
+    def _get_package_version(self, load_id: str) -> Tuple[Any, ...]:
+        """Gets version of the package from changes done by this storage and modification times of
+        package folders, which change when files are added, removed or renamed
+        """
+        package_path = self.storage.make_full_path(self.get_package_path(load_id))
+        try:
+            version: List[Any] = [
+                self._package_versions.get(load_id, 0),
+                os.stat(package_path).st_mtime_ns,
+            ]
+        except FileNotFoundError:
+            raise LoadPackageNotFound(load_id)
+        for path in [*WORKING_FOLDERS, PackageStorage.JOBS_JOURNAL_FILE_NAME]:
+            try:
+                version.append(os.stat(os.path.join(package_path, path)).st_mtime_ns)
+            except FileNotFoundError:
+                version.append(None)
+        return tuple(version)
+
+    def _bump_package_version(self, load_id: str) -> None:
+        self._package_versions[load_id] = self._package_versions.get(load_id, 0) + 1
+
+    def _get_jobs_index(self, load_id: str) -> Dict[str, Dict[str, LoadJobInfo]]:
+        """Gets jobs index of the package, reads the jobs from disk if not yet indexed. Must be called
+        with the index lock acquired.
+        """
+        index = self._jobs_index.get(load_id)
+        if index is not None:
+            return index
+        index = {}
+        for state, files in self._list_jobs_by_state(load_id).items():
+            for file in files:
+                job = self._read_job_file_info(state, file)
+                index.setdefault(job.job_file_info.table_name, {})[
+                    FileStorage.get_file_name_from_file_path(file)
+                ] = job
+        self._jobs_index[load_id] = index
+        return index
+
+    def _find_indexed_job(self, load_id: str, file_name: str) -> Optional[LoadJobInfo]:
+        """Finds job with `file_name` in the jobs index. Must be called with the index lock acquired."""
+        table_name = ParsedLoadJobFileName.parse(file_name).table_name
+        return self._get_jobs_index(load_id).get(table_name, {}).get(file_name)
+
+    def _update_jobs_index(
+        self,
+        load_id: str,
+        file_name: str,
+        state: TJobState,
+        new_file_name: str = None,
+        failed_message: str = None,
+        moved: bool = True,
+    ) -> None:
+        """Moves job `file_name` to `state` in the jobs index of the package, if index was created.
+        Job file path is kept if job file was not `moved`.
+        """
+        self._bump_package_version(load_id)
+        with self._jobs_index_lock:
+            index = self._jobs_index.get(load_id)
+            if index is None:
+                return
+            new_file_name = new_file_name or file_name
+            job_file_info = ParsedLoadJobFileName.parse(new_file_name)
+            table_jobs = index.setdefault(job_file_info.table_name, {})
+            job = table_jobs.pop(file_name, None)
+            file_path = self.get_job_file_path(load_id, state, new_file_name)
+            if job is None:
+                # job imported into the package
+                job = self._read_job_file_info(state, file_path)
+            else:
+                # file modification time and size do not change on move
+                job = job._replace(
+                    state=state,
+                    file_path=self.storage.make_full_path(file_path) if moved else job.file_path,
+                    job_file_info=job_file_info,
+                    failed_message=failed_message,
+                )
+            table_jobs[new_file_name] = job
+
+    def _drop_jobs_index(self, load_id: str) -> None:
+        self._bump_package_version(load_id)
+        self._package_info_cache.pop(load_id, None)
+        with self._jobs_index_lock:
+            self._jobs_index.pop(load_id, None)
+
     def _load_schema(self, load_id: str) -> DictStrAny:
         schema_path = os.path.join(load_id, PackageStorage.SCHEMA_FILE_NAME)
         return json.loads(self.storage.load(schema_path))  # type: ignore[no-any-return]
@@ -71,7 +71,9 @@ class LoadStorage(VersionedStorage):
             FileStorage(join(config.load_volume_path, LoadStorage.NEW_PACKAGES_FOLDER)), "new"
         )
         self.normalized_packages = PackageStorage(
-            FileStorage(join(config.load_volume_path, LoadStorage.NORMALIZED_FOLDER)), "normalized"
+            FileStorage(join(config.load_volume_path, LoadStorage.NORMALIZED_FOLDER)),
+            "normalized",
+            use_jobs_journal=config.use_jobs_journal,
         )
         self.loaded_packages = PackageStorage(
             FileStorage(join(config.load_volume_path, LoadStorage.LOADED_FOLDER)), "loaded"
@@ -1,5 +1,6 @@
+import os
 import yaml
-from typing import Iterator, List, Mapping, Tuple, cast
+from typing import Any, Dict, Iterator, List, Mapping, Tuple, cast
 
 from dlt.common import logger
 from dlt.common.json import json
@@ -32,6 +33,8 @@ class SchemaStorage(Mapping[str, Schema]):
     ) -> None:
         self.config = config
         self.storage = FileStorage(config.schema_volume_path, makedirs=makedirs)
+        # schema versions and file stats of schemas in storage, used to skip saving unchanged schemas
+        self._stored_schemas: Dict[str, Tuple[Tuple[Any, ...], Tuple[int, int]]] = {}
 
     def _load_schema_json(self, name: str) -> DictStrAny:
         schema_file = self._file_name_in_store(name, "json")
@@ -41,10 +44,12 @@ class SchemaStorage(Mapping[str, Schema]):
         # loads a schema from a store holding many schemas
         storage_schema: DictStrAny = None
         try:
+            schema_stat = self._get_schema_file_stat(self._file_name_in_store(name, "json"))
             storage_schema = self._load_schema_json(name)
             # prevent external modifications of schemas kept in storage
             if not verify_schema_hash(storage_schema, verifies_if_not_migrated=True):
                 raise InStorageSchemaModified(name, self.config.schema_volume_path)
+            self._stored_schemas[name] = (self._get_schema_key(storage_schema), schema_stat)
         except FileNotFoundError:
             # maybe we can import from external storage
             pass
@@ -178,12 +183,42 @@ class SchemaStorage(Mapping[str, Schema]):
         # save a schema to schema store
         schema_file = self._file_name_in_store(schema.name, "json")
         stored_schema = schema.to_dict()
-        saved_path = self.storage.save(schema_file, to_pretty_json(stored_schema))
+        schema_key = self._get_schema_key(stored_schema)
+        if self._stored_schemas.get(schema.name) == (
+            schema_key,
+            self._get_schema_file_stat(schema_file),
+        ):
+            # same schema version is already stored
+            saved_path = self.storage.make_full_path(schema_file)
+        else:
+            saved_path = self.storage.save(schema_file, to_pretty_json(stored_schema))
+            self._stored_schemas[schema.name] = (
+                schema_key,
+                self._get_schema_file_stat(schema_file),
+            )
         # this should be the only place where this function is called. we bump a version and
         # clean modified status
         schema._bump_version()
         return saved_path
 
+    def _get_schema_file_stat(self, schema_file: str) -> Tuple[int, int]:
+        try:
+            stat = os.stat(self.storage.make_full_path(schema_file))
+            return stat.st_mtime_ns, stat.st_size
+        except FileNotFoundError:
+            return None
+
+    @staticmethod
+    def _get_schema_key(stored_schema: Mapping[str, Any]) -> Tuple[Any, ...]:
+        # version hash does not include the fields below
+        return (
+            stored_schema.get("engine_version"),
+            stored_schema.get("version"),
+            stored_schema.get("version_hash"),
+            stored_schema.get("imported_version_hash"),
+            tuple(stored_schema.get("previous_hashes") or ()),
+        )
+
     @staticmethod
     def load_schema_file(
         path: str, name: str, extensions: Tuple[TSchemaFileFormat, ...] = SchemaFileExtensions
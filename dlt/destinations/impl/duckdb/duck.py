@@ -1,11 +1,16 @@
 import threading
-from typing import ClassVar, Dict, Optional
+from typing import ClassVar, Dict, List, Optional, Sequence
 
-from dlt.common.destination import DestinationCapabilitiesContext
+from dlt.common.destination import DestinationCapabilitiesContext, TLoaderFileFormat
 from dlt.common.data_types import TDataType
 from dlt.common.exceptions import TerminalValueError
 from dlt.common.schema import TColumnSchema, TColumnHint, Schema
-from dlt.common.destination.reference import LoadJob, FollowupJob, TLoadJobState
+from dlt.common.destination.reference import (
+    LoadJob,
+    FollowupJob,
+    TLoadJobState,
+    SupportsMultiFileLoad,
+)
 from dlt.common.schema.typing import TTableSchema, TColumnType, TTableFormat
 from dlt.common.storages.file_storage import FileStorage
 from dlt.common.utils import maybe_context
@@ -115,33 +120,43 @@ class DuckDbTypeMapper(TypeMapper):
 
 
 class DuckDbCopyJob(LoadJob, FollowupJob):
-    def __init__(self, table_name: str, file_path: str, sql_client: DuckDbSqlClient) -> None:
+    def __init__(
+        self, table_name: str, file_path: str, sql_client: DuckDbSqlClient, copy_file: bool = True
+    ) -> None:
         super().__init__(FileStorage.get_file_name_from_file_path(file_path))
+        # file may be already copied together with other files
+        if copy_file:
+            self.copy_files(table_name, [file_path], sql_client)
 
+    @staticmethod
+    def copy_files(table_name: str, file_paths: Sequence[str], sql_client: DuckDbSqlClient) -> None:
+        """Copies all `file_paths` into `table_name` in a single transaction"""
         qualified_table_name = sql_client.make_qualified_table_name(table_name)
-        if file_path.endswith("parquet"):
-            source_format = "PARQUET"
-            options = ""
-            # lock when creating a new lock
-            with PARQUET_TABLE_LOCK:
-                # create or get lock per table name
-                lock: threading.Lock = TABLES_LOCKS.setdefault(
-                    qualified_table_name, threading.Lock()
-                )
-        elif file_path.endswith("jsonl"):
-            # NOTE: loading JSON does not work in practice on duckdb: the missing keys fail the load instead of being interpreted as NULL
-            source_format = "JSON"  # newline delimited, compression auto
-            options = ", COMPRESSION GZIP" if FileStorage.is_gzipped(file_path) else ""
-            lock = None
-        else:
-            raise ValueError(file_path)
+        lock: threading.Lock = None
+        statements: List[str] = []
+        for file_path in file_paths:
+            if file_path.endswith("parquet"):
+                source_format = "PARQUET"
+                options = ""
+                # lock when creating a new lock
+                with PARQUET_TABLE_LOCK:
+                    # create or get lock per table name
+                    lock = TABLES_LOCKS.setdefault(qualified_table_name, threading.Lock())
+            elif file_path.endswith("jsonl"):
+                # NOTE: loading JSON does not work in practice on duckdb: the missing keys fail the load instead of being interpreted as NULL
+                source_format = "JSON"  # newline delimited, compression auto
+                options = ", COMPRESSION GZIP" if FileStorage.is_gzipped(file_path) else ""
+            else:
+                raise ValueError(file_path)
+            statements.append(
+                f"COPY {qualified_table_name} FROM '{file_path}' ( FORMAT"
+                f" {source_format} {options});"
+            )
 
         with maybe_context(lock):
             with sql_client.begin_transaction():
-                sql_client.execute_sql(
-                    f"COPY {qualified_table_name} FROM '{file_path}' ( FORMAT"
-                    f" {source_format} {options});"
-                )
+                for statement in statements:
+                    sql_client.execute_sql(statement)
 
     def state(self) -> TLoadJobState:
         return "completed"
@@ -150,8 +165,9 @@ class DuckDbCopyJob(LoadJob, FollowupJob):
         raise NotImplementedError()
 
 
-class DuckDbClient(InsertValuesJobClient):
+class DuckDbClient(InsertValuesJobClient, SupportsMultiFileLoad):
     capabilities: ClassVar[DestinationCapabilitiesContext] = capabilities()
+    multi_file_load_formats: ClassVar[Sequence[TLoaderFileFormat]] = ("parquet", "jsonl")
 
     def __init__(self, schema: Schema, config: DuckDbClientConfiguration) -> None:
         sql_client = DuckDbSqlClient(config.normalize_dataset_name(schema), config.credentials)
@@ -167,6 +183,15 @@ class DuckDbClient(InsertValuesJobClient):
             job = DuckDbCopyJob(table["name"], file_path, self.sql_client)
         return job
 
+    def start_file_loads(
+        self, table: TTableSchema, file_paths: Sequence[str], load_id: str
+    ) -> List[LoadJob]:
+        DuckDbCopyJob.copy_files(table["name"], file_paths, self.sql_client)
+        return [
+            DuckDbCopyJob(table["name"], file_path, self.sql_client, copy_file=False)
+            for file_path in file_paths
+        ]
+
     def _get_column_def_sql(self, c: TColumnSchema, table_format: TTableFormat = None) -> str:
         hints_str = " ".join(
             self.active_hints.get(h, "")
@@ -11,7 +11,8 @@ import json
 import dlt
 from dlt.common import logger
 from dlt.common.schema import Schema, TSchemaTables, TTableSchema
-from dlt.common.storages import FileStorage, fsspec_from_config
+from dlt.common.storages import FileStorage, fsspec_from_config_pooled
+from dlt.common.storages.fsspec_filesystem import evict_fsspec_from_pool
 from dlt.common.destination import DestinationCapabilitiesContext
 from dlt.common.destination.reference import (
     NewLoadJob,
@@ -41,6 +42,7 @@ class LoadFilesystemJob(LoadJob):
         config: FilesystemDestinationClientConfiguration,
         schema_name: str,
         load_id: str,
+        fs_client: AbstractFileSystem = None,
     ) -> None:
         file_name = FileStorage.get_file_name_from_file_path(local_path)
         self.config = config
@@ -56,18 +58,16 @@ class LoadFilesystemJob(LoadJob):
         )
 
         super().__init__(file_name)
-        fs_client, _ = fsspec_from_config(config)
-        self.destination_file_name = path_utils.create_path(
-            config.layout,
-            file_name,
-            schema_name,
-            load_id,
-            current_datetime=config.current_datetime,
-            load_package_timestamp=dlt.current.load_package()["state"]["created_at"],  # type: ignore
-            extra_placeholders=config.extra_placeholders,
-        )
+        # reuse client of the job client, otherwise take one from the pool
+        if fs_client is None:
+            fs_client, _ = fsspec_from_config_pooled(config)
         item = self.make_remote_path()
-        fs_client.put_file(local_path, item)
+        try:
+            fs_client.put_file(local_path, item)
+        except PermissionError:
+            # credentials may have expired, do not reuse the pooled instance
+            evict_fsspec_from_pool(config)
+            raise
 
     def make_remote_path(self) -> str:
         return (
@@ -101,7 +101,7 @@ class FilesystemClient(JobClientBase, WithStagingDataset, WithStateSync):
 
     def __init__(self, schema: Schema, config: FilesystemDestinationClientConfiguration) -> None:
         super().__init__(schema, config)
-        self.fs_client, self.fs_path = fsspec_from_config(config)
+        self.fs_client, self.fs_path = fsspec_from_config_pooled(config)
         self.config: FilesystemDestinationClientConfiguration = config
         # verify files layout. we need {table_name} and only allow {schema_name} before it, otherwise tables
         # cannot be replaced and we cannot initialize folders consistently
@@ -233,6 +233,7 @@ class FilesystemClient(JobClientBase, WithStagingDataset, WithStateSync):
             config=self.config,
             schema_name=self.schema.name,
             load_id=load_id,
+            fs_client=self.fs_client,
         )
 
     def restore_file_load(self, file_path: str) -> LoadJob:
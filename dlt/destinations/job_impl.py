@@ -1,7 +1,7 @@
 from abc import ABC, abstractmethod
 import os
 import tempfile  # noqa: 251
-from typing import Dict, Iterable, List
+from typing import Any, Dict, Iterable, List, Tuple
 
 from dlt.common.json import json
 from dlt.common.destination.reference import NewLoadJob, FollowupJob, TLoadJobState, LoadJob
@@ -79,7 +79,7 @@ class DestinationLoadJob(LoadJob, ABC):
         file_path: str,
         config: CustomDestinationClientConfiguration,
         schema: Schema,
-        destination_state: Dict[str, int],
+        destination_state: Dict[str, Any],
         destination_callable: TDestinationCallable,
         skipped_columns: List[str],
     ) -> None:
@@ -92,6 +92,7 @@ class DestinationLoadJob(LoadJob, ABC):
         self._callable = destination_callable
         self._state: TLoadJobState = "running"
         self._storage_id = f"{self._parsed_file_name.table_name}.{self._parsed_file_name.file_id}"
+        self._destination_state = destination_state
         self.skipped_columns = skipped_columns
         try:
             if self._config.batch_size == 0:
@@ -155,24 +156,54 @@ class DestinationParquetLoadJob(DestinationLoadJob):
 
 class DestinationJsonlLoadJob(DestinationLoadJob):
     def run(self, start_index: int) -> Iterable[TDataItems]:
+        """Parses the file line by line and yields items in batches of `batch_size`.
+
+        The byte offset of the line holding the next item to be loaded is kept in destination state
+        so a restarted job seeks straight to it instead of parsing the file from the beginning.
+        """
         current_batch: TDataItems = []
+        line_offset, line_index = self._restore_line_position(start_index)
 
         # stream items
-        with FileStorage.open_zipsafe_ro(self._file_path) as f:
-            encoded_json = json.typed_loads(f.read())
-            if isinstance(encoded_json, dict):
-                encoded_json = [encoded_json]
-
-            for item in encoded_json:
-                # find correct start position
-                if start_index > 0:
-                    start_index -= 1
+        with FileStorage.open_zipsafe_ro(self._file_path, "rb") as f:
+            f.seek(line_offset)
+            for line in f:
+                if not line.strip():
+                    line_offset += len(line)
                     continue
-                # skip internal columns
-                for column in self.skipped_columns:
-                    item.pop(column, None)
-                current_batch.append(item)
-                if len(current_batch) == self._config.batch_size:
-                    yield current_batch
-                    current_batch = []
+                # a line contains a single item or a list of items (typed-jsonl)
+                encoded_json = json.typed_loadb(line)
+                if isinstance(encoded_json, dict):
+                    encoded_json = [encoded_json]
+
+                for item_index, item in enumerate(encoded_json, line_index):
+                    # find correct start position
+                    if item_index < start_index:
+                        continue
+                    # skip internal columns
+                    for column in self.skipped_columns:
+                        item.pop(column, None)
+                    current_batch.append(item)
+                    if len(current_batch) == self._config.batch_size:
+                        yield current_batch
+                        current_batch = []
+                        # batch was processed, the next item is in the current line or after it
+                        self._save_line_position(line_offset, line_index)
+                line_offset += len(line)
+                line_index += len(encoded_json)
             yield current_batch
+
+    @property
+    def _offset_storage_id(self) -> str:
+        return f"{self._storage_id}.offset"
+
+    def _restore_line_position(self, start_index: int) -> Tuple[int, int]:
+        """Returns byte offset and index of the first item of a line to resume from"""
+        line_offset, line_index = self._destination_state.get(self._offset_storage_id, (0, 0))
+        # position must point to a line before the item to resume from
+        if line_index > start_index:
+            return 0, 0
+        return line_offset, line_index
+
+    def _save_line_position(self, line_offset: int, line_index: int) -> None:
+        self._destination_state[self._offset_storage_id] = [line_offset, line_index]
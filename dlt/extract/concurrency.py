@@ -1,11 +1,11 @@
 import asyncio
 from concurrent.futures import (
     ThreadPoolExecutor,
-    as_completed,
+    TimeoutError as FutureTimeoutError,
     wait as wait_for_futures,
 )
-from threading import Thread
-from typing import Awaitable, Dict, Optional
+from threading import Condition, Thread
+from typing import Awaitable, Dict, List, Optional
 
 from dlt.common.exceptions import PipelineException
 from dlt.common.configuration.container import Container
@@ -24,6 +24,7 @@ class FuturesPool:
     """Worker pool for pipe items that can be resolved asynchronously.
 
     Items can be either asyncio coroutines or regular callables which will be executed in a thread pool.
+    Completion of futures is signalled via condition so waiting for results or free slots does not poll.
     """
 
     def __init__(
@@ -37,6 +38,10 @@ class FuturesPool:
         self.poll_interval = poll_interval
         self.max_parallel_items = max_parallel_items
         self.used_slots: int = 0
+        # notified each time a future completes
+        self._futures_done = Condition()
+        # number of futures that are done but were not yet resolved
+        self._done_count: int = 0
 
     def __len__(self) -> int:
         return len(self.futures)
@@ -81,9 +86,12 @@ class FuturesPool:
         # start or return async pool
         return self._async_pool
 
-    def _vacate_slot(self, _: TItemFuture) -> None:
-        # Used as callback to free up slot when future is done
-        self.used_slots -= 1
+    def _on_future_done(self, _: TItemFuture) -> None:
+        # Used as callback to free up slot and wake up waiting threads when future is done
+        with self._futures_done:
+            self.used_slots -= 1
+            self._done_count += 1
+            self._futures_done.notify_all()
 
     def submit(self, pipe_item: ResolvablePipeItem) -> TItemFuture:
         """Submit an item to the pool.
@@ -115,14 +123,14 @@ class FuturesPool:
         else:
             raise ValueError(f"Unsupported item type: {type(item)}")
 
-        # Future is not removed from self.futures until it's been consumed by the
-        # pipe iterator. But we always want to vacate a slot so new jobs can be submitted
-        future.add_done_callback(self._vacate_slot)
-        self.used_slots += 1
-
         self.futures[future] = FuturePipeItem(
             future, pipe_item.step, pipe_item.pipe, pipe_item.meta
         )
+        with self._futures_done:
+            self.used_slots += 1
+        # Future is not removed from self.futures until it's been consumed by the
+        # pipe iterator. But we always want to vacate a slot so new jobs can be submitted
+        future.add_done_callback(self._on_future_done)
         return future
 
     def sleep(self) -> None:
@@ -130,6 +138,8 @@ class FuturesPool:
 
     def _resolve_future(self, future: TItemFuture) -> Optional[ResolvablePipeItem]:
         future, step, pipe, meta = self.futures.pop(future)
+        with self._futures_done:
+            self._done_count -= 1
 
         if ex := future.exception():
             if isinstance(ex, StopAsyncIteration):
@@ -151,8 +161,25 @@ class FuturesPool:
             return ResolvablePipeItem(item, step, pipe, meta)
 
     def _next_done_future(self) -> Optional[TItemFuture]:
-        """Get the done future in the pool (if any). This does not block."""
-        return next((fut for fut in self.futures if fut.done() and not fut.cancelled()), None)
+        """Get the done future in the pool (if any). This does not block. Cancelled futures
+        are removed from the pool.
+        """
+        if self._done_count == 0:
+            return None
+        cancelled: List[TItemFuture] = []
+        done_future: TItemFuture = None
+        for fut in self.futures:
+            if fut.done():
+                if not fut.cancelled():
+                    done_future = fut
+                    break
+                cancelled.append(fut)
+        if cancelled:
+            for fut in cancelled:
+                self.futures.pop(fut)
+            with self._futures_done:
+                self._done_count -= len(cancelled)
+        return done_future
 
     def resolve_next_future(
         self, use_configured_timeout: bool = False
@@ -169,19 +196,20 @@ class FuturesPool:
         if not self.futures:
             return None
 
-        if (future := self._next_done_future()) is not None:
+        while True:
+            with self._futures_done:
+                if not self._futures_done.wait_for(
+                    lambda: self._done_count > 0,
+                    timeout=self.poll_interval if use_configured_timeout else None,
+                ):
+                    raise FutureTimeoutError()
             # When there are multiple already done futures from the same pipe we return results in insertion order
-            return self._resolve_future(future)
-        for future in as_completed(
-            self.futures, timeout=self.poll_interval if use_configured_timeout else None
-        ):
-            if future.cancelled():
-                # Get the next not-cancelled future
-                continue
-
-            return self._resolve_future(future)
-
-        return None
+            future = self._next_done_future()
+            if future:
+                return self._resolve_future(future)
+            # only cancelled futures were done, wait for the remaining ones
+            if not self.futures:
+                return None
 
     def resolve_next_future_no_wait(self) -> Optional[ResolvablePipeItem]:
         """Resolve the first done future in the pool.
@@ -196,17 +224,8 @@ class FuturesPool:
 
     def _wait_for_free_slot(self) -> None:
         """Wait until any future in the pool is completed to ensure there's a free slot."""
-        if self.free_slots >= 1:
-            return
-
-        for future in as_completed(self.futures):
-            if future.cancelled():
-                # Get the next not-cancelled future
-                continue
-            if self.free_slots == 0:
-                # Future was already completed so slot was not freed
-                continue
-            return  # Return when first future completes
+        with self._futures_done:
+            self._futures_done.wait_for(lambda: self.free_slots >= 1)
 
     def close(self) -> None:
         # Cancel all futures
@@ -218,6 +237,9 @@ class FuturesPool:
             loop.stop()
 
         if self._async_pool:
+            # cancel tasks still running in the loop ie. prefetching from async generators
+            future = asyncio.run_coroutine_threadsafe(_cancel_pending_tasks(), self._async_pool)
+            wait_for_futures([future])
             # wait for all async generators to be closed
             future = asyncio.run_coroutine_threadsafe(
                 self._async_pool.shutdown_asyncgens(), self._ensure_async_pool()
@@ -235,3 +257,12 @@ class FuturesPool:
             self._thread_pool = None
 
         self.futures.clear()
+        self._done_count = 0
+
+
+async def _cancel_pending_tasks() -> None:
+    current = asyncio.current_task()
+    tasks = [task for task in asyncio.all_tasks() if task is not current]
+    for task in tasks:
+        task.cancel()
+    await asyncio.gather(*tasks, return_exceptions=True)
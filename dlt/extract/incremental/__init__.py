@@ -43,6 +43,8 @@ from dlt.extract.incremental.transform import (
     JsonIncremental,
     ArrowIncremental,
     IncrementalTransform,
+    pack_unique_hashes,
+    unpack_unique_hashes,
 )
 
 try:
@@ -170,7 +172,7 @@ class Incremental(ItemTransform[TDataItem], BaseConfiguration, Generic[TCursorVa
                 self.end_value,
                 self.last_value_func,
                 self._primary_key,
-                set(self._cached_state["unique_hashes"]),
+                unpack_unique_hashes(self._cached_state["unique_hashes"]),
             )
 
     @classmethod
@@ -475,7 +477,7 @@ class Incremental(ItemTransform[TDataItem], BaseConfiguration, Generic[TCursorVa
             )
             # add directly computed hashes
             unique_hashes.update(transformer.unique_hashes)
-            self._cached_state["unique_hashes"] = list(unique_hashes)
+            self._cached_state["unique_hashes"] = pack_unique_hashes(unique_hashes)
 
         return rows
 
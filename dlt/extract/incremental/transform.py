@@ -1,5 +1,5 @@
 from datetime import datetime, date  # noqa: I251
-from typing import Any, Optional, Set, Tuple, List
+from typing import TYPE_CHECKING, Any, Iterable, Optional, Set, Tuple, List, Union
 
 from dlt.common.exceptions import MissingDependencyException
 from dlt.common.utils import digest128
@@ -17,15 +17,16 @@ from dlt.extract.items import TTableHintTemplate
 from dlt.common.schema.typing import TColumnNames
 
 try:
-    from dlt.common.libs import pyarrow
     from dlt.common.libs.numpy import numpy
     from dlt.common.libs.pyarrow import pyarrow as pa, TAnyArrowItem
     from dlt.common.libs.pyarrow import from_arrow_scalar, to_arrow_scalar
 except MissingDependencyException:
     pa = None
-    pyarrow = None
     numpy = None
 
+if TYPE_CHECKING:
+    import numpy.typing as npt
+
 # NOTE: always import pandas independently from pyarrow
 try:
     from dlt.common.libs.pandas import pandas, pandas_to_arrow
@@ -33,6 +34,34 @@ except MissingDependencyException:
     pandas = None
 
 
+UNIQUE_HASH_LENGTH = 20
+"""Length of the `digest128` hash of a row"""
+UNIQUE_HASHES_PACK_THRESHOLD = 100
+"""Unique hashes are stored in the state as a single string when there are more of them"""
+
+
+def pack_unique_hashes(unique_hashes: Iterable[str]) -> Union[List[str], str]:
+    """Converts `unique_hashes` into the form kept in the incremental state. Many hashes of
+    the same length are concatenated into a single string which is much faster to serialize
+    """
+    unique_hashes = list(unique_hashes)
+    if len(unique_hashes) > UNIQUE_HASHES_PACK_THRESHOLD and all(
+        len(unique_hash) == UNIQUE_HASH_LENGTH for unique_hash in unique_hashes
+    ):
+        return "".join(unique_hashes)
+    return unique_hashes
+
+
+def unpack_unique_hashes(unique_hashes: Union[List[str], str]) -> Set[str]:
+    """Converts unique hashes from the incremental state, in any of its forms, into a set"""
+    if isinstance(unique_hashes, str):
+        return {
+            unique_hashes[i : i + UNIQUE_HASH_LENGTH]
+            for i in range(0, len(unique_hashes), UNIQUE_HASH_LENGTH)
+        }
+    return set(unique_hashes)
+
+
 class IncrementalTransform:
     def __init__(
         self,
@@ -191,32 +220,34 @@ class JsonIncremental(IncrementalTransform):
 
 
 class ArrowIncremental(IncrementalTransform):
-    _dlt_index = "_dlt_index"
-
-    def compute_unique_values(self, item: "TAnyArrowItem", unique_columns: List[str]) -> List[str]:
-        if not unique_columns:
-            return []
-        rows = item.select(unique_columns).to_pylist()
-        return [self.compute_unique_value(row, self.primary_key) for row in rows]
-
-    def compute_unique_values_with_index(
-        self, item: "TAnyArrowItem", unique_columns: List[str]
-    ) -> List[Tuple[int, str]]:
-        if not unique_columns:
+    def compute_unique_values(
+        self,
+        item: "TAnyArrowItem",
+        unique_columns: List[str],
+        primary_key: Optional[TColumnNames],
+    ) -> List[str]:
+        """Computes unique hashes of all rows in `item` for resolved `primary_key`. Values are read
+        column wise and hashed exactly like `compute_unique_value` does for python rows.
+        """
+        if not unique_columns or item.num_rows == 0:
             return []
-        indices = item[self._dlt_index].to_pylist()
-        rows = item.select(unique_columns).to_pylist()
+        columns = [item[column].to_pylist() for column in unique_columns]
+        dumps = json.dumps
+        if isinstance(primary_key, str):
+            return [digest128(dumps(value, sort_keys=True)) for value in columns[0]]
+        if primary_key:
+            return [digest128(dumps(list(values), sort_keys=True)) for values in zip(*columns)]
         return [
-            (index, self.compute_unique_value(row, self.primary_key))
-            for index, row in zip(indices, rows)
+            digest128(dumps(dict(zip(unique_columns, values)), sort_keys=True))
+            for values in zip(*columns)
         ]
 
-    def _add_unique_index(self, tbl: "pa.Table") -> "pa.Table":
-        """Creates unique index if necessary."""
-        # create unique index if necessary
-        if self._dlt_index not in tbl.schema.names:
-            tbl = pyarrow.append_column(tbl, self._dlt_index, pa.array(numpy.arange(tbl.num_rows)))
-        return tbl
+    @staticmethod
+    def _scatter_mask(mask: Any, values: List[bool]) -> "npt.NDArray[numpy.bool_]":
+        """Returns a numpy bool mask of `mask` length with `values` set at positions where `mask` is True"""
+        np_mask = numpy.zeros(len(mask), dtype=bool)
+        np_mask[numpy.flatnonzero(numpy.asarray(mask))] = values
+        return np_mask
 
     def __call__(
         self,
@@ -237,9 +268,6 @@ class ArrowIncremental(IncrementalTransform):
             for pk in unique_columns:
                 if pk not in tbl.schema.names:
                     raise IncrementalPrimaryKeyMissing(self.resource_name, pk, tbl)
-            # use primary key as unique index
-            if isinstance(primary_key, str):
-                self._dlt_index = primary_key
         elif primary_key is None:
             unique_columns = tbl.schema.names
 
@@ -294,24 +322,23 @@ class ArrowIncremental(IncrementalTransform):
             keep_filter = last_value_compare(tbl[cursor_path], start_value_scalar)
             start_out_of_range = bool(pa.compute.any(pa.compute.invert(keep_filter)).as_py())
             tbl = tbl.filter(keep_filter)
-            if not self.deduplication_disabled:
-                # Deduplicate after filtering old values
-                tbl = self._add_unique_index(tbl)
+            if not self.deduplication_disabled and self.start_unique_hashes:
                 # Remove already processed rows where the cursor is equal to the start value
-                eq_rows = tbl.filter(pa.compute.equal(tbl[cursor_path], start_value_scalar))
-                # compute index, unique hash mapping
-                unique_values_index = self.compute_unique_values_with_index(eq_rows, unique_columns)
-                unique_values_index = [
-                    (i, uq_val)
-                    for i, uq_val in unique_values_index
-                    if uq_val in self.start_unique_hashes
-                ]
-                # find rows with unique ids that were stored from previous run
-                remove_idx = pa.array(i for i, _ in unique_values_index)
-                # Filter the table
-                tbl = tbl.filter(
-                    pa.compute.invert(pa.compute.is_in(tbl[self._dlt_index], remove_idx))
+                eq_filter = pa.compute.fill_null(
+                    pa.compute.equal(tbl[cursor_path], start_value_scalar), False
                 )
+                eq_rows = tbl.filter(eq_filter)
+                if eq_rows.num_rows > 0:
+                    start_unique_hashes = self.start_unique_hashes
+                    # find rows with unique ids that were stored from previous run
+                    is_duplicate = [
+                        uq_val in start_unique_hashes
+                        for uq_val in self.compute_unique_values(
+                            eq_rows, unique_columns, primary_key
+                        )
+                    ]
+                    if any(is_duplicate):
+                        tbl = tbl.filter(pa.array(~self._scatter_mask(eq_filter, is_duplicate)))
 
         if (
             self.last_value is None
@@ -326,25 +353,21 @@ class ArrowIncremental(IncrementalTransform):
                     self.compute_unique_values(
                         tbl.filter(pa.compute.equal(tbl[cursor_path], row_value_scalar)),
                         unique_columns,
+                        primary_key,
                     )
                 )
         elif self.last_value == row_value and not self.deduplication_disabled:
             # last value is unchanged, add the hashes
             self.unique_hashes.update(
-                set(
-                    self.compute_unique_values(
-                        tbl.filter(pa.compute.equal(tbl[cursor_path], row_value_scalar)),
-                        unique_columns,
-                    )
+                self.compute_unique_values(
+                    tbl.filter(pa.compute.equal(tbl[cursor_path], row_value_scalar)),
+                    unique_columns,
+                    primary_key,
                 )
             )
 
         if len(tbl) == 0:
             return None, start_out_of_range, end_out_of_range
-        try:
-            tbl = pyarrow.remove_columns(tbl, ["_dlt_index"])
-        except KeyError:
-            pass
         if is_pandas:
             return tbl.to_pandas(), start_out_of_range, end_out_of_range
         return tbl, start_out_of_range, end_out_of_range
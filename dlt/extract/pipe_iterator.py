@@ -38,7 +38,7 @@ from dlt.extract.exceptions import (
 )
 from dlt.extract.pipe import Pipe
 from dlt.extract.items import DataItemWithMeta, PipeItem, ResolvablePipeItem, SourcePipeItem
-from dlt.extract.utils import wrap_async_iterator
+from dlt.extract.utils import is_parallel_iterator, wrap_async_iterator, wrap_parallel_iterator
 from dlt.extract.concurrency import FuturesPool
 
 TPipeNextItemMode = Literal["fifo", "round_robin"]
@@ -52,6 +52,8 @@ class PipeIterator(Iterator[PipeItem]):
         futures_poll_interval: float = 0.01
         copy_on_fork: bool = False
         next_item_mode: str = "fifo"
+        parallelize_generators: bool = False
+        """Evaluates generators of all independent resources in the worker pool"""
 
         __section__: ClassVar[str] = known_sections.EXTRACT
 
@@ -110,6 +112,7 @@ class PipeIterator(Iterator[PipeItem]):
         futures_poll_interval: float = 0.01,
         copy_on_fork: bool = False,
         next_item_mode: TPipeNextItemMode = "fifo",
+        parallelize_generators: bool = False,
     ) -> "PipeIterator":
         # print(f"max_parallel_items: {max_parallel_items} workers: {workers}")
         sources: List[SourcePipeItem] = []
@@ -134,7 +137,15 @@ class PipeIterator(Iterator[PipeItem]):
                     raise PipeGenInvalid(pipe.name, pipe.gen)
                 # add every head as source only once
                 if not any(i.pipe == pipe for i in sources):
-                    sources.append(SourcePipeItem(pipe.gen, 0, pipe, None))
+                    gen = pipe.gen
+                    # generators are evaluated in the pool so resources extract concurrently
+                    if (
+                        parallelize_generators
+                        and inspect.isgenerator(gen)
+                        and not is_parallel_iterator(gen)
+                    ):
+                        gen = wrap_parallel_iterator(gen)
+                    sources.append(SourcePipeItem(gen, 0, pipe, None))
 
         # reverse pipes for current mode, as we start processing from the back
         pipes.reverse()
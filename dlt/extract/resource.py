@@ -330,24 +330,20 @@ class DltResource(Iterable[TDataItem], DltResourceHints):
                 return
 
             count = 0
-            is_async_gen = False
             if callable(gen):
                 gen = gen()  # type: ignore
 
-            # wrap async gen already here
+            # wrap async gen already here, awaitables return many items so limit is applied inside
             if isinstance(gen, AsyncIterator):
-                gen = wrap_async_iterator(gen)
-                is_async_gen = True
+                yield from wrap_async_iterator(gen, max_items=max_items)
+                return
 
             try:
                 for i in gen:  # type: ignore # TODO: help me fix this later
                     yield i
                     if i is not None:
                         count += 1
-                        # async gen yields awaitable so we must count one awaitable more
-                        # so the previous one is evaluated and yielded.
-                        # new awaitable will be cancelled
-                        if count == max_items + int(is_async_gen):
+                        if count == max_items:
                             return
             finally:
                 if inspect.isgenerator(gen):
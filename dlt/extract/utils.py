@@ -15,7 +15,9 @@ from typing import (
     Awaitable,
     Generator,
     Iterator,
+    Deque,
 )
+from collections import deque
 from collections.abc import Mapping as C_Mapping
 from functools import wraps, partial
 
@@ -176,27 +178,79 @@ def check_compat_transformer(name: str, f: AnyFun, sig: inspect.Signature) -> in
     return meta_arg
 
 
+class _AsyncIteratorEnd:
+    """Marks the end of async iterator in the prefetch queue"""
+
+    __slots__ = ("ex",)
+
+    def __init__(self, ex: BaseException) -> None:
+        self.ex = ex
+
+
 def wrap_async_iterator(
-    gen: AsyncIterator[TDataItems],
-) -> Generator[Awaitable[TDataItems], None, None]:
-    """Wraps an async generator into a list of awaitables"""
+    gen: AsyncIterator[TDataItems], max_prefetched_items: int = 100, max_items: int = -1
+) -> Generator[Union[Awaitable[TDataItems], TDataItems], None, None]:
+    """Wraps an async generator into a list of awaitables
+
+    The async generator is consumed by a task in the event loop that runs the awaitables, prefetching up
+    to `max_prefetched_items`. Each awaitable takes all items prefetched so far so items are handed over
+    from the event loop in batches: the first item is returned by the awaitable and the remaining ones
+    are yielded directly by this generator, one by one and in order. Stops after `max_items` are taken
+    from the async generator if not negative.
+    """
     exhausted = False
     busy = False
+    # items taken from the prefetch queue that were not yet returned
+    prefetched: Deque[TDataItems] = deque()
+    queue: "asyncio.Queue[Any]" = None
+    producer: "asyncio.Task[None]" = None
+    # StopAsyncIteration or exception that ended the async generator
+    end_ex: BaseException = None
+
+    async def produce() -> None:
+        count = 0
+        try:
+            while count != max_items:
+                await queue.put(await gen.__anext__())
+                count += 1
+            raise StopAsyncIteration()
+        except asyncio.CancelledError:
+            # do not leave consumer waiting for items
+            if not queue.full():
+                queue.put_nowait(_AsyncIteratorEnd(StopAsyncIteration()))
+            raise
+        except BaseException as ex:
+            await queue.put(_AsyncIteratorEnd(ex))
 
-    # creates an awaitable that will return the next item from the async generator
+    # creates an awaitable that will return the next items from the async generator
     async def run() -> TDataItems:
-        nonlocal exhausted
+        nonlocal exhausted, queue, producer, end_ex
         try:
             # if marked exhausted by the main thread and we are wrapping a generator
             # we can close it here
             if exhausted:
                 raise StopAsyncIteration()
-            item = await gen.__anext__()
-            return item
+            if end_ex is not None:
+                raise end_ex
+            if producer is None:
+                queue = asyncio.Queue(maxsize=max_prefetched_items)
+                producer = asyncio.get_running_loop().create_task(produce())
+            items = [await queue.get()]
+            while not queue.empty():
+                items.append(queue.get_nowait())
+            if isinstance(items[-1], _AsyncIteratorEnd):
+                end_ex = items.pop().ex
+                if not items:
+                    raise end_ex
+            # remaining items are yielded by the wrapping generator before next awaitable is created
+            prefetched.extend(items[1:])
+            return items[0]
         # on stop iteration mark as exhausted
         # also called when futures are cancelled
-        except StopAsyncIteration:
+        except (StopAsyncIteration, asyncio.CancelledError):
             exhausted = True
+            if producer is not None:
+                producer.cancel()
             raise
         finally:
             nonlocal busy
@@ -207,12 +261,51 @@ def wrap_async_iterator(
         while not exhausted:
             while busy:
                 yield None
+            if prefetched:
+                yield prefetched.popleft()
+                continue
             busy = True
             yield run()
     # this gets called from the main thread when the wrapping generater is closed
     except GeneratorExit:
         # mark as exhausted
         exhausted = True
+        if producer is not None and not producer.get_loop().is_closed():
+            producer.get_loop().call_soon_threadsafe(producer.cancel)
+
+
+def _parallel_iterator(gen: Iterator[TDataItems]) -> Iterator[TDataItems]:
+    """Yields functions returning next item from `gen`, one at a time, so they can be evaluated in the
+    worker pool. Yields None while an item is being evaluated.
+    """
+    exhausted = False
+    busy = False
+
+    def _parallel_gen() -> TDataItems:
+        nonlocal busy
+        nonlocal exhausted
+        try:
+            return next(gen)
+        except StopIteration:
+            exhausted = True
+            return None
+        finally:
+            busy = False
+
+    while not exhausted:
+        try:
+            while busy:
+                yield None
+            busy = True
+            yield _parallel_gen
+        except GeneratorExit:
+            gen.close()  # type: ignore[attr-defined]
+            raise
+
+
+def is_parallel_iterator(gen: Any) -> bool:
+    """Checks if `gen` is a generator wrapped for parallel extraction"""
+    return inspect.isgenerator(gen) and gen.gi_code is _parallel_iterator.__code__
 
 
 def wrap_parallel_iterator(f: TAnyFunOrGenerator) -> TAnyFunOrGenerator:
@@ -224,30 +317,7 @@ def wrap_parallel_iterator(f: TAnyFunOrGenerator) -> TAnyFunOrGenerator:
             gen = f(*args, **kwargs)
         else:
             gen = f
-
-        exhausted = False
-        busy = False
-
-        def _parallel_gen() -> TDataItems:
-            nonlocal busy
-            nonlocal exhausted
-            try:
-                return next(gen)  # type: ignore[call-overload]
-            except StopIteration:
-                exhausted = True
-                return None
-            finally:
-                busy = False
-
-        while not exhausted:
-            try:
-                while busy:
-                    yield None
-                busy = True
-                yield _parallel_gen
-            except GeneratorExit:
-                gen.close()  # type: ignore[attr-defined]
-                raise
+        return _parallel_iterator(gen)  # type: ignore[arg-type]
 
     if callable(f):
         if inspect.isgeneratorfunction(inspect.unwrap(f)):
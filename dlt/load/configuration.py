@@ -14,6 +14,10 @@ class LoaderConfiguration(PoolRunnerConfiguration):
     """when True, raises on terminally failed jobs immediately"""
     raise_on_max_retries: int = 5
     """When gt 0 will raise when job reaches raise_on_max_retries"""
+    job_client_max_idle_time: float = 30.0
+    """How long opened destination clients are kept for reuse by load jobs, in seconds. 0 disables reuse"""
+    max_files_per_load_job: int = 50
+    """How many files of the same table and format may be loaded in a single job by destinations that support it (currently only duckdb). 1 disables grouping"""
     _load_storage_config: LoadStorageConfiguration = None
 
     def on_resolved(self) -> None:
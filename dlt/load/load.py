@@ -1,12 +1,13 @@
 import contextlib
-from functools import reduce
 import datetime  # noqa: 251
-from typing import Dict, List, Optional, Tuple, Set, Iterator, Iterable
-from concurrent.futures import Executor
+from typing import Dict, List, Optional, Sequence, Tuple, Set, Iterator, Iterable
+from concurrent.futures import Executor, Future, wait as wait_for_futures, FIRST_COMPLETED
 import os
+import threading
+import time
 
 from dlt.common import logger
-from dlt.common.runtime.signals import sleep
+from dlt.common.runtime.signals import sleep, raise_if_signalled
 from dlt.common.configuration import with_config, known_sections
 from dlt.common.configuration.resolve import inject_section
 from dlt.common.configuration.accessors import config
@@ -16,6 +17,7 @@ from dlt.common.pipeline import (
     SupportsPipeline,
     WithStepInfo,
 )
+from dlt.common.schema.typing import TTableSchema
 from dlt.common.schema.utils import get_top_level_table
 from dlt.common.storages.load_storage import LoadPackageInfo, ParsedLoadJobFileName, TJobState
 from dlt.common.storages.load_package import LoadPackageStateInjectableContext
@@ -25,6 +27,7 @@ from dlt.common.logger import pretty_format_exception
 from dlt.common.exceptions import TerminalValueError
 from dlt.common.configuration.container import Container
 from dlt.common.schema import Schema
+from dlt.common.destination import TLoaderFileFormat
 from dlt.common.storages import LoadStorage
 from dlt.common.destination.reference import (
     DestinationClientDwhConfiguration,
@@ -37,6 +40,7 @@ from dlt.common.destination.reference import (
     TLoadJobState,
     DestinationClientConfiguration,
     SupportsStagingDestination,
+    SupportsMultiFileLoad,
     TDestination,
 )
 from dlt.common.destination.exceptions import (
@@ -45,6 +49,7 @@ from dlt.common.destination.exceptions import (
 )
 
 from dlt.destinations.job_impl import EmptyLoadJob
+from dlt.destinations.job_client_impl import SqlJobClientBase
 
 from dlt.load.configuration import LoaderConfiguration
 from dlt.load.exceptions import (
@@ -58,6 +63,8 @@ from dlt.load.utils import get_completed_table_chain, init_client
 
 class Load(Runnable[Executor], WithStepInfo[LoadMetrics, LoadInfo]):
     pool: Executor
+    job_poll_interval: float = 1.0
+    """How long to wait for running jobs to change state, in seconds. Spooled jobs wake the loop up immediately"""
 
     @with_config(spec=LoaderConfiguration, sections=(known_sections.LOAD,))
     def __init__(
@@ -80,6 +87,9 @@ class Load(Runnable[Executor], WithStepInfo[LoadMetrics, LoadInfo]):
         self.pool = NullExecutor()
         self.load_storage: LoadStorage = self.create_storage(is_storage_owner)
         self._loaded_packages: List[LoadPackageInfo] = []
+        # opened clients idle in the pool with the time they were returned
+        self._idle_clients: Dict[Tuple[int, bool], List[Tuple[JobClientBase, float]]] = {}
+        self._idle_clients_lock = threading.Lock()
         super().__init__()
 
     def create_storage(self, is_storage_owner: bool) -> LoadStorage:
@@ -107,6 +117,74 @@ class Load(Runnable[Executor], WithStepInfo[LoadMetrics, LoadInfo]):
     def get_staging_destination_client(self, schema: Schema) -> JobClientBase:
         return self.staging_destination.client(schema, self.initial_staging_client_config)
 
+    @contextlib.contextmanager
+    def borrow_destination_client(
+        self, schema: Schema, staging: bool = False
+    ) -> Iterator[JobClientBase]:
+        """Lends an opened destination (or staging destination) client for `schema`, reusing a client
+        idle in the pool if possible. The client goes back to the pool when the block exits without
+        exception, otherwise it is closed.
+        """
+        max_idle_time = self.config.job_client_max_idle_time
+        key = (id(schema), staging)
+        client: JobClientBase = None
+        expired_clients: List[JobClientBase] = []
+        with self._idle_clients_lock:
+            idle_clients = self._idle_clients.get(key, [])
+            while idle_clients:
+                candidate, returned_at = idle_clients.pop()
+                if (
+                    time.monotonic() - returned_at <= max_idle_time
+                    and candidate.schema is schema
+                    and self._is_client_healthy(candidate)
+                ):
+                    client = candidate
+                    break
+                expired_clients.append(candidate)
+        for expired_client in expired_clients:
+            self._close_client(expired_client)
+        if client is None:
+            client = (
+                self.get_staging_destination_client(schema)
+                if staging
+                else self.get_destination_client(schema)
+            )
+            client.__enter__()
+        try:
+            yield client
+        except BaseException as exc:
+            # do not reuse clients that were used by failed jobs
+            client.__exit__(type(exc), exc, exc.__traceback__)
+            raise
+        if max_idle_time > 0:
+            with self._idle_clients_lock:
+                self._idle_clients.setdefault(key, []).append((client, time.monotonic()))
+        else:
+            client.__exit__(None, None, None)
+
+    def close_idle_clients(self) -> None:
+        """Closes all clients idle in the pool"""
+        with self._idle_clients_lock:
+            idle_clients = [
+                client for clients in self._idle_clients.values() for client, _ in clients
+            ]
+            self._idle_clients.clear()
+        for client in idle_clients:
+            self._close_client(client)
+
+    @staticmethod
+    def _is_client_healthy(client: JobClientBase) -> bool:
+        if isinstance(client, SqlJobClientBase):
+            return client.sql_client.native_connection is not None
+        return True
+
+    @staticmethod
+    def _close_client(client: JobClientBase) -> None:
+        try:
+            client.__exit__(None, None, None)
+        except Exception:
+            logger.exception(f"Could not close idle client {client}")
+
     def is_staging_destination_job(self, file_path: str) -> bool:
         return (
             self.staging_destination is not None
@@ -125,6 +203,37 @@ class Load(Runnable[Executor], WithStepInfo[LoadMetrics, LoadInfo]):
         else:
             yield
 
+    def _get_load_table(
+        self, client: JobClientBase, file_path: str, is_staging_destination_job: bool
+    ) -> Tuple[TTableSchema, bool]:
+        """Validates job in `file_path` and returns the table to load it to and a flag telling
+        if it should be loaded to the staging dataset
+        """
+        job_info = ParsedLoadJobFileName.parse(file_path)
+        if job_info.file_format not in self.load_storage.supported_job_file_formats:
+            raise LoadClientUnsupportedFileFormats(
+                job_info.file_format,
+                self.capabilities.supported_loader_file_formats,
+                file_path,
+            )
+        logger.info(f"Will load file {file_path} with table name {job_info.table_name}")
+        table = client.prepare_load_table(job_info.table_name)
+        if table["write_disposition"] not in ["append", "replace", "merge"]:
+            raise LoadClientUnsupportedWriteDisposition(
+                job_info.table_name, table["write_disposition"], file_path
+            )
+
+        job_client = self.get_destination_client(client.schema)
+        if is_staging_destination_job:
+            use_staging_dataset = isinstance(
+                job_client, SupportsStagingDestination
+            ) and job_client.should_load_data_to_staging_dataset_on_staging_destination(table)
+        else:
+            use_staging_dataset = isinstance(
+                job_client, WithStagingDataset
+            ) and job_client.should_load_data_to_staging_dataset(table)
+        return table, use_staging_dataset
+
     @staticmethod
     @workermethod
     def w_spool_job(
@@ -133,39 +242,11 @@ class Load(Runnable[Executor], WithStepInfo[LoadMetrics, LoadInfo]):
         job: LoadJob = None
         try:
             is_staging_destination_job = self.is_staging_destination_job(file_path)
-            job_client = self.get_destination_client(schema)
-
             # if we have a staging destination and the file is not a reference, send to staging
-            with (
-                self.get_staging_destination_client(schema)
-                if is_staging_destination_job
-                else job_client
-            ) as client:
-                job_info = ParsedLoadJobFileName.parse(file_path)
-                if job_info.file_format not in self.load_storage.supported_job_file_formats:
-                    raise LoadClientUnsupportedFileFormats(
-                        job_info.file_format,
-                        self.capabilities.supported_loader_file_formats,
-                        file_path,
-                    )
-                logger.info(f"Will load file {file_path} with table name {job_info.table_name}")
-                table = client.prepare_load_table(job_info.table_name)
-                if table["write_disposition"] not in ["append", "replace", "merge"]:
-                    raise LoadClientUnsupportedWriteDisposition(
-                        job_info.table_name, table["write_disposition"], file_path
-                    )
-
-                if is_staging_destination_job:
-                    use_staging_dataset = isinstance(
-                        job_client, SupportsStagingDestination
-                    ) and job_client.should_load_data_to_staging_dataset_on_staging_destination(
-                        table
-                    )
-                else:
-                    use_staging_dataset = isinstance(
-                        job_client, WithStagingDataset
-                    ) and job_client.should_load_data_to_staging_dataset(table)
-
+            with self.borrow_destination_client(schema, is_staging_destination_job) as client:
+                table, use_staging_dataset = self._get_load_table(
+                    client, file_path, is_staging_destination_job
+                )
                 with self.maybe_with_staging_dataset(client, use_staging_dataset):
                     job = client.start_file_load(
                         table,
@@ -189,20 +270,121 @@ class Load(Runnable[Executor], WithStepInfo[LoadMetrics, LoadInfo]):
         self.load_storage.normalized_packages.start_job(load_id, job.file_name())
         return job
 
-    def spool_new_jobs(self, load_id: str, schema: Schema) -> Tuple[int, List[LoadJob]]:
+    @staticmethod
+    @workermethod
+    def w_spool_jobs(
+        self: "Load", file_paths: Sequence[str], load_id: str, schema: Schema
+    ) -> List[LoadJob]:
+        """Starts jobs for `file_paths` that belong to the same table and have the same format with
+        a single load of all the files. Each file is still a separate job tracked in the package.
+        """
+        if len(file_paths) == 1:
+            return [Load.w_spool_job(self, file_paths[0], load_id, schema)]
+        jobs: List[LoadJob] = None
+        try:
+            with self.borrow_destination_client(schema) as client:
+                assert isinstance(client, SupportsMultiFileLoad)
+                table, use_staging_dataset = self._get_load_table(client, file_paths[0], False)
+                with self.maybe_with_staging_dataset(client, use_staging_dataset):
+                    jobs = client.start_file_loads(
+                        table,
+                        [
+                            self.load_storage.normalized_packages.storage.make_full_path(file_path)
+                            for file_path in file_paths
+                        ],
+                        load_id,
+                    )
+        except (DestinationTerminalException, TerminalValueError):
+            # start jobs one by one so only the jobs that cannot be started are failed
+            logger.exception(
+                f"Terminal problem when adding {len(file_paths)} jobs together, will add them one"
+                " by one"
+            )
+            return [Load.w_spool_job(self, file_path, load_id, schema) for file_path in file_paths]
+        except (DestinationTransientException, Exception):
+            # return no jobs so files stay in new jobs (root) folder
+            logger.exception(f"Temporary problem when adding {len(file_paths)} jobs together")
+            message = pretty_format_exception()
+            jobs = [
+                EmptyLoadJob.from_file_path(file_path, "retry", message) for file_path in file_paths
+            ]
+        for job in jobs:
+            self.load_storage.normalized_packages.start_job(load_id, job.file_name())
+        return jobs
+
+    def _get_multi_file_load_formats(self) -> Sequence[TLoaderFileFormat]:
+        client_class = self.destination.client_class
+        if self.config.max_files_per_load_job > 1 and issubclass(
+            client_class, SupportsMultiFileLoad
+        ):
+            return client_class.multi_file_load_formats
+        return ()
+
+    def start_new_jobs(
+        self, load_id: str, schema: Schema, max_jobs: int, skip_job_ids: Set[str] = None
+    ) -> List["Future[List[LoadJob]]"]:
+        """Submits at most `max_jobs` new jobs to the pool and returns their futures without waiting.
+
+        If destination supports it, files of the same table and format are grouped and loaded by a
+        single job. Each of the futures returns a list of jobs, one for each file.
+
+        Jobs with ids in `skip_job_ids` are not started. Ids of submitted jobs are added to that set so
+        a job that got retried is not started again within the same load loop.
+        """
+        if max_jobs <= 0:
+            return []
+        multi_file_load_formats = self._get_multi_file_load_formats()
+        max_files_per_job = self.config.max_files_per_load_job
+        load_groups: List[List[str]] = []
+        # groups that may still take more files
+        open_groups: Dict[Tuple[str, str], List[str]] = {}
+        for file in self.load_storage.list_new_jobs(load_id):
+            job_info = ParsedLoadJobFileName.parse(file)
+            job_id = job_info.job_id()
+            if skip_job_ids is not None and job_id in skip_job_ids:
+                continue
+            group_key: Tuple[str, str] = None
+            if job_info.file_format in multi_file_load_formats and not (
+                self.is_staging_destination_job(file)
+            ):
+                group_key = (job_info.table_name, job_info.file_format)
+            load_group = open_groups.get(group_key) if group_key else None
+            if load_group is None:
+                if len(load_groups) == max_jobs:
+                    # no free slots but file may still join one of the groups
+                    if open_groups:
+                        continue
+                    break
+                load_group = []
+                load_groups.append(load_group)
+                if group_key:
+                    open_groups[group_key] = load_group
+            load_group.append(file)
+            if len(load_group) >= max_files_per_job:
+                open_groups.pop(group_key, None)
+            if skip_job_ids is not None:
+                skip_job_ids.add(job_id)
+        if load_groups:
+            logger.info(
+                f"Will load {sum(len(group) for group in load_groups)} in {len(load_groups)} jobs,"
+                " creating jobs"
+            )
         # use thread based pool as jobs processing is mostly I/O and we do not want to pickle jobs
-        load_files = self.load_storage.list_new_jobs(load_id)[: self.config.workers]
-        file_count = len(load_files)
-        if file_count == 0:
-            logger.info(f"No new jobs found in {load_id}")
-            return 0, []
-        logger.info(f"Will load {file_count}, creating jobs")
-        param_chunk = [(id(self), file, load_id, schema) for file in load_files]
         # exceptions should not be raised, None as job is a temporary failure
         # other jobs should not be affected
-        jobs = self.pool.map(Load.w_spool_job, *zip(*param_chunk))
-        # remove None jobs and check the rest
-        return file_count, [job for job in jobs if job is not None]
+        return [
+            self.pool.submit(Load.w_spool_jobs, self, load_group, load_id, schema)
+            for load_group in load_groups
+        ]
+
+    def spool_new_jobs(self, load_id: str, schema: Schema) -> Tuple[int, List[LoadJob]]:
+        """Starts at most `workers` new jobs and waits until all of them are spooled"""
+        job_futures = self.start_new_jobs(load_id, schema, self.config.workers)
+        if len(job_futures) == 0:
+            logger.info(f"No new jobs found in {load_id}")
+            return 0, []
+        jobs = [job for f in job_futures for job in f.result()]
+        return len(jobs), jobs
 
     def retrieve_jobs(
         self, client: JobClientBase, load_id: str, staging_client: JobClientBase = None
@@ -353,6 +535,9 @@ class Load(Runnable[Executor], WithStepInfo[LoadMetrics, LoadInfo]):
         )
 
     def load_single_package(self, load_id: str, schema: Schema) -> None:
+        if not self.load_storage.normalized_packages.use_jobs_journal:
+            # move job files of a package partially loaded with jobs journal into their folders
+            self.load_storage.normalized_packages.materialize_jobs_journal(load_id)
         new_jobs = self.get_new_jobs_info(load_id)
         # initialize analytical storage ie. create dataset required by passed schema
         with self.get_destination_client(schema) as job_client:
@@ -396,18 +581,24 @@ class Load(Runnable[Executor], WithStepInfo[LoadMetrics, LoadInfo]):
             else:
                 jobs_count, jobs = self.retrieve_jobs(job_client, load_id)
 
-        if not jobs:
-            # jobs count is a total number of jobs including those that could not be initialized
-            jobs_count, jobs = self.spool_new_jobs(load_id, schema)
+        # jobs that are being spooled in the pool, free worker slots are refilled as soon as any completes
+        spooling_jobs: Set["Future[List[LoadJob]]"] = set()
+        # prevents jobs that were retried from being started again in this loop
+        started_job_ids: Set[str] = set()
+        spooling_jobs.update(
+            self.start_new_jobs(load_id, schema, self.config.workers - len(jobs), started_job_ids)
+        )
+        # jobs count is a total number of jobs including those that could not be initialized
+        jobs_count += len(spooling_jobs)
         # if there are no existing or new jobs we complete the package
         if jobs_count == 0:
             self.complete_package(load_id, schema, False)
             return
         # update counter we only care about the jobs that are scheduled to be loaded
-        package_info = self.load_storage.normalized_packages.get_load_package_info(load_id)
-        total_jobs = reduce(lambda p, c: p + len(c), package_info.jobs.values(), 0)
-        no_failed_jobs = len(package_info.jobs["failed_jobs"])
-        no_completed_jobs = len(package_info.jobs["completed_jobs"]) + no_failed_jobs
+        jobs_counts = self.load_storage.normalized_packages.get_load_package_jobs_counts(load_id)
+        total_jobs = sum(jobs_counts.values())
+        no_failed_jobs = jobs_counts["failed_jobs"]
+        no_completed_jobs = jobs_counts["completed_jobs"] + no_failed_jobs
         self.collector.update("Jobs", no_completed_jobs, total_jobs)
         if no_failed_jobs > 0:
             self.collector.update(
@@ -416,8 +607,18 @@ class Load(Runnable[Executor], WithStepInfo[LoadMetrics, LoadInfo]):
         # loop until all jobs are processed
         while True:
             try:
-                remaining_jobs = self.complete_jobs(load_id, jobs, schema)
-                if len(remaining_jobs) == 0:
+                # complete jobs that reached terminal state, followup jobs go to new jobs
+                jobs = self.complete_jobs(load_id, jobs, schema)
+                # refill worker slots freed by jobs that reached terminal state
+                spooling_jobs.update(
+                    self.start_new_jobs(
+                        load_id,
+                        schema,
+                        self.config.workers - len(spooling_jobs) - len(jobs),
+                        started_job_ids,
+                    )
+                )
+                if len(jobs) == 0 and len(spooling_jobs) == 0:
                     # get package status
                     package_info = self.load_storage.normalized_packages.get_load_package_info(
                         load_id
@@ -443,10 +644,20 @@ class Load(Runnable[Executor], WithStepInfo[LoadMetrics, LoadInfo]):
                                     self.config.raise_on_max_retries,
                                 )
                     break
-                # process remaining jobs again
-                jobs = remaining_jobs
-                # this will raise on signal
-                sleep(1)
+                if spooling_jobs:
+                    # wake up as soon as any of the spooled jobs is started
+                    spooled_jobs, spooling_jobs = wait_for_futures(
+                        spooling_jobs, timeout=self.job_poll_interval, return_when=FIRST_COMPLETED
+                    )
+                    # this will raise on signal
+                    raise_if_signalled()
+                    # exceptions raised when spooling are propagated
+                    for f in spooled_jobs:
+                        jobs.extend(f.result())
+                else:
+                    # only jobs executed by destination are left, poll them
+                    # this will raise on signal
+                    sleep(self.job_poll_interval)
             except LoadClientJobFailed:
                 # the package is completed and skipped
                 self.complete_package(load_id, schema, True)
@@ -481,7 +692,11 @@ class Load(Runnable[Executor], WithStepInfo[LoadMetrics, LoadInfo]):
                 # the same load id may be processed across multiple runs
                 if not self.current_load_id:
                     self._step_info_start_load_id(load_id)
-                self.load_single_package(load_id, schema)
+                try:
+                    self.load_single_package(load_id, schema)
+                finally:
+                    # clients are bound to the package schema
+                    self.close_idle_clients()
 
         return TRunMetrics(False, len(self.load_storage.list_normalized_packages()))
 
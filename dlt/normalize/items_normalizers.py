@@ -1,14 +1,16 @@
-from typing import List, Dict, Set, Any
+from typing import List, Dict, Set, Any, Optional, Tuple, Type
 from abc import abstractmethod
 
 from dlt.common import logger
+from dlt.common.arithmetics import Decimal
 from dlt.common.json import json
+from dlt.common.pendulum import pendulum
 from dlt.common.data_writers import DataWriterMetrics
 from dlt.common.data_writers.writers import ArrowToObjectAdapter
 from dlt.common.json import custom_pua_decode, may_have_pua
 from dlt.common.runtime import signals
 from dlt.common.schema.typing import TSchemaEvolutionMode, TTableSchemaColumns, TSchemaContractDict
-from dlt.common.schema.utils import has_table_seen_data
+from dlt.common.schema.utils import has_table_seen_data, is_complete_column
 from dlt.common.storages import (
     NormalizeStorage,
     LoadStorage,
@@ -18,7 +20,8 @@ from dlt.common.storages.load_package import ParsedLoadJobFileName
 from dlt.common.typing import DictStrAny, TDataItem
 from dlt.common.schema import TSchemaUpdate, Schema
 from dlt.common.exceptions import MissingDependencyException
-from dlt.common.normalizers.utils import generate_dlt_ids
+from dlt.common.normalizers.json.relational import DataItemNormalizer as RelationalNormalizer
+from dlt.common.normalizers.utils import generate_dlt_id, generate_dlt_ids
 
 from dlt.normalize.configuration import NormalizeConfiguration
 
@@ -30,6 +33,23 @@ except MissingDependencyException:
     pa = None
 
 
+FLAT_ROW_PY_TYPES: Dict[str, Type[Any]] = {
+    "text": str,
+    "bigint": int,
+    "double": float,
+    "bool": bool,
+    # types decoded from typed jsonl
+    "timestamp": pendulum.DateTime,
+    "date": pendulum.Date,
+    "time": pendulum.Time,
+    "decimal": Decimal,
+    "binary": bytes,
+}
+"""Python types of values that are written to columns of given data type without coercion. Variant
+types (ie. Wei) are not here because they may need a variant column.
+"""
+
+
 class ItemsNormalizer:
     def __init__(
         self,
@@ -64,6 +84,10 @@ class JsonLItemsNormalizer(ItemsNormalizer):
         self._filtered_tables_columns: Dict[str, Dict[str, TSchemaEvolutionMode]] = {}
         # quick access to column schema for writers below
         self._column_schemas: Dict[str, TTableSchemaColumns] = {}
+        # flat row columns per table with columns and their count the plan was created for
+        self._flat_row_plans: Dict[
+            str, Tuple[TTableSchemaColumns, int, Optional[Dict[str, Tuple[Type[Any], bool]]]]
+        ] = {}
 
     def _filter_columns(
         self, filtered_columns: Dict[str, TSchemaEvolutionMode], row: DictStrAny
@@ -76,6 +100,105 @@ class JsonLItemsNormalizer(ItemsNormalizer):
                     row.pop(name)
         return row
 
+    def _flat_row_columns(self, table_name: str) -> Optional[Dict[str, Tuple[Type[Any], bool]]]:
+        """Returns python type and nullability of all columns of `table_name` if its rows may be
+        written without relational normalization and coercion, otherwise None.
+
+        The result is cached per table. It is dropped when this normalizer updates the table or its
+        filters, and it is rebuilt when the table's columns are replaced or their count changes.
+        """
+        table = self.schema.tables.get(table_name)
+        if table is None:
+            return None
+        columns = table["columns"]
+        plan = self._flat_row_plans.get(table_name)
+        if plan is None or plan[0] is not columns or plan[1] != len(columns):
+            plan = self._flat_row_plans[table_name] = (
+                columns,
+                len(columns),
+                self._compute_flat_row_columns(table_name, columns),
+            )
+        return plan[2]
+
+    def _compute_flat_row_columns(
+        self, table_name: str, columns: TTableSchemaColumns
+    ) -> Optional[Dict[str, Tuple[Type[Any], bool]]]:
+        schema = self.schema
+        if (
+            table_name in self._filtered_tables
+            or table_name in self._filtered_tables_columns
+            or schema.has_row_filters
+            or type(schema.data_item_normalizer) is not RelationalNormalizer
+            or RelationalNormalizer.is_scd2_table(schema, table_name)
+        ):
+            return None
+        normalize_identifier = schema.naming.normalize_identifier
+        flat_columns: Dict[str, Tuple[Type[Any], bool]] = {}
+        for name, column in columns.items():
+            if not is_complete_column(column):
+                return None
+            py_type = FLAT_ROW_PY_TYPES.get(column["data_type"])
+            # item keys are matched as they are so only columns that do not change when
+            # normalized may be written directly (ie. flattened `a__b` normalizes to `a_b`)
+            if py_type is not None and name.strip() and normalize_identifier(name) == name:
+                flat_columns[name] = (py_type, column.get("nullable", True))
+        # normalizer columns must already be there
+        if "_dlt_id" not in flat_columns or "_dlt_load_id" not in flat_columns:
+            return None
+        return flat_columns
+
+    def _normalize_flat_chunk(
+        self, root_table_name: str, items: List[TDataItem], may_have_pua: bool = False
+    ) -> bool:
+        """Writes `items` to `root_table_name` in a single batch if all of them are flat dictionaries
+        with values that match the types of existing columns. Such rows do not need to go through
+        the relational normalizer and `coerce_row`: only `_dlt_load_id` and `_dlt_id` are added and
+        None values are removed.
+
+        If `may_have_pua` is set, typed values are decoded in place. Top level values are
+        decoded by the row by row processing in the same way so `items` may be passed there.
+
+        Returns False if any of the rows requires the full row by row processing. Nothing is written
+        then and `items` are not modified except for decoded typed values.
+        """
+        flat_columns = self._flat_row_columns(root_table_name)
+        if flat_columns is None:
+            return False
+        # validate column wise before any row is modified
+        for item in items:
+            if type(item) is not dict:
+                return False
+            for k, v in item.items():
+                column = flat_columns.get(k)
+                if column is None:
+                    # new column, nested data or column with type that needs coercion
+                    return False
+                if may_have_pua and type(v) is str:
+                    decoded_v = custom_pua_decode(v)
+                    if decoded_v is not v:
+                        item[k] = v = decoded_v
+                if v is None:
+                    if not column[1]:
+                        return False
+                elif type(v) is not column[0]:
+                    return False
+
+        load_id = self.load_id
+        rows: List[DictStrAny] = []
+        for item in items:
+            item["_dlt_load_id"] = load_id
+            if not item.get("_dlt_id"):
+                item["_dlt_id"] = generate_dlt_id()
+            rows.append({k: v for k, v in item.items() if v is not None})
+
+        columns = self._column_schemas.get(root_table_name)
+        if not columns:
+            columns = self._column_schemas[root_table_name] = self.schema.get_table_columns(
+                root_table_name
+            )
+        self.item_storage.write_data_item(load_id, self.schema.name, root_table_name, rows, columns)
+        return True
+
     def _normalize_chunk(
         self, root_table_name: str, items: List[TDataItem], may_have_pua: bool, skip_write: bool
     ) -> TSchemaUpdate:
@@ -84,6 +207,8 @@ class JsonLItemsNormalizer(ItemsNormalizer):
         schema = self.schema
         schema_name = schema.name
         normalize_data_fun = self.schema.normalize_data_item
+        # rows are collected per table and written in batches when the chunk is processed
+        table_rows: Dict[str, List[DictStrAny]] = {}
 
         for item in items:
             items_gen = normalize_data_fun(item, self.load_id, root_table_name)
@@ -137,8 +262,11 @@ class JsonLItemsNormalizer(ItemsNormalizer):
                             schema_contract, partial_table, data_item=row
                         )
                         if filters:
+                            # flat rows of filtered tables must go through the filters
+                            self._flat_row_plans.pop(table_name, None)
                             for entity, name, mode in filters:
                                 if entity == "tables":
+                                    self._flat_row_plans.pop(name, None)
                                     self._filtered_tables.add(name)
                                 elif entity == "columns":
                                     filtered_columns = self._filtered_tables_columns.setdefault(
@@ -153,6 +281,7 @@ class JsonLItemsNormalizer(ItemsNormalizer):
                         # theres a new table or new columns in existing table
                         # update schema and save the change
                         schema.update_table(partial_table)
+                        self._flat_row_plans.pop(table_name, None)
                         table_updates = schema_update.setdefault(table_name, [])
                         table_updates.append(partial_table)
 
@@ -167,22 +296,28 @@ class JsonLItemsNormalizer(ItemsNormalizer):
                                 should_descend = False
                                 continue
 
-                    # get current columns schema
-                    columns = column_schemas.get(table_name)
-                    if not columns:
-                        columns = schema.get_table_columns(table_name)
-                        column_schemas[table_name] = columns
                     # store row
                     # TODO: store all rows for particular items all together after item is fully completed
                     #   will be useful if we implement bad data sending to a table
-                    # we skip write when discovering schema for empty file
-                    if not skip_write:
-                        self.item_storage.write_data_item(
-                            self.load_id, schema_name, table_name, row, columns
-                        )
+                    rows = table_rows.get(table_name)
+                    if rows is None:
+                        rows = table_rows[table_name] = []
+                    rows.append(row)
             except StopIteration:
                 pass
             signals.raise_if_signalled()
+
+        # we skip write when discovering schema for empty file
+        if not skip_write:
+            for table_name, rows in table_rows.items():
+                # get current columns schema, rows written earlier in the chunk may miss new columns
+                columns = column_schemas.get(table_name)
+                if not columns:
+                    columns = schema.get_table_columns(table_name)
+                    column_schemas[table_name] = columns
+                self.item_storage.write_data_item(
+                    self.load_id, schema_name, table_name, rows, columns
+                )
         return schema_update
 
     def __call__(
@@ -198,10 +333,15 @@ class JsonLItemsNormalizer(ItemsNormalizer):
             line: bytes = None
             for line_no, line in enumerate(f):
                 items: List[TDataItem] = json.loadb(line)
-                partial_update = self._normalize_chunk(
-                    root_table_name, items, may_have_pua(line), skip_write=False
-                )
-                schema_updates.append(partial_update)
+                line_may_have_pua = may_have_pua(line)
+                # flat rows of known shape are written in a single batch
+                if self._normalize_flat_chunk(root_table_name, items, line_may_have_pua):
+                    signals.raise_if_signalled()
+                else:
+                    partial_update = self._normalize_chunk(
+                        root_table_name, items, line_may_have_pua, skip_write=False
+                    )
+                    schema_updates.append(partial_update)
                 logger.debug(f"Processed {line_no+1} lines from file {extracted_items_file}")
             if line is None and root_table_name in self.schema.tables:
                 # TODO: we should push the truncate jobs via package state
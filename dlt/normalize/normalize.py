@@ -1,10 +1,9 @@
 import os
 import itertools
-from typing import Callable, List, Dict, NamedTuple, Sequence, Tuple, Set, Optional
-from concurrent.futures import Future, Executor
+from typing import Any, Callable, List, Dict, NamedTuple, Sequence, Tuple, Set, Optional
+from concurrent.futures import Future, Executor, wait as wait_for_futures, FIRST_COMPLETED
 
 from dlt.common import logger
-from dlt.common.runtime.signals import sleep
 from dlt.common.configuration import with_config, known_sections
 from dlt.common.configuration.accessors import config
 from dlt.common.configuration.container import Container
@@ -21,7 +20,7 @@ from dlt.common.runners import TRunMetrics, Runnable, NullExecutor
 from dlt.common.runtime import signals
 from dlt.common.runtime.collector import Collector, NULL_COLLECTOR
 from dlt.common.schema.typing import TStoredSchema
-from dlt.common.schema.utils import merge_schema_updates
+from dlt.common.schema.utils import get_top_level_table, merge_schema_updates
 from dlt.common.storages import (
     NormalizeStorage,
     SchemaStorage,
@@ -40,7 +39,6 @@ from dlt.common.pipeline import (
 )
 from dlt.common.storages.exceptions import LoadPackageNotFound
 from dlt.common.storages.load_package import LoadPackageInfo
-from dlt.common.utils import chunks
 
 from dlt.normalize.configuration import NormalizeConfiguration
 from dlt.normalize.exceptions import NormalizeJobFailed
@@ -64,6 +62,8 @@ TMapFuncType = Callable[
 
 class Normalize(Runnable[Executor], WithStepInfo[NormalizeMetrics, NormalizeInfo]):
     pool: Executor
+    signal_poll_interval: float = 1.0
+    """How long to wait for worker results before checking for signals, in seconds"""
 
     @with_config(spec=NormalizeConfiguration, sections=(known_sections.NORMALIZE,))
     def __init__(
@@ -240,26 +240,90 @@ class Normalize(Runnable[Executor], WithStepInfo[NormalizeMetrics, NormalizeInfo
                     # merge columns
                     schema.update_table(partial_table)
 
+    def update_table_or_collect_conflicts(
+        self, schema: Schema, schema_updates: List[TSchemaUpdate]
+    ) -> Tuple[List[TSchemaUpdate], Set[str]]:
+        """Applies `schema_updates` to `schema` like `update_table` but does not stop on column conflicts.
+
+        Returns applied schema updates and a set of root tables whose table chains received
+        conflicting updates. Those updates are skipped, all the others are applied.
+        """
+        applied_updates: List[TSchemaUpdate] = []
+        conflicting_root_tables: Set[str] = set()
+        for schema_update in schema_updates:
+            applied_update: TSchemaUpdate = {}
+            for table_name, table_updates in schema_update.items():
+                logger.info(
+                    f"Updating schema for table {table_name} with {len(table_updates)} deltas"
+                )
+                for partial_table in table_updates:
+                    try:
+                        # merge columns
+                        schema.update_table(partial_table)
+                        applied_update.setdefault(table_name, []).append(partial_table)
+                    except CannotCoerceColumnException as exc:
+                        root_table = get_top_level_table(schema.tables, table_name)["name"]
+                        logger.warning(
+                            f"Parallel schema update conflict in table chain of {root_table}"
+                            f" ({str(exc)})"
+                        )
+                        conflicting_root_tables.add(root_table)
+            applied_updates.append(applied_update)
+        return applied_updates, conflicting_root_tables
+
     @staticmethod
-    def group_worker_files(files: Sequence[str], no_groups: int) -> List[Sequence[str]]:
-        # sort files so the same tables are in the same worker
-        files = list(sorted(files))
-
-        chunk_size = max(len(files) // no_groups, 1)
-        chunk_files = list(chunks(files, chunk_size))
-        # distribute the remainder files to existing groups starting from the end
-        remainder_l = len(chunk_files) - no_groups
-        l_idx = 0
-        while remainder_l > 0:
-            for idx, file in enumerate(reversed(chunk_files.pop())):
-                chunk_files[-l_idx - idx - remainder_l].append(file)  # type: ignore
-            remainder_l -= 1
-            l_idx = idx + 1
-        return chunk_files
+    def group_worker_files(
+        files: Sequence[str], file_sizes: Sequence[int], no_workers: int, tasks_per_worker: int = 2
+    ) -> List[Sequence[str]]:
+        """Groups `files` into tasks of similar size in bytes that idle workers pull from the pool queue.
+
+        About `tasks_per_worker` tasks are created per worker. Files of the same table are kept in
+        a single task and only a table larger than the target task size is split into consecutive
+        tasks. Tasks are returned largest first so the big ones start early and the small ones fill
+        in the gaps.
+
+        Each task writes its own load file for every table it contains and receives a copy of the
+        schema, so a table split into n tasks ends up in (at least) n load files. More tasks per worker
+        balance the load better at the cost of more load files.
+        """
+        if len(files) == 0:
+            return []
+        target_size = max(sum(file_sizes) // (no_workers * tasks_per_worker), 1)
+        # sort files so the same tables are next to each other
+        sized_files = sorted(zip(files, file_sizes))
+        tasks: List[Tuple[int, List[str]]] = []
+        task: List[str] = []
+        task_size = 0
+        for _, sized_table_files in itertools.groupby(
+            sized_files, key=lambda f: os.path.basename(f[0]).split(".")[0]
+        ):
+            table_files = list(sized_table_files)
+            table_size = sum(size for _, size in table_files)
+            # start a new task if whole table does not fit into the current one
+            if task and task_size + table_size > target_size:
+                tasks.append((task_size, task))
+                task, task_size = [], 0
+            if table_size <= target_size:
+                task.extend(file for file, _ in table_files)
+                task_size += table_size
+                continue
+            # split only tables larger than the target size
+            for file, size in table_files:
+                if task and task_size + size > target_size:
+                    tasks.append((task_size, task))
+                    task, task_size = [], 0
+                task.append(file)
+                task_size += size
+        tasks.append((task_size, task))
+        # stable sort keeps the file order for tasks of the same size
+        tasks.sort(key=lambda t: t[0], reverse=True)
+        return [task for _, task in tasks]
 
     def map_parallel(self, schema: Schema, load_id: str, files: Sequence[str]) -> TWorkerRV:
         workers: int = getattr(self.pool, "_max_workers", 1)
-        chunk_files = self.group_worker_files(files, workers)
+        extracted_storage = self.normalize_storage.extracted_packages.storage
+        file_sizes = [os.path.getsize(extracted_storage.make_full_path(f)) for f in files]
+        chunk_files = self.group_worker_files(files, file_sizes, workers)
         schema_dict: TStoredSchema = schema.to_dict()
         param_chunk = [
             (
@@ -275,51 +339,80 @@ class Normalize(Runnable[Executor], WithStepInfo[NormalizeMetrics, NormalizeInfo
         # return stats
         summary = TWorkerRV([], [])
         # push all tasks to queue
-        tasks = [
-            (self.pool.submit(Normalize.w_normalize_files, *params), params)
-            for params in param_chunk
-        ]
+        tasks: Dict["Future[TWorkerRV]", Tuple[Any, ...]] = {
+            self.pool.submit(Normalize.w_normalize_files, *params): params for params in param_chunk
+        }
 
         while len(tasks) > 0:
-            sleep(0.3)
-            # operate on copy of the list
-            for task in list(tasks):
-                pending, params = task
-                if pending.done():
-                    # collect metrics from the exception (if any)
-                    if isinstance(pending.exception(), NormalizeJobFailed):
-                        summary.file_metrics.extend(pending.exception().writer_metrics)  # type: ignore[attr-defined]
-                    # Exception in task (if any) is raised here
-                    result: TWorkerRV = pending.result()
-                    try:
-                        # gather schema from all manifests, validate consistency and combine
-                        self.update_table(schema, result[0])
-                        summary.schema_updates.extend(result.schema_updates)
-                        summary.file_metrics.extend(result.file_metrics)
-                        # update metrics
-                        self.collector.update("Files", len(result.file_metrics))
-                        self.collector.update(
-                            "Items", sum(result.file_metrics, EMPTY_DATA_WRITER_METRICS).items_count
-                        )
-                    except CannotCoerceColumnException as exc:
-                        # schema conflicts resulting from parallel executing
-                        logger.warning(
-                            f"Parallel schema update conflict, retrying task ({str(exc)}"
+            # wait until any of the tasks completes, time out periodically to check for signals
+            done, _ = wait_for_futures(
+                tasks.keys(), timeout=self.signal_poll_interval, return_when=FIRST_COMPLETED
+            )
+            signals.raise_if_signalled()
+            for pending in done:
+                # remove finished tasks
+                params = tasks.pop(pending)
+                # collect metrics from the exception (if any)
+                if isinstance(pending.exception(), NormalizeJobFailed):
+                    summary.file_metrics.extend(pending.exception().writer_metrics)  # type: ignore[attr-defined]
+                # Exception in task (if any) is raised here
+                result: TWorkerRV = pending.result()
+                # gather schema from all manifests, validate consistency and combine
+                schema_updates, conflicting_root_tables = self.update_table_or_collect_conflicts(
+                    schema, result.schema_updates
+                )
+                file_metrics = result.file_metrics
+                if conflicting_root_tables:
+                    # schema conflicts resulting from parallel executing
+                    logger.warning(
+                        "Parallel schema update conflict, retrying task for tables"
+                        f" {conflicting_root_tables}"
+                    )
+                    # retry the task only with files of conflicting table chains
+                    retry_files: List[str] = []
+                    retry_all = False
+                    for f in params[5]:
+                        table_name = schema.naming.normalize_table_identifier(
+                            ParsedLoadJobFileName.parse(f).table_name
                         )
-                        # delete all files produced by the task
-                        for metrics in result.file_metrics:
+                        if table_name not in schema.tables:
+                            # retry all files if extracted file could not be mapped to a table chain
+                            retry_all = True
+                            break
+                        if (
+                            get_top_level_table(schema.tables, table_name)["name"]
+                            in conflicting_root_tables
+                        ):
+                            retry_files.append(f)
+                    retry_all = retry_all or not retry_files
+                    if retry_all:
+                        retry_files = list(params[5])
+                    # delete files produced by the task for the files that will be retried
+                    file_metrics = []
+                    for metrics in result.file_metrics:
+                        table_name = ParsedLoadJobFileName.parse(metrics.file_path).table_name
+                        if (
+                            retry_all
+                            or get_top_level_table(schema.tables, table_name)["name"]
+                            in conflicting_root_tables
+                        ):
                             os.remove(metrics.file_path)
-                        # schedule the task again
-                        schema_dict = schema.to_dict()
-                        # TODO: it's time for a named tuple
-                        params = params[:3] + (schema_dict,) + params[4:]
-                        retry_pending: Future[TWorkerRV] = self.pool.submit(
-                            Normalize.w_normalize_files, *params
-                        )
-                        tasks.append((retry_pending, params))
-                    # remove finished tasks
-                    tasks.remove(task)
-                logger.debug(f"{len(tasks)} tasks still remaining for {load_id}...")
+                        else:
+                            file_metrics.append(metrics)
+                    # TODO: it's time for a named tuple
+                    params = params[:3] + (schema.to_dict(),) + params[4:5] + (retry_files,)
+                    retry_pending: Future[TWorkerRV] = self.pool.submit(
+                        Normalize.w_normalize_files, *params
+                    )
+                    tasks[retry_pending] = params
+                summary.schema_updates.extend(schema_updates)
+                summary.file_metrics.extend(file_metrics)
+                # update metrics
+                self.collector.update("Files", len(file_metrics))
+                self.collector.update(
+                    "Items", sum(file_metrics, EMPTY_DATA_WRITER_METRICS).items_count
+                )
+            logger.debug(f"{len(tasks)} tasks still remaining for {load_id}...")
 
         return summary
 
@@ -349,7 +442,8 @@ class Normalize(Runnable[Executor], WithStepInfo[NormalizeMetrics, NormalizeInfo
         table_metrics: Dict[str, DataWriterMetrics] = {
             table_name: sum(map(lambda pair: pair[1], metrics), EMPTY_DATA_WRITER_METRICS)
             for table_name, metrics in itertools.groupby(
-                job_metrics.items(), lambda pair: pair[0].table_name
+                sorted(job_metrics.items(), key=lambda pair: pair[0].table_name),
+                lambda pair: pair[0].table_name,
             )
         }
         # update normalizer specific info
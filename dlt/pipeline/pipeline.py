@@ -2,12 +2,14 @@ import contextlib
 import os
 import datetime  # noqa: 251
 from contextlib import contextmanager
+from copy import deepcopy
 from functools import wraps
 from typing import (
     Any,
     Callable,
     ClassVar,
     List,
+    Mapping,
     Iterator,
     Optional,
     Sequence,
@@ -342,6 +344,8 @@ class Pipeline(SupportsPipeline):
         self._trace: PipelineTrace = None
         self._last_trace: PipelineTrace = None
         self._state_restored: bool = False
+        # version, local state and file stat of the last saved state, used to skip unchanged writes
+        self._last_saved_state: Tuple[Tuple[Any, ...], Tuple[int, int]] = None
 
         initialize_runtime(self.runtime_config)
         # initialize pipeline working dir
@@ -1345,7 +1349,10 @@ class Pipeline(SupportsPipeline):
 
     def _get_state(self) -> TPipelineState:
         try:
+            state_stat = self._get_state_file_stat()
             state = json_decode_state(self._pipeline_storage.load(Pipeline.STATE_FILE))
+            # remember stored version so unchanged state is not saved again
+            self._last_saved_state = (self._get_state_key(state), state_stat)
             return migrate_pipeline_state(
                 self.pipeline_name,
                 state,
@@ -1539,7 +1546,31 @@ class Pipeline(SupportsPipeline):
         return sorted(self._schema_storage.list_schemas())
 
     def _save_state(self, state: TPipelineState) -> None:
+        """Saves `state` unless it is already stored. The version of `state` must be bumped if
+        content other than local state was modified.
+        """
+        state_key = self._get_state_key(state)
+        if self._last_saved_state == (state_key, self._get_state_file_stat()):
+            return
         self._pipeline_storage.save(Pipeline.STATE_FILE, json_encode_state(state))
+        self._last_saved_state = (state_key, self._get_state_file_stat())
+
+    @staticmethod
+    def _get_state_key(state: Mapping[str, Any]) -> Tuple[Any, ...]:
+        # version hash does not include local state
+        return (
+            state.get("_state_engine_version"),
+            state.get("_state_version"),
+            state.get("_version_hash"),
+            deepcopy(state.get("_local")),
+        )
+
+    def _get_state_file_stat(self) -> Tuple[int, int]:
+        try:
+            stat = os.stat(self._pipeline_storage.make_full_path(Pipeline.STATE_FILE))
+            return stat.st_mtime_ns, stat.st_size
+        except FileNotFoundError:
+            return None
 
     def __getstate__(self) -> Any:
         # pickle only the SupportsPipeline protocol fields
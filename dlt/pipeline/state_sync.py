@@ -16,12 +16,13 @@ from dlt.common.versioned_state import (
 from dlt.common.pipeline import TPipelineState
 
 from dlt.extract import DltResource
+from dlt.extract.incremental.transform import pack_unique_hashes
 
 from dlt.pipeline.exceptions import (
     PipelineStateEngineNoUpgradePathException,
 )
 
-PIPELINE_STATE_ENGINE_VERSION = 4
+PIPELINE_STATE_ENGINE_VERSION = 5
 
 # state table columns
 STATE_TABLE_COLUMNS: TTableSchemaColumns = {
@@ -83,6 +84,18 @@ def migrate_pipeline_state(
             state["staging_name"] = Destination.to_name(state["staging"])
             del state["staging"]
         from_engine = 4
+    if from_engine == 4 and to_engine > 4:
+        # many unique hashes of incremental are stored as a single string
+        for source_state in state.get("sources", {}).values():
+            for resource_state in source_state.get("resources", {}).values():
+                for column_state in resource_state.get("incremental", {}).values():
+                    if isinstance(column_state, dict) and isinstance(
+                        column_state.get("unique_hashes"), list
+                    ):
+                        column_state["unique_hashes"] = pack_unique_hashes(
+                            column_state["unique_hashes"]
+                        )
+        from_engine = 5
 
     # check state engine
     if from_engine != to_engine:
@@ -1,4 +1,5 @@
 from typing import (
+    Deque,
     Iterator,
     Optional,
     List,
@@ -6,9 +7,14 @@ from typing import (
     Any,
     TypeVar,
     Iterable,
+    Tuple,
     cast,
 )
+import codecs
 import copy
+import time
+from collections import deque
+from concurrent.futures import Future, ThreadPoolExecutor
 from urllib.parse import urlparse
 from requests import Session as BaseSession  # noqa: I251
 from requests import Response, Request
@@ -19,16 +25,19 @@ from dlt.common import logger
 from dlt.sources.helpers.requests.retry import Client
 
 from .typing import HTTPMethodBasic, HTTPMethod, Hooks
-from .paginators import BasePaginator
+from .paginators import BasePaginator, OffsetPaginator
 from .auth import AuthConfigBase
 from .detector import PaginatorFactory, find_records
 from .exceptions import IgnoreResponseException
 
-from .utils import join_url
+from .utils import iter_json_array, join_url, simple_json_path
 
 
 _T = TypeVar("_T")
 
+STREAM_CHUNK_SIZE = 64 * 1024
+"""Size of the response body chunks read when records are streamed"""
+
 
 class PageData(List[_T]):
     """A list of elements in a single page of results with attached request context.
@@ -61,7 +70,9 @@ class RESTClient:
         auth (Optional[AuthConfigBase]): Authentication configuration for all requests.
         paginator (Optional[BasePaginator]): Default paginator for handling paginated responses.
         data_selector (Optional[jsonpath.TJsonPath]): JSONPath selector for extracting data from responses.
-        session (BaseSession): HTTP session for making requests.
+        session (BaseSession): HTTP session for making requests. When not provided, each thread
+            requesting pages concurrently gets its own session. A provided session is shared by
+            those threads so it must be safe to use from many threads.
         paginator_factory (Optional[PaginatorFactory]): Factory for creating paginator instances,
             used for detecting paginators.
     """
@@ -80,11 +91,13 @@ class RESTClient:
         self.headers = headers
         self.auth = auth
 
+        self._client: Optional[Client] = None
         if session:
             self._validate_session_raise_for_status(session)
             self.session = session
         else:
-            self.session = Client(raise_for_status=False).session
+            self._client = Client(raise_for_status=False)
+            self.session = self._client.session
 
         self.paginator = paginator
         self.pagination_factory = paginator_factory or PaginatorFactory()
@@ -94,7 +107,7 @@ class RESTClient:
     def _validate_session_raise_for_status(self, session: BaseSession) -> None:
         # dlt.sources.helpers.requests.session.Session
         # has raise_for_status=True by default
-        if getattr(self.session, "raise_for_status", False):
+        if getattr(session, "raise_for_status", False):
             logger.warning(
                 "The session provided has raise_for_status enabled. "
                 "This may cause unexpected behavior."
@@ -125,15 +138,26 @@ class RESTClient:
             hooks=hooks,
         )
 
-    def _send_request(self, request: Request) -> Response:
+    def _send_request(
+        self, request: Request, stream: bool = False, session: BaseSession = None
+    ) -> Response:
         logger.info(
             f"Making {request.method.upper()} request to {request.url}"
             f" with params={request.params}, json={request.json}"
         )
 
-        prepared_request = self.session.prepare_request(request)
+        session = session or self.session
+        prepared_request = session.prepare_request(request)
+
+        return session.send(prepared_request, stream=stream)
 
-        return self.session.send(prepared_request)
+    def _get_thread_session(self) -> BaseSession:
+        """Returns session to be used by the current thread. Sessions created by the client are
+        not shared between threads, the session passed by the user is.
+        """
+        if self._client is None:
+            return self.session
+        return self._client.session
 
     def request(self, path: str = "", method: HTTPMethod = "GET", **kwargs: Any) -> Response:
         prepared_request = self._create_request(
@@ -159,6 +183,9 @@ class RESTClient:
         paginator: Optional[BasePaginator] = None,
         data_selector: Optional[jsonpath.TJsonPath] = None,
         hooks: Optional[Hooks] = None,
+        concurrent_pages: int = 1,
+        min_request_interval: float = 0,
+        stream_batch_size: int = 0,
     ) -> Iterator[PageData[Any]]:
         """Iterates over paginated API responses, yielding pages of data.
 
@@ -175,6 +202,18 @@ class RESTClient:
             hooks (Optional[Hooks]): Hooks to modify request/response objects. Note that
                 when hooks are not provided, the default behavior is to raise an exception
                 on error status codes.
+            concurrent_pages (int): How many pages may be requested at the same time. When
+                greater than 1 and the paginator knows the total count after the first response
+                (`OffsetPaginator`), the remaining pages are prefetched in a thread pool and still
+                yielded in order.
+            min_request_interval (float): Minimum time in seconds between starting concurrent
+                page requests. Use it to respect rate limits of the API.
+            stream_batch_size (int): When greater than 0 and `data_selector` is a chain of field
+                names (ie. `data.items`), the response body is parsed incrementally and the selected
+                records are yielded in pages of at most `stream_batch_size` as they arrive, so large
+                responses are not held in memory. Not used for concurrently requested pages. If
+                the paginator is detected from the response, the first response is not streamed
+                so all pages are yielded with the paginator.
 
         Yields:
             PageData[Any]: A page of data from the paginated API response, along with request and response context.
@@ -204,16 +243,33 @@ class RESTClient:
             path=path, method=method, params=params, json=json, auth=auth, hooks=hooks
         )
 
+        data_path = simple_json_path(data_selector) if stream_batch_size > 0 else None
+
         while True:
+            # paginator is detected from the whole response so it must be known before streaming
+            stream = data_path is not None and paginator is not None
             try:
-                response = self._send_request(request)
+                response = self._send_request(request, stream=stream)
             except IgnoreResponseException:
                 break
 
+            if stream:
+                # last batch is yielded below, after paginator was updated
+                data = None
+                for batch in self.stream_response(
+                    response, data_selector, data_path, stream_batch_size
+                ):
+                    if data is not None:
+                        yield PageData(
+                            data, request=request, response=response, paginator=paginator, auth=auth
+                        )
+                    data = batch
+
             if paginator is None:
                 paginator = self.detect_paginator(response)
 
-            data = self.extract_response(response, data_selector)
+            if not stream:
+                data = self.extract_response(response, data_selector)
             paginator.update_state(response)
             paginator.update_request(request)
 
@@ -223,6 +279,87 @@ class RESTClient:
             if not paginator.has_next_page:
                 break
 
+            if (
+                concurrent_pages > 1
+                and isinstance(paginator, OffsetPaginator)
+                and paginator.total is not None
+            ):
+                yield from self._paginate_offsets_concurrently(
+                    request,
+                    paginator,
+                    auth,
+                    data_selector,
+                    concurrent_pages,
+                    min_request_interval,
+                )
+                break
+
+    def _paginate_offsets_concurrently(
+        self,
+        request: Request,
+        paginator: OffsetPaginator,
+        auth: AuthConfigBase,
+        data_selector: jsonpath.TJsonPath,
+        concurrent_pages: int,
+        min_request_interval: float,
+    ) -> Iterator[PageData[Any]]:
+        """Requests remaining pages of `paginator` up to its total count using `concurrent_pages`
+        threads and yields them in order. Each thread uses its own session if the client created it.
+        """
+        offsets = iter(range(paginator.offset, paginator.total, paginator.limit))
+        pending: Deque["Future[Tuple[Request, Response]]"] = deque()
+        last_request_at = 0.0
+
+        def _send_page_request(offset: int) -> Tuple[Request, Response]:
+            page_request = copy.copy(request)
+            page_request.params = dict(request.params or {})
+            page_request.params[paginator.offset_param] = offset
+            page_request.params[paginator.limit_param] = paginator.limit
+            return page_request, self._send_request(
+                page_request, session=self._get_thread_session()
+            )
+
+        def _submit_next(pool: ThreadPoolExecutor) -> None:
+            nonlocal last_request_at
+            offset = next(offsets, None)
+            if offset is None:
+                return
+            if min_request_interval:
+                wait_for = last_request_at + min_request_interval - time.monotonic()
+                if wait_for > 0:
+                    time.sleep(wait_for)
+                last_request_at = time.monotonic()
+            pending.append(pool.submit(_send_page_request, offset))
+
+        with ThreadPoolExecutor(concurrent_pages) as pool:
+            try:
+                for _ in range(concurrent_pages):
+                    _submit_next(pool)
+                while pending:
+                    try:
+                        page_request, response = pending.popleft().result()
+                    except IgnoreResponseException:
+                        break
+                    _submit_next(pool)
+
+                    data = self.extract_response(response, data_selector)
+                    paginator.update_state(response)
+                    paginator.update_request(request)
+
+                    yield PageData(
+                        data,
+                        request=page_request,
+                        response=response,
+                        paginator=paginator,
+                        auth=auth,
+                    )
+
+                    if not paginator.has_next_page:
+                        break
+            finally:
+                for future in pending:
+                    future.cancel()
+
     def extract_response(self, response: Response, data_selector: jsonpath.TJsonPath) -> List[Any]:
         if data_selector:
             # we should compile data_selector
@@ -236,6 +373,49 @@ class RESTClient:
             data = [data]
         return cast(List[Any], data)
 
+    def stream_response(
+        self,
+        response: Response,
+        data_selector: jsonpath.TJsonPath,
+        data_path: List[str],
+        batch_size: int,
+    ) -> Iterator[List[Any]]:
+        """Parses the body of a streamed `response` incrementally and yields records from the array
+        under `data_path` in batches of at most `batch_size`. Always yields at least one batch.
+
+        Once the body is consumed, the response content is replaced with the document without the
+        streamed records so paginators can still read it. If `data_path` does not point to an
+        array, records are extracted from that document as in `extract_response`.
+        """
+        decoder = codecs.getincrementaldecoder(response.encoding or "utf-8")()
+
+        def _decode_chunks() -> Iterator[str]:
+            for chunk in response.iter_content(STREAM_CHUNK_SIZE):
+                yield decoder.decode(chunk)
+            yield decoder.decode(b"", final=True)
+
+        skeleton: List[str] = []
+        batch: List[Any] = []
+        batches_count = 0
+        for record in iter_json_array(_decode_chunks(), data_path, skeleton):
+            batch.append(record)
+            if len(batch) == batch_size:
+                yield batch
+                batches_count += 1
+                batch = []
+
+        # body was consumed, keep the rest of the document in the response. `requests` reads the
+        # body into `_content` so setting it (and the encoding) intentionally makes `json()` and
+        # `text` return the document without the streamed records
+        response._content = "".join(skeleton).encode("utf-8")
+        response.encoding = "utf-8"
+        selected = jsonpath.find_values(data_selector, response.json())
+        if selected and isinstance(selected[0], list):
+            if batch or batches_count == 0:
+                yield batch
+        else:
+            yield self.extract_response(response, data_selector)
+
     def detect_paginator(self, response: Response) -> BasePaginator:
         """Detects a paginator for the response and returns it.
 
@@ -78,6 +78,7 @@ class OffsetPaginator(BasePaginator):
 
         self.offset = initial_offset
         self.limit = initial_limit
+        self.total: Optional[int] = None
 
     def update_state(self, response: Response) -> None:
         values = jsonpath.find_values(self.total_path, response.json())
@@ -94,6 +95,7 @@ class OffsetPaginator(BasePaginator):
                 f"Expected an integer, got {total}"
             )
 
+        self.total = total
         self.offset += self.limit
 
         if self.offset >= total:
@@ -1,3 +1,14 @@
+import re
+from typing import Any, Iterable, Iterator, List, Optional
+
+from dlt.common import json
+from dlt.common.jsonpath import TJsonPath
+
+_JSON_STRUCTURE = re.compile(r'[\[\]{},"]')
+_JSON_STRING_END = re.compile(r'(?:[^"\\]|\\.)*"', re.DOTALL)
+_SIMPLE_JSON_PATH = re.compile(r"^\$?(?:\.?[A-Za-z_][\w-]*)(?:\.[A-Za-z_][\w-]*)*$|^\$$")
+
+
 def join_url(base_url: str, path: str) -> str:
     if base_url is None:
         raise ValueError("Base URL must be provided or set to an empty string.")
@@ -14,3 +25,97 @@ def join_url(base_url: str, path: str) -> str:
         base_url += "/"
 
     return base_url + path.lstrip("/")
+
+
+def simple_json_path(path: TJsonPath) -> Optional[List[str]]:
+    """Returns a list of keys if `path` is a chain of plain field names (ie. `$.data.items`),
+    None otherwise. `$` returns an empty list.
+    """
+    if not isinstance(path, str) or not _SIMPLE_JSON_PATH.match(path):
+        return None
+    return [key for key in path.lstrip("$").split(".") if key]
+
+
+def iter_json_array(chunks: Iterable[str], path: List[str], skeleton: List[str]) -> Iterator[Any]:
+    """Incrementally parses a JSON document from text `chunks` and yields elements of the array
+    found under `path` (a list of object keys) as soon as each of them is complete.
+
+    Text of the document outside of the streamed array is appended to `skeleton`, with the array
+    emptied, so the remaining document (ie. pagination info) can be parsed once streaming is done.
+    """
+    buf = ""
+    # position in `buf` where scanning continues
+    pos = 0
+    # types of open containers and current keys of open objects
+    containers: List[str] = []
+    keys: List[Optional[str]] = []
+    expect_key = False
+    found = False
+    # start of the element being collected, -1 when not in the streamed array
+    element_start = -1
+    # start of the text not yet copied to skeleton, -1 when in the streamed array
+    skeleton_start = 0
+    chunks = iter(chunks)
+
+    while True:
+        match = _JSON_STRUCTURE.search(buf, pos)
+        string_end = None
+        if match is not None and match.group() == '"':
+            string_end = _JSON_STRING_END.match(buf, match.end())
+        if match is None or (match.group() == '"' and string_end is None):
+            # more data is needed, drop already processed text
+            if match is not None:
+                pos = match.start()
+            if element_start >= 0:
+                cut = element_start
+                element_start = 0
+            else:
+                skeleton.append(buf[skeleton_start:pos])
+                cut = pos
+                skeleton_start = 0
+            buf = buf[cut:]
+            pos -= cut
+            chunk = next(chunks, None)
+            if chunk is None:
+                break
+            buf += chunk
+            continue
+
+        token = match.group()
+        pos = match.end()
+        if token == '"':
+            pos = string_end.end()
+            if expect_key:
+                keys[-1] = json.loads(buf[match.start() : pos])
+                expect_key = False
+        elif token == "{":
+            containers.append(token)
+            keys.append(None)
+            expect_key = True
+        elif token == "[":
+            if not found and keys == path and all(container == "{" for container in containers):
+                found = True
+                skeleton.append(buf[skeleton_start:pos])
+                skeleton_start = -1
+                element_start = pos
+            containers.append(token)
+            keys.append(None)
+        elif token == ",":
+            if element_start >= 0 and len(containers) == len(path) + 1:
+                yield json.loads(buf[element_start : match.start()])
+                element_start = pos
+            elif containers[-1] == "{":
+                expect_key = True
+        else:
+            if element_start >= 0 and len(containers) == len(path) + 1:
+                element = buf[element_start : match.start()]
+                if element.strip():
+                    yield json.loads(element)
+                element_start = -1
+                skeleton_start = match.start()
+            containers.pop()
+            keys.pop()
+
+    if element_start >= 0 or containers:
+        raise ValueError("Unexpected end of JSON document")
+    skeleton.append(buf[skeleton_start:])
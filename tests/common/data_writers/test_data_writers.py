@@ -1,10 +1,12 @@
 import io
 import pytest
 import time
-from typing import Iterator
+from typing import Any, Dict, Iterator, List, Tuple
 
 from dlt.common import pendulum, json
 from dlt.common.data_writers.exceptions import DataWriterNotFound, SpecLookupFailed
+from dlt.common.data_types import TDataType
+from dlt.common.schema.typing import TTableSchemaColumns
 from dlt.common.typing import AnyFun
 
 # from dlt.destinations.postgres import capabilities
@@ -101,6 +103,64 @@ def test_date_insert_writer(insert_writer: _StringIOWriter) -> None:
     assert lines[2] == "('1974-08-11');"
 
 
+@pytest.mark.parametrize("escape_literal", ALL_LITERAL_ESCAPE)
+def test_typed_columns_insert_writer(escape_literal: AnyFun) -> None:
+    data_types: List[Tuple[str, TDataType]] = [
+        ("int", "bigint"),
+        ("float", "double"),
+        ("bool", "bool"),
+        ("timestamp", "timestamp"),
+        ("str", "text"),
+        ("json", "complex"),
+        ("bin", "binary"),
+    ]
+    columns: TTableSchemaColumns = {
+        name: {"name": name, "data_type": data_type} for name, data_type in data_types
+    }
+    rows: List[Dict[str, Any]] = [
+        {
+            "int": 1,
+            "float": 1.5,
+            "bool": True,
+            "timestamp": pendulum.from_timestamp(1658928602.575267),
+            "str": "a'b\n",
+            "json": {"a": ["b'"]},
+            "bin": b"\x00\x01",
+        },
+        # values not matching column types are escaped by destination escaper
+        {"int": True, "float": 2, "timestamp": "2022-07-27", "str": 1, "json": "[]", "bin": "bin"},
+    ]
+    caps = redshift_caps()
+    caps.escape_literal = escape_literal
+    with io.StringIO() as f:
+        InsertValuesWriter(f, caps=caps).write_all(columns, rows)
+        lines = f.getvalue().split("\n", 2)[2]
+    expected = [
+        "(" + ",".join(escape_literal(row.get(name)) for name in columns) + ")" for row in rows
+    ]
+    assert lines == ",\n".join(expected) + ";"
+
+
+def test_arrow_insert_writer() -> None:
+    from dlt.common.libs.pyarrow import pyarrow as pa
+
+    rows: List[Dict[str, Any]] = [
+        {"int": 1, "str": "a'b", "timestamp": pendulum.from_timestamp(1658928602.575267)},
+        {"int": None, "str": "c", "timestamp": None},
+    ]
+    columns = row_to_column_schemas(rows[0])
+    with io.StringIO() as f:
+        InsertValuesWriter(f, caps=redshift_caps()).write_all(columns, rows)
+        expected = f.getvalue()
+    with io.StringIO() as f:
+        writer = ArrowToInsertValuesWriter(f, caps=redshift_caps())
+        table = pa.Table.from_pylist(rows)
+        # columns in different order than in the header
+        writer.write_all(columns, [table.select(["str", "timestamp", "int"]), table.slice(0, 0)])
+        assert writer.items_count == 2
+        assert f.getvalue() == expected
+
+
 @pytest.mark.skip("not implemented")
 def test_unicode_insert_writer_postgres() -> None:
     # implements tests for the postgres encoding -> same cases as redshift
@@ -191,6 +191,45 @@ def test_coerce_row_iso_timestamp(schema: Schema) -> None:
     assert new_columns[0]["name"] == "timestamp__v_text"
 
 
+def test_coerce_row_with_value_coercers(schema: Schema) -> None:
+    _add_preferred_types(schema)
+    timestamp_str = "2022-05-10T00:17:15.300000+00:00"
+    timestamp = pendulum.parse(timestamp_str)
+    row = {"timestamp": timestamp_str, "count": 1}
+    _, new_table = schema.coerce_row("event_user", None, row)
+    schema.update_table(new_table)
+
+    # existing columns create coercers by data type and python type
+    new_row, new_table = schema.coerce_row("event_user", None, row)
+    assert new_table is None
+    assert new_row == {"timestamp": timestamp, "count": 1}
+    assert schema._value_coercers[("bigint", int)] is None
+    assert ("timestamp", str) in schema._value_coercers
+
+    # coercers give the same results as full coercion
+    new_row, new_table = schema.coerce_row("event_user", None, row)
+    assert new_table is None
+    assert new_row == {"timestamp": timestamp, "count": 1}
+    # value that does not coerce still creates variant
+    new_row, new_table = schema.coerce_row("event_user", None, {"timestamp": "übermorgen"})
+    assert new_row == {"timestamp__v_text": "übermorgen"}
+    assert list(new_table["columns"]) == ["timestamp__v_text"]
+
+    # data type changed in place is picked up without invalidation
+    schema.tables["event_user"]["columns"]["count"]["data_type"] = "text"
+    new_row, new_table = schema.coerce_row("event_user", None, row)
+    assert new_table is None
+    assert new_row == {"timestamp": timestamp, "count": "1"}
+
+    # variant types are never passed through
+    row = {"evm": Wei.from_int256(2137 * 10**16, decimals=18)}
+    _, new_table = schema.coerce_row("eth", None, row)
+    schema.update_table(new_table)
+    schema.coerce_row("eth", None, row)
+    new_row, new_table = schema.coerce_row("eth", None, {"evm": Wei.from_int256(2**256 - 1)})
+    assert list(new_row) == ["evm__v_str"]
+
+
 def test_shorten_variant_column(schema: Schema) -> None:
     schema.naming.max_length = 9
     _add_preferred_types(schema)
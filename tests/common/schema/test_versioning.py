@@ -45,6 +45,17 @@ def test_content_hash() -> None:
     assert utils.generate_version_hash(eth_v4) != hash2
 
 
+def test_content_hash_stable() -> None:
+    # hashes of stored schemas must not change
+    for case in ["ethereum_schema_v7", "ethereum_schema_v8", "ethereum_schema_v9"]:
+        eth: TStoredSchema = load_yml_case(f"schemas/eth/{case}")
+        assert utils.generate_version_hash(eth) == eth["version_hash"]
+        schema = Schema.from_dict(eth)  # type: ignore[arg-type]
+        assert not schema.is_modified
+        assert schema.version_hash == eth["version_hash"]
+        assert schema.version == eth["version"]
+
+
 def test_bump_version_no_stored_hash() -> None:
     eth_v3: TStoredSchema = load_yml_case("schemas/eth/ethereum_schema_v3")
     assert "version_hash" not in eth_v3
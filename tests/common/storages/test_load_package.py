@@ -1,5 +1,7 @@
 import os
 import pytest
+from concurrent.futures import ThreadPoolExecutor
+from unittest import mock
 from pathlib import Path
 from os.path import join
 
@@ -7,6 +9,7 @@ import dlt
 
 from dlt.common import sleep
 from dlt.common.schema import Schema
+from dlt.common.schema.utils import new_table
 from dlt.common.storages import PackageStorage, LoadStorage, ParsedLoadJobFileName
 from dlt.common.utils import uniq_id
 
@@ -218,6 +221,144 @@ def test_retry_job(load_storage: LoadStorage) -> None:
     assert ParsedLoadJobFileName.parse(new_fp).retry_count == 2
 
 
+def test_jobs_index(load_storage: LoadStorage) -> None:
+    def _jobs_from_disk(load_id: str):
+        # new storage instance reads the jobs from disk
+        storage = PackageStorage(load_storage.normalized_packages.storage, "normalized")
+        return sorted(
+            (job.state, job.file_path, job.failed_message) for job in storage.list_all_jobs(load_id)
+        )
+
+    def _indexed_jobs(load_id: str):
+        return sorted(
+            (job.state, job.file_path, job.failed_message)
+            for job in packages.list_all_jobs(load_id)
+        )
+
+    packages = load_storage.normalized_packages
+    load_id, fn = start_loading_file(load_storage, [{"content": "a"}], start_job=False)
+    # build the index
+    assert [job.state for job in packages.list_all_jobs(load_id)] == ["new_jobs"]
+    packages.start_job(load_id, fn)
+    assert _indexed_jobs(load_id) == _jobs_from_disk(load_id)
+    new_fp = packages.retry_job(load_id, fn)
+    assert _indexed_jobs(load_id) == _jobs_from_disk(load_id)
+    fn = Path(new_fp).name
+    packages.start_job(load_id, fn)
+    packages.fail_job(load_id, fn, "failed")
+    assert _indexed_jobs(load_id) == _jobs_from_disk(load_id)
+    assert [job.failed_message for job in packages.list_jobs_for_table(load_id, "mock_table")] == [
+        "failed"
+    ]
+    # import a job
+    file_path = load_storage.normalized_packages.storage.make_full_path("mock_table.abc.0.jsonl")
+    with open(file_path, "w", encoding="utf-8") as f:
+        f.write("{}")
+    packages.import_job(load_id, file_path, "started_jobs")
+    packages.complete_job(load_id, "mock_table.abc.0.jsonl")
+    assert _indexed_jobs(load_id) == _jobs_from_disk(load_id)
+    assert len(packages.list_jobs_for_table(load_id, "mock_table")) == 2
+    assert packages.list_jobs_for_table(load_id, "other_table") == []
+
+
+def test_jobs_index_concurrent_moves(load_storage: LoadStorage) -> None:
+    packages = load_storage.normalized_packages
+    load_id, fn = start_loading_file(load_storage, [{"content": "a"}], start_job=False)
+    file_names = [fn]
+    for _ in range(100):
+        file_name = f"mock_table.{uniq_id()}.0.jsonl"
+        file_path = packages.storage.make_full_path(file_name)
+        with open(file_path, "w", encoding="utf-8") as f:
+            f.write("{}")
+        packages.import_job(load_id, file_path)
+        file_names.append(file_name)
+
+    with ThreadPoolExecutor(4) as pool:
+        futures = [pool.submit(packages.start_job, load_id, file_name) for file_name in file_names]
+        # index and package info are built from disk while jobs are moved
+        while not all(future.done() for future in futures):
+            packages._drop_jobs_index(load_id)
+            assert len(packages.list_all_jobs(load_id)) == len(file_names)
+            assert len(packages.get_load_package_info(load_id).jobs["new_jobs"]) <= len(file_names)
+        for future in futures:
+            future.result()
+    assert {job.state for job in packages.list_all_jobs(load_id)} == {"started_jobs"}
+
+
+def test_load_package_info_cache(load_storage: LoadStorage) -> None:
+    packages = load_storage.normalized_packages
+    load_id, fn = start_loading_file(load_storage, [{"content": "a"}], start_job=False)
+    assert packages.get_load_package_jobs_counts(load_id) == {
+        "new_jobs": 1,
+        "started_jobs": 0,
+        "failed_jobs": 0,
+        "completed_jobs": 0,
+    }
+    info = packages.get_load_package_info(load_id)
+    # package is not read again if it did not change
+    with mock.patch.object(
+        packages, "_read_load_package_info", side_effect=AssertionError("package read")
+    ):
+        cached_info = packages.get_load_package_info(load_id)
+    # but each caller gets its own schema
+    assert cached_info.schema is not info.schema
+    assert cached_info.schema.version_hash == info.schema.version_hash
+    info.schema.update_table(new_table("new_table"))
+    cached_info.schema.update_table(new_table("other_table"))
+    assert packages.get_load_package_info(load_id).schema.tables.keys() == {
+        "_dlt_version",
+        "_dlt_loads",
+    }
+    packages.start_job(load_id, fn)
+    info_started = packages.get_load_package_info(load_id)
+    assert len(info_started.jobs["started_jobs"]) == 1
+    assert packages.get_load_package_jobs_counts(load_id)["started_jobs"] == 1
+    # other storage instance changes the package
+    PackageStorage(packages.storage, "normalized").complete_job(load_id, fn)
+    assert len(packages.get_load_package_info(load_id).jobs["completed_jobs"]) == 1
+    assert packages.get_load_package_jobs_counts(load_id)["completed_jobs"] == 1
+    # elapsed time is still counted
+    elapsed = packages.get_load_package_info(load_id).jobs["completed_jobs"][0].elapsed
+    sleep(0.1)
+    assert packages.get_load_package_info(load_id).jobs["completed_jobs"][0].elapsed > elapsed
+    # cache entry is dropped with the package
+    packages.delete_package(load_id)
+    assert load_id not in packages._package_info_cache
+
+
+def test_jobs_journal(load_storage: LoadStorage) -> None:
+    load_id, fn = start_loading_file(load_storage, [{"content": "a"}], start_job=False)
+    packages = PackageStorage(load_storage.normalized_packages.storage, "normalized", True)
+    new_path = packages.get_job_file_path(load_id, "new_jobs", fn)
+    # job file is not moved
+    assert packages.start_job(load_id, fn) == packages.storage.make_full_path(new_path)
+    assert packages.storage.has_file(new_path)
+    assert packages.list_started_jobs(load_id) == [new_path]
+    assert packages.list_new_jobs(load_id) == []
+    # other instance without the journal sees the journaled state
+    other_packages = PackageStorage(packages.storage, "normalized")
+    assert other_packages.list_started_jobs(load_id) == [new_path]
+    assert other_packages.get_load_package_jobs_counts(load_id)["started_jobs"] == 1
+    packages.complete_job(load_id, fn)
+    assert [job.state for job in other_packages.list_all_jobs(load_id)] == ["completed_jobs"]
+    # torn last entry is ignored
+    packages._close_jobs_journal(load_id)
+    with packages.storage.open_file(packages._get_jobs_journal_path(load_id), "a") as f:
+        f.write('{"job": "' + fn)
+    assert PackageStorage(packages.storage, "normalized", True).list_started_jobs(load_id) == []
+    # failed jobs are moved
+    load_id, fn = start_loading_file(load_storage, [{"content": "a"}], start_job=False)
+    packages.start_job(load_id, fn)
+    packages.fail_job(load_id, fn, "failed")
+    assert packages.get_load_package_jobs_counts(load_id)["failed_jobs"] == 1
+    assert packages.storage.has_file(packages.get_job_file_path(load_id, "failed_jobs", fn))
+    assert packages.get_load_package_info(load_id).jobs["failed_jobs"][0].failed_message == "failed"
+    # job files are moved to their folders when package completes
+    packages.complete_loading_package(load_id, "loaded")
+    assert not packages.storage.has_file(packages._get_jobs_journal_path(load_id))
+    assert packages.storage.has_file(packages.get_job_file_path(load_id, "failed_jobs", fn))
+
+
 def test_build_parse_job_path(load_storage: LoadStorage) -> None:
     file_id = ParsedLoadJobFileName.new_file_id()
     f_n_t = ParsedLoadJobFileName("test_table", file_id, 0, "jsonl")
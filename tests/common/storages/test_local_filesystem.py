@@ -3,8 +3,18 @@ import itertools
 import pytest
 import pathlib
 
-from dlt.common.storages import fsspec_from_config, FilesystemConfiguration
-from dlt.common.storages.fsspec_filesystem import FileItemDict, glob_files
+from dlt.common.storages import (
+    fsspec_from_config,
+    fsspec_from_config_pooled,
+    FilesystemConfiguration,
+)
+from dlt.common.storages.fsspec_filesystem import (
+    FSSPEC_POOL_MAX_SIZE,
+    FileItemDict,
+    clear_fsspec_pool,
+    evict_fsspec_from_pool,
+    glob_files,
+)
 
 from tests.common.storages.utils import assert_sample_files
 
@@ -54,3 +64,52 @@ def test_filesystem_decompress() -> None:
         # read as uncompressed binary
         with file_dict.open(compression="enable") as f:
             assert f.read().startswith(b'"1200864931","2015-07-01 00:00:13"')
+
+
+def test_filesystem_pooled() -> None:
+    clear_fsspec_pool()
+    config = FilesystemConfiguration(bucket_url=TEST_SAMPLE_FILES)
+    filesystem, url = fsspec_from_config_pooled(config)
+    # equal config gets the same instance
+    filesystem_2, url_2 = fsspec_from_config_pooled(
+        FilesystemConfiguration(bucket_url=TEST_SAMPLE_FILES)
+    )
+    assert filesystem is filesystem_2
+    assert url == url_2
+    # different fsspec args get a new instance
+    filesystem_3, _ = fsspec_from_config_pooled(
+        FilesystemConfiguration(bucket_url=TEST_SAMPLE_FILES, kwargs={"auto_mkdir": True})
+    )
+    assert filesystem_3 is not filesystem
+    assert filesystem_3.auto_mkdir is True
+    # different bucket is pooled separately and returns a different path
+    _, url_4 = fsspec_from_config_pooled(
+        FilesystemConfiguration(bucket_url=os.path.join(TEST_SAMPLE_FILES, "csv"))
+    )
+    assert url_4 != url
+    # evicted instance is created again, skip fsspec instance cache to get a new instance
+    config = FilesystemConfiguration(
+        bucket_url=TEST_SAMPLE_FILES, kwargs={"skip_instance_cache": True}
+    )
+    filesystem, _ = fsspec_from_config_pooled(config)
+    assert fsspec_from_config_pooled(config)[0] is filesystem
+    evict_fsspec_from_pool(config)
+    assert fsspec_from_config_pooled(config)[0] is not filesystem
+    clear_fsspec_pool()
+
+
+def test_filesystem_pool_max_size() -> None:
+    clear_fsspec_pool()
+    configs = [
+        FilesystemConfiguration(
+            bucket_url=os.path.join(TEST_SAMPLE_FILES, str(idx)),
+            kwargs={"skip_instance_cache": True},
+        )
+        for idx in range(FSSPEC_POOL_MAX_SIZE + 1)
+    ]
+    filesystems = [fsspec_from_config_pooled(config)[0] for config in configs]
+    # most recently used instances are kept
+    assert fsspec_from_config_pooled(configs[-1])[0] is filesystems[-1]
+    # least recently used instance was dropped
+    assert fsspec_from_config_pooled(configs[0])[0] is not filesystems[0]
+    clear_fsspec_pool()
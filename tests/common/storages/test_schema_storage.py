@@ -7,6 +7,7 @@ from dlt.common import json
 from dlt.common.normalizers import explicit_normalizers
 from dlt.common.schema.schema import Schema
 from dlt.common.schema.typing import TStoredSchema
+from dlt.common.schema.utils import new_table
 from dlt.common.storages.exceptions import (
     InStorageSchemaModified,
     SchemaNotFoundError,
@@ -326,6 +327,25 @@ def test_save_store_schema(storage: SchemaStorage) -> None:
     assert loaded_schema.to_dict() == schema.to_dict()
 
 
+def test_save_unchanged_schema(storage: SchemaStorage) -> None:
+    schema = Schema("event")
+    storage.save_schema(schema)
+    schema_file = SchemaStorage.NAMED_SCHEMA_FILE_PATTERN % ("event", "json")
+    schema_path = storage.storage.make_full_path(schema_file)
+    # file is not written again if schema did not change
+    os.utime(schema_path, ns=(0, 0))
+    storage.save_schema(storage.load_schema("event"))
+    assert os.stat(schema_path).st_mtime_ns == 0
+    schema.update_table(new_table("event_table"))
+    storage.save_schema(schema)
+    assert os.stat(schema_path).st_mtime_ns != 0
+    assert storage.load_schema("event").version_hash == schema.version_hash
+    # file removed or modified externally is written
+    storage.storage.delete(schema_file)
+    storage.save_schema(schema)
+    assert storage.has_schema("event")
+
+
 def test_schema_from_file() -> None:
     # json has precedence
     schema = SchemaStorage.load_schema_file(
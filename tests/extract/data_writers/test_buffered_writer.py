@@ -165,6 +165,30 @@ def test_rotation_on_schema_change(disable_compression: bool) -> None:
     assert len(writer.closed_files) == 2
 
 
+def test_columns_copied_on_change() -> None:
+    c1 = new_column("col1", "bigint")
+    c2 = new_column("col2", "bigint")
+    t1 = {"col1": c1}
+
+    with get_writer(InsertValuesWriter, buffer_max_items=2, file_max_items=100) as writer:
+        writer.write_data_item([{"col1": 1}], t1)
+        current_columns = writer._current_columns
+        assert current_columns == t1
+        assert current_columns is not t1
+        # same instance with the same columns is not copied again
+        writer.write_data_item([{"col1": 2}], t1)
+        assert writer._current_columns is current_columns
+        # file got written
+        assert writer._file is not None
+        old_file = writer._file_name
+        # columns added in place to the same instance are detected
+        t1["col2"] = c2
+        writer.write_data_item([{"col1": 3, "col2": 3}], t1)
+        assert writer._current_columns == {"col1": c1, "col2": c2}
+        assert writer._file_name != old_file
+    assert len(writer.closed_files) == 2
+
+
 @pytest.mark.parametrize(
     "disable_compression", [True, False], ids=["no_compression", "compression"]
 )
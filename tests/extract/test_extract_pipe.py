@@ -1,7 +1,7 @@
 import os
 import asyncio
 import inspect
-from typing import List, Sequence
+from typing import Callable, List, Sequence
 import time
 
 import pytest
@@ -662,6 +662,52 @@ def test_close_on_async_exception() -> None:
     assert_pipes_closed(raise_gen, long_gen)
 
 
+def test_futures_pool_signals_done_futures() -> None:
+    from concurrent.futures import TimeoutError as FutureTimeoutError
+    from dlt.extract.concurrency import FuturesPool
+    from dlt.extract.items import ResolvablePipeItem
+
+    def _sleep_and_return(seconds: float, value: int) -> Callable[[], int]:
+        def _f() -> int:
+            time.sleep(seconds)
+            return value
+
+        return _f
+
+    pipe = Pipe.from_data("data", [1])
+    # long poll interval: results must be returned as soon as future is done
+    pool = FuturesPool(workers=2, poll_interval=60.0, max_parallel_items=1)
+    try:
+        pool.submit(ResolvablePipeItem(_sleep_and_return(0.05, 1), 0, pipe, None))
+        # no free slot, submit waits until first future is done
+        pool.submit(ResolvablePipeItem(lambda: 2, 0, pipe, None))
+        assert len(pool) == 2
+        started_at = time.time()
+        items = [pool.resolve_next_future(use_configured_timeout=True).item for _ in range(2)]
+        assert time.time() - started_at < 30.0
+        assert items == [1, 2]
+        assert pool.empty and pool.free_slots == 1
+        # timeout when nothing gets done
+        pool.poll_interval = 0.05
+        pool.submit(ResolvablePipeItem(_sleep_and_return(0.5, 3), 0, pipe, None))
+        with pytest.raises(FutureTimeoutError):
+            pool.resolve_next_future(use_configured_timeout=True)
+        assert pool.resolve_next_future().item == 3
+    finally:
+        pool.close()
+
+    # cancelled futures are removed from the pool and do not count as done
+    pool = FuturesPool(workers=1, poll_interval=60.0, max_parallel_items=2)
+    try:
+        pool.submit(ResolvablePipeItem(_sleep_and_return(0.2, 4), 0, pipe, None))
+        # waits in the thread pool queue so it may be cancelled
+        assert pool.submit(ResolvablePipeItem(_sleep_and_return(0, 5), 0, pipe, None)).cancel()
+        assert pool.resolve_next_future().item == 4
+        assert pool.empty and pool._done_count == 0 and pool.free_slots == 2
+    finally:
+        pool.close()
+
+
 def test_close_on_thread_pool_exception() -> None:
     global close_pipe_got_exit, close_pipe_yielding
     close_pipe_got_exit = False
@@ -28,6 +28,7 @@ from dlt.extract.incremental.exceptions import (
     IncrementalCursorPathMissing,
     IncrementalPrimaryKeyMissing,
 )
+from dlt.extract.incremental.transform import unpack_unique_hashes
 from dlt.pipeline.exceptions import PipelineStepFailed
 
 from tests.extract.utils import AssertItems, data_item_to_list
@@ -199,6 +200,53 @@ def test_unique_rows_by_hash_are_deduplicated(item_type: TestDataItemFormat) ->
     assert rows == [(1, "a"), (2, "b"), (3, "c"), (3, "d"), (3, "e"), (3, "f"), (4, "g")]
 
 
+@pytest.mark.parametrize("primary_key", ["id", ("id", "updated_at"), None])
+def test_arrow_unique_values_match_row_hashes(primary_key: Any) -> None:
+    from dlt.common.libs.pyarrow import pyarrow as pa
+    from dlt.extract.incremental.transform import ArrowIncremental
+
+    rows = [
+        {"id": i, "name": f"row {i}", "updated_at": pendulum.datetime(2024, 1, 1, i % 24)}
+        for i in range(50)
+    ]
+    transform = ArrowIncremental(
+        "some_data", "updated_at", None, None, None, max, primary_key, set()
+    )
+    if primary_key is None:
+        unique_columns = ["id", "name", "updated_at"]
+    else:
+        unique_columns = [primary_key] if isinstance(primary_key, str) else list(primary_key)
+    tbl = pa.Table.from_pylist(rows)
+    # hashes computed column wise are the same as hashes of python rows
+    assert transform.compute_unique_values(tbl, unique_columns, primary_key) == [
+        transform.compute_unique_value(row, primary_key)
+        for row in tbl.select(unique_columns).to_pylist()
+    ]
+
+
+@pytest.mark.parametrize("item_type", ALL_TEST_DATA_ITEM_FORMATS)
+def test_many_unique_hashes(item_type: TestDataItemFormat) -> None:
+    # all rows share the same cursor value
+    data = [{"created_at": 1, "id": i} for i in range(200)]
+    source_items = data_to_item_format(item_type, data)
+
+    @dlt.resource(primary_key="id")
+    def some_data(created_at=dlt.sources.incremental("created_at")):
+        yield from source_items
+
+    with Container().injectable_context(StateInjectableContext(state={})):
+        r = some_data()
+        assert len(data_item_to_list(item_type, list(r))) == len(data)
+        unique_hashes = r.state["incremental"]["created_at"]["unique_hashes"]
+        # many hashes are packed into a single string
+        assert isinstance(unique_hashes, str)
+        assert unpack_unique_hashes(unique_hashes) == {
+            digest128(json.dumps(i)) for i in range(len(data))
+        }
+        # all rows are deduplicated in the next run
+        assert list(some_data()) == []
+
+
 def test_nested_cursor_path() -> None:
     @dlt.resource
     def some_data(created_at=dlt.sources.incremental("data.items[0].created_at")):
@@ -125,3 +125,37 @@ def test_duck_precision_types(destination_config: DestinationTestConfiguration)
     table_row.pop("_dlt_id")
     table_row.pop("_dlt_load_id")
     assert table_row == row[0]
+
+
+@pytest.mark.parametrize(
+    "destination_config",
+    destinations_configs(default_sql_configs=True, subset=["duckdb"]),
+    ids=lambda x: x.name,
+)
+def test_duck_multi_file_load(destination_config: DestinationTestConfiguration) -> None:
+    from dlt.destinations.impl.duckdb.duck import DuckDbClient
+
+    # rotate parquet files every 10 items
+    os.environ["DATA_WRITER__FILE_MAX_ITEMS"] = "10"
+    os.environ["LOAD__MAX_FILES_PER_LOAD_JOB"] = "4"
+    loaded_files = []
+    start_file_loads = DuckDbClient.start_file_loads
+
+    def _start_file_loads(self, table, file_paths, load_id):
+        loaded_files.append(len(file_paths))
+        return start_file_loads(self, table, file_paths, load_id)
+
+    pipeline = destination_config.setup_pipeline("test_duck_multi_file_load")
+    with pytest.MonkeyPatch.context() as mp:
+        mp.setattr(DuckDbClient, "start_file_loads", _start_file_loads)
+        info = pipeline.run(
+            [{"id": i, "name": f"row {i}"} for i in range(100)],
+            table_name="items",
+            loader_file_format="parquet",
+        )
+    info.raise_on_failed_jobs()
+    assert load_table_counts(pipeline, "items") == {"items": 100}
+    # 10 files loaded in groups of at most 4
+    assert sorted(loaded_files) == [2, 4, 4]
+    completed_jobs = info.load_packages[0].jobs["completed_jobs"]
+    assert len([job for job in completed_jobs if job.job_file_info.table_name == "items"]) == 10
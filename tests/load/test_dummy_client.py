@@ -380,6 +380,66 @@ def test_completed_loop_with_delete_completed() -> None:
     assert_complete_job(load, should_delete_completed=True)
 
 
+def test_refill_free_worker_slots() -> None:
+    # single worker must process all the new jobs in a single run
+    os.environ["LOAD__WORKERS"] = "1"
+    load = setup_loader(client_config=DummyClientConfiguration(completed_prob=1.0))
+    assert load.config.workers == 1
+    load_id, _ = prepare_load_package(load.load_storage, NORMALIZED_FILES)
+    with ThreadPoolExecutor(max_workers=1) as pool:
+        load.run(pool)
+    package_info = load.load_storage.normalized_packages.get_load_package_info(load_id)
+    assert len(package_info.jobs["new_jobs"]) == 0
+    assert len(package_info.jobs["completed_jobs"]) == 2
+    assert len(dummy_impl.JOBS) == 2
+
+
+def test_reuse_job_clients() -> None:
+    os.environ["LOAD__WORKERS"] = "1"
+    load = setup_loader(client_config=DummyClientConfiguration(completed_prob=1.0))
+    load_id, schema = prepare_load_package(load.load_storage, NORMALIZED_FILES)
+    entered: List[dummy_impl.DummyClient] = []
+    exited: List[dummy_impl.DummyClient] = []
+
+    def _enter(self):
+        entered.append(self)
+        return self
+
+    def _exit(self, exc_type, exc_val, exc_tb):
+        exited.append(self)
+
+    with patch.object(dummy_impl.DummyClient, "__enter__", _enter), patch.object(
+        dummy_impl.DummyClient, "__exit__", _exit
+    ):
+        # jobs reuse a single client
+        with load.borrow_destination_client(schema) as client:
+            pass
+        with load.borrow_destination_client(schema) as client_2:
+            assert client_2 is client
+        # failed job closes the client
+        with pytest.raises(ValueError):
+            with load.borrow_destination_client(schema) as client_2:
+                raise ValueError()
+        assert exited == [client]
+        with load.borrow_destination_client(schema) as client_2:
+            assert client_2 is not client
+        # expired clients are closed
+        load.config.job_client_max_idle_time = 0.0001
+        sleep(0.01)
+        with load.borrow_destination_client(schema) as client:
+            assert client is not client_2
+        assert exited[-1] is client_2
+        # run closes all clients in the pool
+        load.config.job_client_max_idle_time = 30.0
+        entered.clear()
+        exited.clear()
+        load.run(None)
+        # client to init the dataset and a single client for both jobs
+        assert len(dummy_impl.JOBS) == 2
+        assert len(entered) == 2
+        assert set(entered).issubset(exited)
+
+
 def test_retry_on_new_loop() -> None:
     # test job that retries sitting in new jobs
     load = setup_loader(client_config=DummyClientConfiguration(retry_prob=1.0))
@@ -3,10 +3,12 @@ from fnmatch import fnmatch
 from typing import Dict, Iterator, List, Sequence, Tuple
 from concurrent.futures import ThreadPoolExecutor, ProcessPoolExecutor
 
-from dlt.common import json
+from dlt.common import json, pendulum, Decimal
 from dlt.common.destination.capabilities import TLoaderFileFormat
 from dlt.common.schema.schema import Schema
+from dlt.common.schema.utils import new_table
 from dlt.common.storages.exceptions import SchemaNotFoundError
+from dlt.common.schema.typing import TSimpleRegex
 from dlt.common.typing import StrAny
 from dlt.common.data_types import TDataType
 from dlt.common.storages import NormalizeStorage, LoadStorage, ParsedLoadJobFileName, PackageStorage
@@ -425,6 +427,182 @@ def test_schema_changes(caps: DestinationCapabilitiesContext, raw_normalize: Nor
     } == set(doc__comp_table["columns"].keys())
 
 
+@pytest.mark.parametrize("caps", ALL_CAPABILITIES, indirect=True)
+def test_normalize_flat_rows(
+    caps: DestinationCapabilitiesContext, raw_normalize: Normalize
+) -> None:
+    from dlt.normalize.items_normalizers import JsonLItemsNormalizer
+
+    calls: List[str] = []
+    normalize_chunk = JsonLItemsNormalizer._normalize_chunk
+
+    def _normalize_chunk(self, root_table_name, items, may_have_pua, skip_write):
+        calls.append(root_table_name)
+        return normalize_chunk(self, root_table_name, items, may_have_pua, skip_write)
+
+    docs = [{"str": "text", "int": i, "f": 1.5, "bool": None} for i in range(10)]
+    docs[0]["bool"] = True
+    extract_items(raw_normalize.normalize_storage, docs, Schema("flat"), "doc")
+    normalize_pending(raw_normalize)
+    schema = raw_normalize.schema_storage.load_schema("flat")
+
+    with pytest.MonkeyPatch.context() as mp:
+        mp.setattr(JsonLItemsNormalizer, "_normalize_chunk", _normalize_chunk)
+        # rows with known columns and types are written in a batch
+        extract_items(raw_normalize.normalize_storage, docs, schema, "doc")
+        load_id = normalize_pending(raw_normalize)
+        assert calls == []
+        _, table_files = expect_load_package(
+            raw_normalize.load_storage,
+            caps.preferred_loader_file_format,
+            load_id,
+            ["doc"],
+            full_schema_update=False,
+        )
+        if caps.preferred_loader_file_format == "jsonl":
+            with raw_normalize.load_storage.normalized_packages.storage.open_file(
+                table_files["doc"][0]
+            ) as f:
+                rows = [json.loads(line) for line in f]
+            assert [row["int"] for row in rows] == list(range(10))
+            assert all(row["_dlt_load_id"] == load_id and row["_dlt_id"] for row in rows)
+            # None values are removed
+            assert rows[0]["bool"] is True
+            assert "bool" not in rows[1]
+        metrics = raw_normalize.get_step_info(MockPipeline("flat", True)).metrics[load_id][0]  # type: ignore[abstract]
+        assert metrics["table_metrics"]["doc"].items_count == 10
+
+        # value that requires coercion goes through the row by row path
+        schema = raw_normalize.schema_storage.load_schema("flat")
+        extract_items(raw_normalize.normalize_storage, [{"int": "1"}], schema, "doc")
+        normalize_pending(raw_normalize)
+        assert calls == ["doc"]
+    schema = raw_normalize.schema_storage.load_schema("flat")
+    assert "int__v_text" not in schema.tables["doc"]["columns"]
+
+
+@pytest.mark.parametrize("caps", JSONL_CAPS, indirect=True)
+def test_normalize_flat_rows_not_normalized_keys(
+    caps: DestinationCapabilitiesContext, raw_normalize: Normalize
+) -> None:
+    # flattened nested field creates `a__b` column
+    extract_items(
+        raw_normalize.normalize_storage, [{"id": 1, "a": {"b": 1}}], Schema("flat"), "doc"
+    )
+    normalize_pending(raw_normalize)
+    schema = raw_normalize.schema_storage.load_schema("flat")
+    assert schema.tables["doc"]["columns"]["a__b"]["data_type"] == "bigint"
+
+    # `a__b` key is normalized into `a_b` and must not be written into `a__b`
+    extract_items(raw_normalize.normalize_storage, [{"id": 2, "a__b": 2}], schema, "doc")
+    load_id = normalize_pending(raw_normalize)
+    schema = raw_normalize.schema_storage.load_schema("flat")
+    assert schema.tables["doc"]["columns"]["a_b"]["data_type"] == "bigint"
+    _, table_files = expect_load_package(
+        raw_normalize.load_storage, "jsonl", load_id, ["doc"], full_schema_update=False
+    )
+    with raw_normalize.load_storage.normalized_packages.storage.open_file(
+        table_files["doc"][0]
+    ) as f:
+        rows = [json.loads(line) for line in f]
+    assert [(row["id"], row["a_b"]) for row in rows] == [(2, 2)]
+    assert "a__b" not in rows[0]
+
+
+@pytest.mark.parametrize("caps", JSONL_CAPS, indirect=True)
+def test_normalize_flat_typed_rows(
+    caps: DestinationCapabilitiesContext, raw_normalize: Normalize
+) -> None:
+    from dlt.normalize.items_normalizers import JsonLItemsNormalizer
+
+    calls: List[str] = []
+    normalize_chunk = JsonLItemsNormalizer._normalize_chunk
+
+    def _normalize_chunk(self, root_table_name, items, may_have_pua, skip_write):
+        calls.append(root_table_name)
+        return normalize_chunk(self, root_table_name, items, may_have_pua, skip_write)
+
+    def _docs() -> List[StrAny]:
+        return [
+            {
+                "id": i,
+                "ts": pendulum.datetime(2024, 1, 1, i),
+                "day": pendulum.date(2024, 1, i + 1),
+                "amount": Decimal(f"{i}.5"),
+                "raw": b"bytes",
+            }
+            for i in range(10)
+        ]
+
+    extract_items(raw_normalize.normalize_storage, _docs(), Schema("typed"), "doc")
+    normalize_pending(raw_normalize)
+    schema = raw_normalize.schema_storage.load_schema("typed")
+
+    with pytest.MonkeyPatch.context() as mp:
+        mp.setattr(JsonLItemsNormalizer, "_normalize_chunk", _normalize_chunk)
+        # typed values are decoded and rows written in a batch
+        extract_items(raw_normalize.normalize_storage, _docs(), schema, "doc")
+        load_id = normalize_pending(raw_normalize)
+        assert calls == []
+        _, table_files = expect_load_package(
+            raw_normalize.load_storage,
+            caps.preferred_loader_file_format,
+            load_id,
+            ["doc"],
+            full_schema_update=False,
+        )
+        with raw_normalize.load_storage.normalized_packages.storage.open_file(
+            table_files["doc"][0]
+        ) as f:
+            rows = [json.loads(line) for line in f]
+        assert rows[1]["ts"] == "2024-01-01T01:00:00+00:00"
+        assert rows[1]["day"] == "2024-01-02"
+        assert rows[1]["amount"] == "1.5"
+
+        # typed value not matching the column type goes through the row by row path
+        schema = raw_normalize.schema_storage.load_schema("typed")
+        extract_items(
+            raw_normalize.normalize_storage, [{"id": 1, "day": pendulum.now()}], schema, "doc"
+        )
+        normalize_pending(raw_normalize)
+        assert calls == ["doc"]
+
+
+def test_flat_row_columns_cache() -> None:
+    from dlt.normalize.items_normalizers import JsonLItemsNormalizer
+
+    schema = Schema("flat")
+    schema.update_table(
+        new_table(
+            "doc",
+            columns=[
+                {"name": "_dlt_id", "data_type": "text", "nullable": False},
+                {"name": "_dlt_load_id", "data_type": "text", "nullable": False},
+                {"name": "value", "data_type": "bigint"},
+                {"name": "evm", "data_type": "wei"},
+            ],
+        )
+    )
+    normalizer = JsonLItemsNormalizer(None, None, schema, "load_id", None)
+    flat_columns = normalizer._flat_row_columns("doc")
+    assert flat_columns["value"] == (int, True)
+    assert flat_columns["_dlt_id"] == (str, False)
+    # variant types always go through coercion
+    assert "evm" not in flat_columns
+    assert normalizer._flat_row_columns("doc") is flat_columns
+    # new column rebuilds the plan
+    schema.update_table(new_table("doc", columns=[{"name": "name", "data_type": "text"}]))
+    assert normalizer._flat_row_columns("doc")["name"] == (str, True)
+    # rows may not be written directly if schema has filters
+    doc_table = new_table("doc")
+    doc_table["filters"] = {"excludes": [TSimpleRegex("re:^value$")], "includes": []}
+    schema.update_table(doc_table)
+    schema._compile_settings()
+    assert schema.has_row_filters
+    normalizer = JsonLItemsNormalizer(None, None, schema, "load_id", None)
+    assert normalizer._flat_row_columns("doc") is None
+
+
 @pytest.mark.parametrize("caps", ALL_CAPABILITIES, indirect=True)
 def test_normalize_twice_with_flatten(
     caps: DestinationCapabilitiesContext, raw_normalize: Normalize
@@ -506,42 +684,159 @@ def test_collect_metrics_on_exception(raw_normalize: Normalize) -> None:
     raw_normalize.get_step_info(MockPipeline("multiprocessing_pipeline", True))  # type: ignore[abstract]
 
 
+def test_parallel_schema_conflict(raw_normalize: Normalize) -> None:
+    schema = Schema("conflict")
+    extractor = ExtractStorage(raw_normalize.normalize_storage.config)
+    load_id = extractor.create_load_package(schema)
+    item_storage = extractor.item_storages["object"]
+    # each close creates a new extracted file, each file goes to a separate worker
+    for items, table_name in [
+        ([{"value": 1}] * 10, "doc"),
+        ([{"value": "text"}] * 10, "doc"),
+        ([{"value": 1, "nested": [{"a": 1}]}] * 10, "other"),
+    ]:
+        item_storage.write_data_item(load_id, schema.name, table_name, items, None)
+        extractor.close_writers(load_id)
+    extractor.commit_new_load_package(load_id, schema)
+
+    # thread pool shares schema instance with the workers, use process pool to get conflicts
+    with ProcessPoolExecutor(max_workers=2) as pool:
+        raw_normalize.run(pool)
+    step_info = raw_normalize.get_step_info(MockPipeline("conflict_pipeline", True))  # type: ignore[abstract]
+    # conflicting table was normalized again and other tables were preserved
+    assert step_info.row_counts == {"doc": 20, "other": 10, "other__nested": 10}
+    schema = raw_normalize.schema_storage.load_schema("conflict")
+    doc_columns = schema.get_table_columns("doc")
+    # type of the column is decided by the worker that finished first
+    if doc_columns["value"]["data_type"] == "bigint":
+        assert doc_columns["value__v_text"]["data_type"] == "text"
+    else:
+        assert doc_columns["value"]["data_type"] == "text"
+    files_tables = [
+        ParsedLoadJobFileName.parse(file).table_name
+        for file in raw_normalize.load_storage.list_new_jobs(load_id)
+    ]
+    assert sorted(files_tables) == ["doc", "doc", "other", "other__nested"]
+
+
+def test_parallel_schema_conflict_retry_all(raw_normalize: Normalize, mocker) -> None:
+    schema = Schema("conflict")
+    # data is extracted directly into a child table so the extracted file is not named after
+    # the root table of the chain
+    schema.update_table(new_table("doc"))
+    schema.update_table(new_table("doc_child", parent_table_name="doc"))
+    extractor = ExtractStorage(raw_normalize.normalize_storage.config)
+    load_id = extractor.create_load_package(schema)
+    item_storage = extractor.item_storages["object"]
+    item_storage.write_data_item(load_id, schema.name, "doc_child", [{"value": 1}] * 10, None)
+    extractor.close_writers(load_id)
+    extractor.commit_new_load_package(load_id, schema)
+
+    update_or_collect = raw_normalize.update_table_or_collect_conflicts
+    conflicts = [{"doc"}]
+
+    def _conflict_once(schema_, schema_updates):
+        applied_updates, _ = update_or_collect(schema_, schema_updates)
+        return applied_updates, conflicts.pop() if conflicts else set()
+
+    mocker.patch.object(raw_normalize, "update_table_or_collect_conflicts", _conflict_once)
+    with ThreadPoolExecutor(max_workers=1) as pool:
+        raw_normalize.run(pool)
+    step_info = raw_normalize.get_step_info(MockPipeline("conflict_pipeline", True))  # type: ignore[abstract]
+    # the whole task was retried, no rows are lost
+    assert step_info.row_counts == {"doc_child": 10}
+    files_tables = [
+        ParsedLoadJobFileName.parse(file).table_name
+        for file in raw_normalize.load_storage.list_new_jobs(load_id)
+    ]
+    assert files_tables == ["doc_child"]
+
+
+def test_parallel_schema_conflict_retry_child_table(raw_normalize: Normalize, mocker) -> None:
+    schema = Schema("conflict")
+    schema.update_table(new_table("doc"))
+    schema.update_table(new_table("doc_child", parent_table_name="doc"))
+    schema.update_table(new_table("other"))
+    extractor = ExtractStorage(raw_normalize.normalize_storage.config)
+    load_id = extractor.create_load_package(schema)
+    item_storage = extractor.item_storages["object"]
+    item_storage.write_data_item(load_id, schema.name, "doc_child", [{"value": 1}] * 10, None)
+    item_storage.write_data_item(load_id, schema.name, "other", [{"value": 1}] * 5, None)
+    extractor.close_writers(load_id)
+    extractor.commit_new_load_package(load_id, schema)
+
+    update_or_collect = raw_normalize.update_table_or_collect_conflicts
+    conflicts = [{"doc"}]
+
+    def _conflict_once(schema_, schema_updates):
+        applied_updates, _ = update_or_collect(schema_, schema_updates)
+        return applied_updates, conflicts.pop() if conflicts else set()
+
+    mocker.patch.object(raw_normalize, "update_table_or_collect_conflicts", _conflict_once)
+    # normalize both files in a single task
+    mocker.patch.object(
+        raw_normalize, "group_worker_files", lambda files, file_sizes, no_workers: [files]
+    )
+    w_normalize_files = mocker.spy(Normalize, "w_normalize_files")
+    with ThreadPoolExecutor(max_workers=1) as pool:
+        raw_normalize.run(pool)
+    # only the file of the child table in the conflicting chain is retried
+    normalized_tables = sorted(
+        ParsedLoadJobFileName.parse(file).table_name
+        for call in w_normalize_files.call_args_list
+        for file in call.args[5]
+    )
+    assert normalized_tables == ["doc_child", "doc_child", "other"]
+    step_info = raw_normalize.get_step_info(MockPipeline("conflict_pipeline", True))  # type: ignore[abstract]
+    assert step_info.row_counts == {"doc_child": 10, "other": 5}
+    files_tables = sorted(
+        ParsedLoadJobFileName.parse(file).table_name
+        for file in raw_normalize.load_storage.list_new_jobs(load_id)
+    )
+    assert files_tables == ["doc_child", "other"]
+
+
 def test_group_worker_files() -> None:
     files = ["f%03d" % idx for idx in range(0, 100)]
 
-    assert Normalize.group_worker_files([], 4) == []
-    assert Normalize.group_worker_files(["f001"], 1) == [["f001"]]
-    assert Normalize.group_worker_files(["f001"], 100) == [["f001"]]
-    assert Normalize.group_worker_files(files[:4], 4) == [["f000"], ["f001"], ["f002"], ["f003"]]
-    assert Normalize.group_worker_files(files[:5], 4) == [
+    assert Normalize.group_worker_files([], [], 4) == []
+    assert Normalize.group_worker_files(["f001"], [10], 1) == [["f001"]]
+    assert Normalize.group_worker_files(["f001"], [10], 100) == [["f001"]]
+    # equal sizes, one file per task
+    assert Normalize.group_worker_files(files[:4], [10] * 4, 4, 1) == [
         ["f000"],
         ["f001"],
         ["f002"],
-        ["f003", "f004"],
+        ["f003"],
     ]
-    assert Normalize.group_worker_files(files[:8], 4) == [
+    # more tasks than workers so idle workers can pick up work
+    assert len(Normalize.group_worker_files(files[:16], [10] * 16, 2)) == 4
+    # large file gets its own task and is scheduled first
+    assert Normalize.group_worker_files(files[:5], [1, 1, 100, 1, 1], 2, 1) == [
+        ["f002"],
         ["f000", "f001"],
-        ["f002", "f003"],
-        ["f004", "f005"],
-        ["f006", "f007"],
+        ["f003", "f004"],
     ]
-    assert Normalize.group_worker_files(files[:8], 3) == [
-        ["f000", "f001"],
-        ["f002", "f003", "f006"],
-        ["f004", "f005", "f007"],
+
+    # files of the same table are kept together
+    files = ["a.1", "b.1", "b.2", "c.1"]
+    assert Normalize.group_worker_files(files, [10, 10, 10, 10], 2, 1) == [
+        ["b.1", "b.2"],
+        ["a.1"],
+        ["c.1"],
     ]
-    assert Normalize.group_worker_files(files[:5], 3) == [
-        ["f000"],
-        ["f001", "f003"],
-        ["f002", "f004"],
+    # table that fits into the task size is not split
+    files = ["a.1", "a.2", "a.3", "b.1"]
+    assert Normalize.group_worker_files(files, [10, 10, 10, 30], 1, 2) == [
+        ["a.1", "a.2", "a.3"],
+        ["b.1"],
     ]
-
-    # check if sorted
+    # table larger than the task size is split
     files = ["tab1.1", "chd.3", "tab1.2", "chd.4", "tab1.3"]
-    assert Normalize.group_worker_files(files, 3) == [
-        ["chd.3"],
-        ["chd.4", "tab1.2"],
-        ["tab1.1", "tab1.3"],
+    assert Normalize.group_worker_files(files, [10] * 5, 1, 2) == [
+        ["chd.3", "chd.4"],
+        ["tab1.1", "tab1.2"],
+        ["tab1.3"],
     ]
 
 
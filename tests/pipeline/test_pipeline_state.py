@@ -12,9 +12,11 @@ from dlt.common.schema import Schema
 from dlt.common.source import get_current_pipe_name
 from dlt.common.storages import FileStorage
 from dlt.common import pipeline as state_module
-from dlt.common.utils import uniq_id
+from dlt.common.typing import DictStrAny
+from dlt.common.utils import digest128, uniq_id
 from dlt.common.destination.reference import Destination
 
+from dlt.extract.incremental.transform import unpack_unique_hashes
 from dlt.pipeline.exceptions import PipelineStateEngineNoUpgradePathException, PipelineStepFailed
 from dlt.pipeline.pipeline import Pipeline
 from dlt.pipeline.state_sync import (
@@ -126,6 +128,27 @@ def test_managed_state() -> None:
     assert sources_state[p.default_schema_name]["gen"] is True
 
 
+def test_unchanged_state_not_saved() -> None:
+    p = dlt.pipeline(pipeline_name="unchanged_state_pipeline")
+    p.extract(some_data())
+    state_path = p._pipeline_storage.make_full_path(Pipeline.STATE_FILE)
+    os.utime(state_path, ns=(0, 0))
+    # state is read but not modified
+    with p.managed_state():
+        pass
+    assert os.stat(state_path).st_mtime_ns == 0
+    # local state is saved
+    p.set_local_state_val("local_value", 1)
+    assert os.stat(state_path).st_mtime_ns != 0
+    os.utime(state_path, ns=(0, 0))
+    # modified state is saved
+    with p.managed_state() as state:
+        state["sources"]["modified"] = {"last_value": 100}
+    assert os.stat(state_path).st_mtime_ns != 0
+    assert p.state["sources"]["modified"]["last_value"] == 100
+    assert p.get_local_state_val("local_value") == 1
+
+
 def test_no_active_pipeline_required_for_resource() -> None:
     # resource can be iterated without pipeline context
     for _ in some_data():
@@ -562,3 +585,33 @@ def test_migrate_pipeline_state(test_storage: FileStorage) -> None:
     assert "destination_type" not in state_v3
     assert "staging_name" not in state_v3
     assert "staging_type" not in state_v3
+
+    # many incremental unique hashes are packed into a single string in v5
+    many_hashes = [digest128(str(i)) for i in range(200)]
+    state_v4: DictStrAny = {
+        "sources": {
+            "source": {
+                "resources": {
+                    "many": {
+                        "incremental": {"ts": {"last_value": 1, "unique_hashes": many_hashes}}
+                    },
+                    "few": {"incremental": {"ts": {"last_value": 1, "unique_hashes": ["a", "b"]}}},
+                    "no_incremental": {"last_value": 1},
+                }
+            }
+        },
+        "_state_engine_version": 4,
+    }
+    migrate_pipeline_state(
+        "test_pipeline", state_v4, state_v4["_state_engine_version"], PIPELINE_STATE_ENGINE_VERSION
+    )
+    resources_state = state_v4["sources"]["source"]["resources"]
+    unique_hashes = resources_state["many"]["incremental"]["ts"]["unique_hashes"]
+    assert isinstance(unique_hashes, str)
+    assert unpack_unique_hashes(unique_hashes) == set(many_hashes)
+    assert resources_state["few"]["incremental"]["ts"]["unique_hashes"] == ["a", "b"]
+    assert resources_state["no_incremental"] == {"last_value": 1}
+
+    # packed hashes cannot be read by older engines
+    with pytest.raises(PipelineStateEngineNoUpgradePathException):
+        migrate_pipeline_state("test_pipeline", state_v4, 5, 4)
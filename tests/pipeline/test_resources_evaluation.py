@@ -1,4 +1,4 @@
-from typing import Any, List
+from typing import Any, Awaitable, List
 import time
 import threading
 import random
@@ -124,6 +124,67 @@ def test_async_generator_transformer() -> None:
             assert {r[0] for r in rows} == {"at", "bt", "ct"}
 
 
+def test_async_generator_prefetched_batches() -> None:
+    from dlt.extract.utils import wrap_async_iterator
+
+    async def async_gen():
+        for idx in range(100):
+            if idx % 10 == 0:
+                await asyncio.sleep(0.01)
+            yield {"idx": idx}
+
+    # items prefetched by the event loop are taken in batches, only the first item
+    # of a batch is returned by the awaitable, the rest is yielded by the wrapper
+    async def _consume():
+        items = []
+        awaited = 0
+        for item in wrap_async_iterator(async_gen()):
+            if item is None:
+                continue
+            if not isinstance(item, Awaitable):
+                items.append(item)
+                continue
+            try:
+                items.append(await item)
+                awaited += 1
+            except StopAsyncIteration:
+                break
+        return items, awaited
+
+    items, awaited = asyncio.run(_consume())
+    assert items == [{"idx": idx} for idx in range(100)]
+    assert awaited < 100
+
+    # each item is still passed to transformers separately and in order
+    @dlt.transformer(data_from=dlt.resource(async_gen, name="async_items"))
+    def double(item):
+        assert isinstance(item, dict)
+        yield {"idx": item["idx"] * 2}
+
+    assert list(double()) == [{"idx": idx * 2} for idx in range(100)]
+
+
+def test_async_generator_prefetched_order_round_robin() -> None:
+    async def async_items():
+        # prefetched in batches limited by the prefetch queue size
+        for idx in range(300):
+            yield idx
+
+    def sync_items():
+        for idx in range(1000, 1100):
+            yield idx
+
+    @dlt.source
+    def source():
+        return [dlt.resource(async_items), dlt.resource(sync_items)]
+
+    # prefetched items are not added as separate sources so each resource keeps its order
+    os.environ["EXTRACT__NEXT_ITEM_MODE"] = "round_robin"
+    items = list(source())
+    assert [i for i in items if i < 1000] == list(range(300))
+    assert [i for i in items if i >= 1000] == list(range(1000, 1100))
+
+
 @pytest.mark.parametrize("next_item_mode", ["fifo", "round_robin"])
 @pytest.mark.parametrize(
     "resource_mode", ["both_sync", "both_async", "first_async", "second_async"]
@@ -267,6 +328,35 @@ def test_parallelized_resource(parallelized: bool) -> None:
         assert threads == {threading.get_ident()}  # Everything runs in main thread
 
 
+def test_parallelize_generators() -> None:
+    os.environ["EXTRACT__PARALLELIZE_GENERATORS"] = "true"
+    threads = set()
+
+    def some_data(name: str):
+        for l_ in ["a", "b", "c"]:
+            time.sleep(0.01)
+            threads.add(threading.get_ident())
+            yield {"letter": l_, "name": name}
+
+    @dlt.source
+    def source():
+        return [
+            dlt.resource(some_data, name="resource1")("one"),
+            # already parallelized resources are not wrapped again
+            dlt.resource(some_data, name="resource2", parallelized=True)("two"),
+            # lists are not evaluated in the pool
+            dlt.resource([{"letter": "d"}], name="resource3"),
+        ]
+
+    pipeline_1 = dlt.pipeline("pipeline_1", destination="duckdb", full_refresh=True)
+    pipeline_1.extract(source())
+    row_counts = pipeline_1.normalize().row_counts
+    assert row_counts["resource1"] == row_counts["resource2"] == 3
+    assert row_counts["resource3"] == 1
+    # nothing runs in main thread
+    assert len(threads) > 1 and threading.get_ident() not in threads
+
+
 # Parametrize with different resource counts to excersize the worker pool:
 # 1. More than number of workers
 # 2. 1 resource only
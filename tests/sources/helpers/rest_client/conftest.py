@@ -147,6 +147,13 @@ def mock_api_server():
         def posts_relative_next_url(request, context):
             return paginate_response(request, generate_posts(), use_absolute_url=False)
 
+        @router.get(r"/posts_offset(\?.*)?$")
+        def posts_offset(request, context):
+            records = generate_posts()
+            offset = int(request.qs.get("offset", [0])[0])
+            limit = int(request.qs.get("limit", [10])[0])
+            return {"data": records[offset : offset + limit], "total": len(records)}
+
         @router.get(r"/posts/(\d+)/comments")
         def post_comments(request, context):
             post_id = int(request.url.split("/")[-2])
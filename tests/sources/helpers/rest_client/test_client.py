@@ -2,10 +2,10 @@ import os
 import pytest
 from typing import Any, cast
 from dlt.common.typing import TSecretStrValue
-from dlt.sources.helpers.requests import Response, Request
+from dlt.sources.helpers.requests import Client, Response, Request
 from dlt.sources.helpers.rest_client import RESTClient
 from dlt.sources.helpers.rest_client.client import Hooks
-from dlt.sources.helpers.rest_client.paginators import JSONResponsePaginator
+from dlt.sources.helpers.rest_client.paginators import JSONResponsePaginator, OffsetPaginator
 
 from dlt.sources.helpers.rest_client.auth import AuthConfigBase
 from dlt.sources.helpers.rest_client.auth import (
@@ -53,6 +53,80 @@ class TestRESTClient:
 
         assert_pagination(pages)
 
+    @pytest.mark.parametrize("concurrent_pages", [1, 4])
+    def test_offset_pagination_concurrent_pages(
+        self, rest_client: RESTClient, concurrent_pages: int
+    ) -> None:
+        pages = list(
+            rest_client.paginate(
+                "/posts_offset",
+                paginator=OffsetPaginator(initial_limit=10),
+                concurrent_pages=concurrent_pages,
+                min_request_interval=0.001,
+            )
+        )
+
+        assert_pagination(pages)
+        assert not pages[-1].paginator.has_next_page
+
+    def test_concurrent_pages_thread_sessions(self, rest_client: RESTClient, mocker) -> None:
+        send_request = mocker.spy(rest_client, "_send_request")
+        pages = list(
+            rest_client.paginate(
+                "/posts_offset", paginator=OffsetPaginator(initial_limit=10), concurrent_pages=4
+            )
+        )
+        assert_pagination(pages)
+
+        # first page is requested with the client session, the others with thread sessions
+        sessions = [call.kwargs.get("session") for call in send_request.call_args_list]
+        assert sessions[0] is None
+        assert all(session is not None for session in sessions[1:])
+        assert rest_client.session not in sessions[1:]
+
+        # session passed by the user is shared
+        session = Client(raise_for_status=False).session
+        user_client = RESTClient(base_url="https://api.example.com", session=session)
+        send_request = mocker.spy(user_client, "_send_request")
+        pages = list(
+            user_client.paginate(
+                "/posts_offset", paginator=OffsetPaginator(initial_limit=10), concurrent_pages=4
+            )
+        )
+        assert_pagination(pages)
+        assert all(
+            call.kwargs.get("session") is session for call in send_request.call_args_list[1:]
+        )
+
+    def test_stream_pages(self, rest_client: RESTClient) -> None:
+        pages = list(
+            rest_client.paginate(
+                "/posts",
+                paginator=JSONResponsePaginator(next_url_path="next_page"),
+                data_selector="data",
+                stream_batch_size=3,
+            )
+        )
+
+        # each response is yielded in batches
+        assert [len(page) for page in pages] == [3, 3, 3, 1] * 10
+        assert [record for page in pages for record in page] == [
+            {"id": i, "title": f"Post {i}"} for i in range(100)
+        ]
+        # paginator reads the rest of the document
+        assert not pages[-1].paginator.has_next_page
+        assert pages[-1].response.json()["data"] == []
+
+    def test_stream_pages_detect_paginator(self, rest_client: RESTClient) -> None:
+        pages = list(rest_client.paginate("/posts", data_selector="data", stream_batch_size=3))
+
+        # first response is not streamed as paginator is detected from it
+        assert [len(page) for page in pages] == [10] + [3, 3, 3, 1] * 9
+        assert all(page.paginator is not None for page in pages)
+        assert [record for page in pages for record in page] == [
+            {"id": i, "title": f"Post {i}"} for i in range(100)
+        ]
+
     def test_page_context(self, rest_client: RESTClient) -> None:
         for page in rest_client.paginate(
             "/posts",
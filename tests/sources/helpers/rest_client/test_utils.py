@@ -1,5 +1,8 @@
 import pytest
-from dlt.sources.helpers.rest_client.utils import join_url
+from typing import Any, Dict, List
+
+from dlt.common import json
+from dlt.sources.helpers.rest_client.utils import iter_json_array, join_url, simple_json_path
 
 
 @pytest.mark.parametrize(
@@ -88,3 +91,37 @@ def test_join_url(base_url, path, expected):
 def test_join_url_invalid_input_types(base_url, path, exception):
     with pytest.raises(exception):
         join_url(base_url, path)
+
+
+@pytest.mark.parametrize("chunk_size", [1, 7, 1024])
+def test_iter_json_array(chunk_size: int) -> None:
+    records = [{"id": i, "text": 'quoted ",]} \\' * i, "tags": [i, {"k": None}]} for i in range(20)]
+    doc: Dict[str, Any] = {
+        "meta": {"list": [1, {"a": "[{"}]},
+        "data": {"items": records},
+        "total": 20,
+    }
+    text = json.dumps(doc)
+    chunks = [text[i : i + chunk_size] for i in range(0, len(text), chunk_size)]
+
+    skeleton: List[str] = []
+    assert list(iter_json_array(chunks, ["data", "items"], skeleton)) == records
+    # document without streamed records
+    doc["data"]["items"] = []
+    assert json.loads("".join(skeleton)) == doc
+
+    # top level array
+    skeleton = []
+    assert list(iter_json_array(["[1, 2", ", 3]"], [], skeleton)) == [1, 2, 3]
+    assert "".join(skeleton) == "[]"
+
+    with pytest.raises(ValueError):
+        list(iter_json_array(['{"data": [1, 2'], ["data"], []))
+
+
+def test_simple_json_path() -> None:
+    assert simple_json_path("data") == ["data"]
+    assert simple_json_path("$.data.items") == ["data", "items"]
+    assert simple_json_path("$") == []
+    assert simple_json_path("data[*]") is None
+    assert simple_json_path("$..items") is None